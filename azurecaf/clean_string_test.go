@@ -0,0 +1,112 @@
+package azurecaf
+
+import (
+	"regexp"
+	"testing"
+)
+
+// cleanStringSamples covers ASCII punctuation, control characters, multi-byte runes and invalid UTF-8
+var cleanStringSamples = []string{
+	"",
+	"my_invalid-Name.01",
+	"pr1 (test) [x] {y} <z>",
+	"a\tb\nc\r\x00\x7f",
+	"~!@#$%^&*()_+`-=[]\\{}|;':\",./<>?",
+	"café-日本-😀",
+	"İstanbul Straße",
+	"\xff\xfeabc\xc3",
+	"abc\xe6\x97",
+}
+
+func TestByteTablesMatchRegexp(t *testing.T) {
+	tables := 0
+	for i := range regexpTable {
+		entry := &regexpTable[i]
+		if entry.keep == nil {
+			continue
+		}
+		tables++
+		re := regexp.MustCompile(entry.pattern)
+		for b := 0; b < 256; b++ {
+			s := string([]byte{byte(b)})
+			if got, want := entry.keep.filter(s), re.ReplaceAllString(s, ""); got != want {
+				t.Errorf("%s: byte table gives %q, regexp gives %q for byte 0x%02x", entry.pattern, got, want, b)
+			}
+		}
+		for _, s := range cleanStringSamples {
+			if got, want := entry.keep.filter(s), re.ReplaceAllString(s, ""); got != want {
+				t.Errorf("%s: byte table gives %q, regexp gives %q for %q", entry.pattern, got, want, s)
+			}
+		}
+	}
+	if tables == 0 {
+		t.Fatal("expected byte tables for the cleaning regexes that are simple character classes")
+	}
+}
+
+func TestCleanStringByteTable(t *testing.T) {
+	resource := ResourceDefinitions["azurerm_storage_account"]
+	if resource.cleanTable() == nil {
+		t.Fatalf("expected a byte table for %s", resource.RegEx)
+	}
+	if result := cleanString("my_Storage-01", &resource); result != "mytorage01" {
+		t.Errorf("Expected mytorage01 but received %s", result)
+	}
+	names := cleanSlice([]string{"pr-1", "dév"}, &resource)
+	if names[0] != "pr1" || names[1] != "dv" {
+		t.Errorf("Expected [pr1 dv] but received %v", names)
+	}
+}
+
+func TestCleanStringRegexpFallback(t *testing.T) {
+	resource := ResourceDefinitions["azurerm_search_service"]
+	if resource.cleanTable() != nil {
+		t.Fatalf("expected %s to need the regexp engine", resource.RegEx)
+	}
+	if result := cleanString("my--search", &resource); result != "" {
+		t.Errorf("Expected an empty string but received %s", result)
+	}
+
+	// Patterns outside the generated table have no byte table either
+	legacy := Resources["st"]
+	if legacy.cleanTable() != nil {
+		t.Error("expected no byte table for a Resources entry")
+	}
+	if result := cleanString("my_st-01", &legacy); result != "myst01" {
+		t.Errorf("Expected myst01 but received %s", result)
+	}
+}
+
+var filterSink string
+
+func TestByteTableFilterAllocations(t *testing.T) {
+	resource := ResourceDefinitions["azurerm_storage_account"]
+	keep := resource.cleanTable()
+	if allocs := testing.AllocsPerRun(100, func() { filterSink = keep.filter("alreadyclean01") }); allocs != 0 {
+		t.Errorf("expected no allocation for a clean name, got %v", allocs)
+	}
+	if allocs := testing.AllocsPerRun(100, func() { filterSink = keep.filter("needs_cleaning-01") }); allocs > 1 {
+		t.Errorf("expected at most one allocation, got %v", allocs)
+	}
+}
+
+func FuzzCleanStringByteTable(f *testing.F) {
+	for _, s := range cleanStringSamples {
+		f.Add(s)
+	}
+	f.Fuzz(func(t *testing.T, s string) {
+		for i := range regexpTable {
+			entry := &regexpTable[i]
+			if entry.keep == nil {
+				continue
+			}
+			re, err := entry.compile()
+			if err != nil {
+				t.Fatal(err)
+			}
+			if got, want := entry.keep.filter(s), re.ReplaceAllString(s, ""); got != want {
+				t.Errorf("%s: byte table gives %q, regexp gives %q for %q", entry.pattern, got, want, s)
+			}
+		}
+	})
+}
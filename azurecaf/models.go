@@ -7,6 +7,9 @@ package azurecaf
 
 import (
 	"math/rand"
+	"regexp"
+	"strings"
+	"sync"
 	"time"
 )
 
@@ -88,10 +91,101 @@ type ResourceStructure struct {
 	Scope string `json:"scope,omitempty"`
 }
 
+// lazyRegexp is a regular expression compiled the first time it is used and shared afterwards
+type lazyRegexp struct {
+	pattern string
+	// keep is the byte table of a cleaning regex that is a simple character class, nil otherwise
+	keep *byteTable
+	once sync.Once
+	re   *regexp.Regexp
+	err  error
+}
+
+func (l *lazyRegexp) compile() (*regexp.Regexp, error) {
+	l.once.Do(func() {
+		l.re, l.err = regexp.Compile(l.pattern)
+	})
+	return l.re, l.err
+}
+
+// byteTable marks the bytes a cleaning regex keeps. The generator only emits one for
+// a regex that is a single character class treating every non-ASCII rune alike, for
+// which removing bytes gives the same result as ReplaceAllString(s, "").
+type byteTable [256]bool
+
+// filter removes the bytes the table does not keep. It does not allocate when
+// every byte is kept, and allocates the result once otherwise.
+func (keep *byteTable) filter(s string) string {
+	i := 0
+	for i < len(s) && keep[s[i]] {
+		i++
+	}
+	if i == len(s) {
+		return s
+	}
+	var b strings.Builder
+	b.Grow(len(s) - 1)
+	b.WriteString(s[:i])
+	for i++; i < len(s); i++ {
+		if keep[s[i]] {
+			b.WriteByte(s[i])
+		}
+	}
+	return b.String()
+}
+
+// resourcePatterns points a resource type at its cleaning and validation regexes in regexpTable
+type resourcePatterns struct {
+	cleaner   *lazyRegexp
+	validator *lazyRegexp
+}
+
+// otherRegexps caches the compiled patterns that are not in regexpTable,
+// such as those of the Resources map used by azurecaf_naming_convention
+var otherRegexps sync.Map
+
+func compiledRegexp(pattern string) (*regexp.Regexp, error) {
+	entry, found := otherRegexps.Load(pattern)
+	if !found {
+		entry, _ = otherRegexps.LoadOrStore(pattern, &lazyRegexp{pattern: pattern})
+	}
+	return entry.(*lazyRegexp).compile()
+}
+
+// cleanRegexp returns the compiled RegEx of the resource, compiling it at most once per pattern
+func (r *ResourceStructure) cleanRegexp() (*regexp.Regexp, error) {
+	if patterns, ok := resourceRegexps[r.ResourceTypeName]; ok && patterns.cleaner.pattern == r.RegEx {
+		return patterns.cleaner.compile()
+	}
+	return compiledRegexp(r.RegEx)
+}
+
+// cleanTable returns the byte table of the RegEx of the resource, or nil when it needs the regexp engine
+func (r *ResourceStructure) cleanTable() *byteTable {
+	if patterns, ok := resourceRegexps[r.ResourceTypeName]; ok && patterns.cleaner.pattern == r.RegEx {
+		return patterns.cleaner.keep
+	}
+	return nil
+}
+
+// validationRegexp returns the compiled ValidationRegExp of the resource, compiling it at most once per pattern
+func (r *ResourceStructure) validationRegexp() (*regexp.Regexp, error) {
+	if patterns, ok := resourceRegexps[r.ResourceTypeName]; ok && patterns.validator.pattern == r.ValidationRegExp {
+		return patterns.validator.compile()
+	}
+	return compiledRegexp(r.ValidationRegExp)
+}
+
 var (
 	alphagenerator = []rune("abcdefghijklmnopqrstuvwxyz")
 )
 
+// randPool holds the generators randSeq reseeds on each call, so that concurrent
+// calls neither share a source nor contend on the lock of the global one
+var randPool = sync.Pool{
+	New: func() interface{} { return rand.New(rand.NewSource(1)) },
+}
+
 // Generate a random value to add to the resource names
 func randSeq(length int, seed *int64) string {
 	// Handle invalid input: negative or zero length
@@ -103,12 +197,14 @@ func randSeq(length int, seed *int64) string {
 		value := time.Now().UnixNano()
 		seed = &value
 	}
-	rand.Seed(*seed)
+	generator := randPool.Get().(*rand.Rand)
+	defer randPool.Put(generator)
+	generator.Seed(*seed)
 	// generate at least one random character
 	b := make([]rune, length)
 	for i := range b {
 		// We need the random generated string to start with a letter
-		b[i] = alphagenerator[rand.Intn(len(alphagenerator)-1)]
+		b[i] = alphagenerator[generator.Intn(len(alphagenerator)-1)]
 	}
 	return string(b)
 }
@@ -2379,3 +2379,2225 @@ var ResourceMaps = map[string]string{
 	"wwapp":              "azurerm_windows_web_app",
 	"zone":               "azurerm_dns_zone",
 }
+
+// regexpTable holds the distinct cleaning and validation regexes of ResourceDefinitions, each compiled on first use
+var regexpTable = [...]lazyRegexp{
+	{pattern: "[&%.?\\/]", keep: &byteTables[0]},
+	{pattern: "[<>*%&:\\?+/#@{}]", keep: &byteTables[1]},
+	{pattern: "[<>*%&:\\?.+/#]", keep: &byteTables[2]},
+	{pattern: "[<>*%&:\\?/#{}]", keep: &byteTables[3]},
+	{pattern: "[<>*%:.?\\+\\/ ]", keep: &byteTables[4]},
+	{pattern: "[<>*%:.?\\+\\/]", keep: &byteTables[5]},
+	{pattern: `[<>*%:?\\+\\/]`, keep: &byteTables[6]},
+	{pattern: "[\\/\"\\[\\]:|<>+=;,?*@&_]", keep: &byteTables[7]},
+	{pattern: "[\\s\\/$#&]", keep: &byteTables[8]},
+	{pattern: `[^-\w\._\(\)]`, keep: &byteTables[9]},
+	{pattern: "[^0-9A-Za-z _.-]", keep: &byteTables[10]},
+	{pattern: "[^0-9A-Za-z- .]", keep: &byteTables[11]},
+	{pattern: "[^0-9A-Za-z- ]", keep: &byteTables[12]},
+	{pattern: "[^0-9A-Za-z-._()]", keep: &byteTables[13]},
+	{pattern: "[^0-9A-Za-z-._\\(\\)]", keep: &byteTables[14]},
+	{pattern: "[^0-9A-Za-z-._]", keep: &byteTables[15]},
+	{pattern: "[^0-9A-Za-z-]", keep: &byteTables[16]},
+	{pattern: "[^0-9A-Za-z-_]", keep: &byteTables[17]},
+	{pattern: "[^0-9A-Za-z<>*%:&?#\\+\\/]", keep: &byteTables[18]},
+	{pattern: "[^0-9A-Za-z<>*%:.?\\+\\/]", keep: &byteTables[19]},
+	{pattern: "[^0-9A-Za-z\\(\\-\\)\\_\\.]", keep: &byteTables[20]},
+	{pattern: "[^0-9A-Za-z\\-\\_\\.]", keep: &byteTables[21]},
+	{pattern: "[^0-9A-Za-z]", keep: &byteTables[22]},
+	{pattern: "[^0-9A-Za-z_-]", keep: &byteTables[23]},
+	{pattern: "[^0-9A-Za-z_.-]", keep: &byteTables[24]},
+	{pattern: "[^0-9A-Za-z_.]", keep: &byteTables[25]},
+	{pattern: "[^0-9A-Za-z_]", keep: &byteTables[26]},
+	{pattern: "[^0-9A-Za-z_`,.\\[\\]]", keep: &byteTables[27]},
+	{pattern: "[^0-9a-z-]", keep: &byteTables[28]},
+	{pattern: "[^0-9a-zA-Z-_]", keep: &byteTables[29]},
+	{pattern: "[^0-9a-zA-Z]", keep: &byteTables[30]},
+	{pattern: "[^0-9a-z]", keep: &byteTables[31]},
+	{pattern: "[^0-9a-z_-]", keep: &byteTables[32]},
+	{pattern: "[^a-z0-9-]", keep: &byteTables[33]},
+	{pattern: `[^a-zA-Z0-9-._\\(\\)]`, keep: &byteTables[34]},
+	{pattern: "[^a-zA-Z0-9-]", keep: &byteTables[35]},
+	{pattern: "[^a-zA-Z0-9-_]", keep: &byteTables[36]},
+	{pattern: "[^a-zA-Z0-9._-]", keep: &byteTables[37]},
+	{pattern: "[^a-zA-Z0-9\\-\\._]", keep: &byteTables[38]},
+	{pattern: "[^a-zA-Z0-9]", keep: &byteTables[39]},
+	{pattern: "[^a-zA-Z0-9_-]", keep: &byteTables[40]},
+	{pattern: "[^a-z]", keep: &byteTables[41]},
+	{pattern: `[^~!@$^*()\[\]\{\}_\-="';,0-9A-Za-z _.-]`, keep: &byteTables[42]},
+	{pattern: "[a-z0-9-]*--[a-z0-9-]*$"},
+	{pattern: "^([^<>*%&:\\?.+/#\\s]?[ ]?){0,127}[^<>*%&:\\?.+/#\\s]$"},
+	{pattern: "^[0-9A-Za-z-._()]{0,254}[0-9A-Za-z-_()]$"},
+	{pattern: "^[0-9A-Za-z-]{1,40}$"},
+	{pattern: "^[0-9A-Za-z-]{2,36}$"},
+	{pattern: "^[0-9A-Za-z\\(\\-\\)\\_\\.]{1,80}$"},
+	{pattern: "^[0-9A-Za-z\\-\\_\\.]{1,80}$"},
+	{pattern: "^[0-9A-Za-z][0-9A-Za-z-]{0,57}[0-9a-zA-Z]$"},
+	{pattern: "^[0-9A-Za-z][0-9A-Za-z-]{0,58}[0-9a-zA-Z]$"},
+	{pattern: "^[0-9A-Za-z_-]{1,260}$"},
+	{pattern: "^[0-9a-zA-Z][0-9a-zA-Z-_]{2,127}$"},
+	{pattern: "^[0-9a-zA-Z]{1,15}$"},
+	{pattern: "^[0-9a-z]([0-9a-z-]{0,61}[0-9a-z])?$"},
+	{pattern: "^[0-9a-z]{1,45}$"},
+	{pattern: "^[^%&\\?/. ][^%&\\?/]{0,258}[^%&\\?/. ]$"},
+	{pattern: "^[^%]{0,63}[^ %.]$"},
+	{pattern: "^[^&%?\\/]{2,63}[^&%.?\\/ ]$"},
+	{pattern: "^[^<>*%&:\\?+/#@{}]{0,250}[^<>*%&:\\?+/#@{}. ]$"},
+	{pattern: "^[^<>*%&:\\?/#{}]{0,259}[^<>*%&:\\?/#{}. ]$"},
+	{pattern: "^[^<>*%:&?#\\+\\/]{0,259}[^<>*%:&.?#\\+\\/]$"},
+	{pattern: "^[^<>*%:.?\\+\\/]{0,127}[^<>*%:.?\\+\\/ ]$"},
+	{pattern: "^[^<>*%:.?\\+\\/]{0,259}[^<>*%:.?\\+\\/ ]$"},
+	{pattern: "^[^<>*%:.?\\+\\/]{1,127}[^<>*%:.?\\+\\/ ]$"},
+	{pattern: "^[^<>*%:?\\+\\/]{1,127}[^<>*%:.?\\+\\/]$"},
+	{pattern: "^[^\\/\"\\[\\]:|<>+=;,?*@&_][^\\/\"\\[\\]:|<>+=;,?*@&]{0,13}[^\\/\"\\[\\]:|<>+=;,?*@&.-]$"},
+	{pattern: "^[^\\/\"\\[\\]:|<>+=;,?*@&_][^\\/\"\\[\\]:|<>+=;,?*@&]{0,62}[^\\/\"\\[\\]:|<>+=;,?*@&.-]$"},
+	{pattern: "^[^\\/\"\\[\\]:|<>+=;,?*@&_][^\\/\"\\[\\]:|<>+=;,?*@&]{0,7}[^\\/\"\\[\\]:|<>+=;,?*@&.-]$"},
+	{pattern: "^[^\\s\\/$#&]{1,1000}[^\\s\\/$#&]{0,24}$"},
+	{pattern: "^[^|:<>+#%&\\?/]{0,259}[^|:<>+#%&\\?/. ]$"},
+	{pattern: "^[a-z0-9-_]{3,50}$"},
+	{pattern: "^[a-z0-9](?:[a-z0-9-]{0,58}[a-z0-9])?$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{0,30}[a-z0-9]$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{0,42}[a-z0-9]$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{0,61}[a-z0-9]$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{1,22}[a-z0-9]$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{1,61}[a-z0-9]$"},
+	{pattern: "^[a-z0-9][a-z0-9-]{2,62}$"},
+	{pattern: "^[a-z0-9][a-z0-9]{2,62}$"},
+	{pattern: "^[a-z0-9][a-zA-Z0-9-]{1,61}[a-z0-9]$"},
+	{pattern: "^[a-z0-9]{1,45}$"},
+	{pattern: "^[a-z0-9]{3,24}$"},
+	{pattern: "^[a-zA-Z0-9 ][a-zA-Z0-9-._ ]{0,258}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9- .]{1,260}$"},
+	{pattern: "^[a-zA-Z0-9- .]{1,40}$"},
+	{pattern: "^[a-zA-Z0-9-._\\(\\)]{0,89}[a-zA-Z0-9-_\\(\\)]$"},
+	{pattern: "^[a-zA-Z0-9-._\\(\\)]{1,64}$"},
+	{pattern: "^[a-zA-Z0-9-._]{1,32}$"},
+	{pattern: "^[a-zA-Z0-9-._]{1,50}$"},
+	{pattern: "^[a-zA-Z0-9-._]{1,64}$"},
+	{pattern: "^[a-zA-Z0-9-]{1,127}$"},
+	{pattern: "^[a-zA-Z0-9-]{1,15}$"},
+	{pattern: "^[a-zA-Z0-9-]{1,24}$"},
+	{pattern: "^[a-zA-Z0-9-]{1,40}$"},
+	{pattern: "^[a-zA-Z0-9-]{1,63}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9-]{1,64}$"},
+	{pattern: "^[a-zA-Z0-9-]{3,160}$"},
+	{pattern: "^[a-zA-Z0-9-]{3,50}$"},
+	{pattern: "^[a-zA-Z0-9-]{3,64}$"},
+	{pattern: "^[a-zA-Z0-9-]{5,50}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,128}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,250}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,260}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,50}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,63}$"},
+	{pattern: "^[a-zA-Z0-9-_]{1,80}$"},
+	{pattern: "^[a-zA-Z0-9-_]{3,30}$"},
+	{pattern: "^[a-zA-Z0-9-_]{3,50}$"},
+	{pattern: "^[a-zA-Z0-9-_]{3,63}$"},
+	{pattern: "^[a-zA-Z0-9-_]{3,64}$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9-]{0,258}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9-]{0,28}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9-]{0,44}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9-]{0,88}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9-_]{0,78}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9]([a-zA-Z0-9_.]{0,78}[a-zA-Z0-9])?$"},
+	{pattern: "^[a-zA-Z0-9][^<>*%:.?\\+\\/]{0,258}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][^<>*%:.?\\+\\/]{0,259}$"},
+	{pattern: "^[a-zA-Z0-9][a-z0-9-]{0,14}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-.]{0,61}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,255}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,258}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,258}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,259}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,48}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,48}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,58}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,61}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,62}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,78}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-._]{0,97}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,258}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,48}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,58}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,62}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,63}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{0,73}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,24}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,42}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,48}[a-z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,57}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9-]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9_-]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{2,61}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-]{3,62}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_.]{0,78}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_.]{1,56}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_.]{1,61}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_.]{1,63}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_]{0,126}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_]{0,22}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9-_]{0,61}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._-]{0,126}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._-]{0,258}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._-]{0,62}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._-]{0,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._-]{0,78}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9._]{0,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9\\-\\._]{0,126}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9\\-\\._]{0,78}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9]{0,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9_-]{2,119}$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9_.-]{0,62}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9_.-]{0,78}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9_.-]{1,61}[a-zA-Z0-9_]$"},
+	{pattern: "^[a-zA-Z0-9][a-zA-Z0-9_]{1,13}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z0-9]{1,256}$"},
+	{pattern: "^[a-zA-Z0-9]{1,30}$"},
+	{pattern: "^[a-zA-Z0-9]{1,50}$"},
+	{pattern: "^[a-zA-Z0-9]{1,63}$"},
+	{pattern: "^[a-zA-Z0-9_-]{1,24}$"},
+	{pattern: "^[a-zA-Z0-9_-]{1,255}$"},
+	{pattern: "^[a-zA-Z0-9_-]{1,50}$"},
+	{pattern: "^[a-zA-Z0-9_-]{1,63}$"},
+	{pattern: "^[a-zA-Z0-9_-]{1,64}$"},
+	{pattern: "^[a-zA-Z0-9_-]{5,45}$"},
+	{pattern: "^[a-zA-Z0-9_]{1,140}$"},
+	{pattern: "^[a-zA-Z][-a-zA-Z0-9]{1,61}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][0-9a-zA-Z]{0,127}$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9- ]{0,62}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{0,48}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{0,48}[a-zA-Z0-9|]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{0,62}$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{0,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{0,78}[a-zA-Z0-9|]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{1,22}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{1,49}$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-]{4,48}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-_]{0,62}[a-zA-Z0-9|]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-_]{0,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9-_]{1,78}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9\\-]{1,148}[a-zA-Z0-9]$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9]{0,59}$"},
+	{pattern: "^[a-zA-Z][a-zA-Z0-9_`,.\\[\\]]{0,127}$"},
+	{pattern: "^[a-z][0-9a-z]{0,11}$"},
+	{pattern: "^[a-z][0-9a-z]{0,5}$"},
+	{pattern: "^[a-z][a-z0-9-]{2,21}[a-z0-9]$"},
+	{pattern: "^[a-z][a-z0-9]{2,62}$"},
+	{pattern: "^[a-z][a-z0-9]{3,21}$"},
+	{pattern: "^[a-z][a-zA-Z0-9-]{0,48}[a-zA-Z0-9]$"},
+	{pattern: "^[a-z]{1,250}$"},
+}
+
+// byteTables marks the bytes kept by the cleaning regexes that are a single character class,
+// so cleanString can filter bytes instead of running the regexp engine
+var byteTables = [...]byteTable{
+	// "[&%.?\\/]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, true, true, false, false, true, true, true, true, true, true, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[<>*%&:\\?+/#@{}]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, false, true, false, false, true, true, true, false, false, true, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[<>*%&:\\?.+/#]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, false, true, false, false, true, true, true, false, false, true, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[<>*%&:\\?/#{}]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, false, true, false, false, true, true, true, false, true, true, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[<>*%:.?\\+\\/ ]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		false, true, true, true, true, false, true, true, true, true, false, false, true, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[<>*%:.?\\+\\/]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, true, true, false, true, true, true, true, false, false, true, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// `[<>*%:?\\+\\/]`
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, true, true, true, false, true, true, true, true, false, false, true, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, false, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[\\/\"\\[\\]:|<>+=;,?*@&_]"
+	{
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		true, true, false, true, true, true, false, true, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, false, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// "[\\s\\/$#&]"
+	{
+		true, true, true, true, true, true, true, true, true, false, false, true, false, false, true, true, // 0x00
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x10
+		false, true, true, false, false, true, false, true, true, true, true, true, true, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x70
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x80
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x90
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xa0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xb0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xc0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xd0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xe0
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0xf0
+	},
+	// `[^-\w\._\(\)]`
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z _.-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		true, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z- .]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		true, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z- ]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		true, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z-._()]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z-._\\(\\)]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z-._]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z-_]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z<>*%:&?#\\+\\/]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, true, false, true, true, false, false, false, true, true, false, false, false, true, // 0x20
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, true, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z<>*%:.?\\+\\/]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, true, false, false, false, false, true, true, false, false, true, true, // 0x20
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, true, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z\\(\\-\\)\\_\\.]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z\\-\\_\\.]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z_-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z_.-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z_.]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z_]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9A-Za-z_`,.\\[\\]]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, true, false, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, false, true, false, true, // 0x50
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9a-z-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x40
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9a-zA-Z-_]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9a-zA-Z]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9a-z]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x40
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^0-9a-z_-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x40
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-z0-9-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x40
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// `[^a-zA-Z0-9-._\\(\\)]`
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, true, true, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, true, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9-_]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9._-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9\\-\\._]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-zA-Z0-9_-]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, true, false, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, false, // 0x30
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// "[^a-z]"
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x20
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x30
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x40
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, false, false, false, false, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+	// `[^~!@$^*()\[\]\{\}_\-="';,0-9A-Za-z _.-]`
+	{
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x00
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x10
+		true, true, true, false, true, false, false, true, true, true, true, false, true, true, true, false, // 0x20
+		true, true, true, true, true, true, true, true, true, true, false, true, false, true, false, false, // 0x30
+		true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x40
+		true, true, true, true, true, true, true, true, true, true, true, true, false, true, true, true, // 0x50
+		false, true, true, true, true, true, true, true, true, true, true, true, true, true, true, true, // 0x60
+		true, true, true, true, true, true, true, true, true, true, true, true, false, true, true, false, // 0x70
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x80
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0x90
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xa0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xb0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xc0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xd0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xe0
+		false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, false, // 0xf0
+	},
+}
+
+// resourceRegexps points every resource type at its shared cleaning and validation regexes in regexpTable
+var resourceRegexps = map[string]resourcePatterns{
+	"aks_node_pool_linux":                                                            {&regexpTable[31], &regexpTable[198]},
+	"aks_node_pool_windows":                                                          {&regexpTable[31], &regexpTable[199]},
+	"azurerm_aadb2c_directory":                                                       {&regexpTable[16], &regexpTable[139]},
+	"azurerm_active_directory_domain_service":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_active_directory_domain_service_replica_set":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_active_directory_domain_service_trust":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_advanced_threat_protection":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_advisor_recommendations":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_advisor_suppression":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_ai_foundry":                                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_ai_foundry_project":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_ai_services":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_analysis_services_server":                                               {&regexpTable[31], &regexpTable[201]},
+	"azurerm_api_connection":                                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_api_management":                                                         {&regexpTable[35], &regexpTable[185]},
+	"azurerm_api_management_api":                                                     {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_api_diagnostic":                                          {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_operation":                                           {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_operation_policy":                                    {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_operation_tag":                                       {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_api_policy":                                              {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_release":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_schema":                                              {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_tag":                                                 {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_tag_description":                                     {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_api_version_set":                                         {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_authorization_server":                                    {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_backend":                                                 {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_certificate":                                             {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_custom_domain":                                           {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_diagnostic":                                              {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_email_template":                                          {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_gateway":                                                 {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_gateway_api":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_gateway_certificate_authority":                           {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_gateway_host_name_configuration":                         {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_global_schema":                                           {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_group":                                                   {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_group_user":                                              {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_aad":                                   {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_aadb2c":                                {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_facebook":                              {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_google":                                {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_microsoft":                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_identity_provider_twitter":                               {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_logger":                                                  {&regexpTable[35], &regexpTable[188]},
+	"azurerm_api_management_named_value":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_notification_recipient_email":                            {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_notification_recipient_user":                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_openid_connect_provider":                                 {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_policy":                                                  {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_policy_fragment":                                         {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_product":                                                 {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_product_api":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_product_group":                                           {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_product_policy":                                          {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_product_tag":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_property":                                                {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_redis_cache":                                             {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_service":                                                 {&regexpTable[16], &regexpTable[203]},
+	"azurerm_api_management_subscription":                                            {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_tag":                                                     {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_user":                                                    {&regexpTable[35], &regexpTable[187]},
+	"azurerm_api_management_workspace":                                               {&regexpTable[35], &regexpTable[187]},
+	"azurerm_app_configuration":                                                      {&regexpTable[16], &regexpTable[101]},
+	"azurerm_app_configuration_feature":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_configuration_key":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service":                                                            {&regexpTable[16], &regexpTable[51]},
+	"azurerm_app_service_active_slot":                                                {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_certificate":                                                {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_certificate_binding":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_certificate_order":                                          {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_connection":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_custom_hostname_binding":                                    {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_environment":                                                {&regexpTable[16], &regexpTable[47]},
+	"azurerm_app_service_environment_hosting":                                        {&regexpTable[37], &regexpTable[154]},
+	"azurerm_app_service_environment_v3":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_hybrid_connection":                                          {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_managed_certificate":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_plan":                                                       {&regexpTable[16], &regexpTable[46]},
+	"azurerm_app_service_public_certificate":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_slot":                                                       {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_slot_custom_hostname_binding":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_slot_virtual_network_swift_connection":                      {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_source_control":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_source_control_slot":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_app_service_source_control_token":                                       {&regexpTable[35], &regexpTable[135]},
+	"azurerm_app_service_virtual_network_swift_connection":                           {&regexpTable[35], &regexpTable[135]},
+	"azurerm_application_gateway":                                                    {&regexpTable[24], &regexpTable[131]},
+	"azurerm_application_insights":                                                   {&regexpTable[24], &regexpTable[57]},
+	"azurerm_application_insights_analytics_item":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_insights_api_key":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_insights_smart_detection_rule":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_insights_standard_web_test":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_insights_web_test":                                          {&regexpTable[12], &regexpTable[183]},
+	"azurerm_application_insights_workbook":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_insights_workbook_template":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_load_balancer":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_load_balancer_frontend":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_load_balancer_subnet_association":                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_application_security_group":                                             {&regexpTable[24], &regexpTable[131]},
+	"azurerm_arc_gateway":                                                            {&regexpTable[35], &regexpTable[94]},
+	"azurerm_arc_kubernetes_cluster":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_kubernetes_cluster_extension":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_kubernetes_flux_configuration":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_kubernetes_provisioned_cluster":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_machine":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_machine_automanage_configuration_assignment":                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_machine_extension":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_private_link_scope":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_arc_resource_bridge_appliance":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_attestation":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_attestation_provider":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automanage_configuration":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_account":                                                     {&regexpTable[23], &regexpTable[191]},
+	"azurerm_automation_certificate":                                                 {&regexpTable[9], &regexpTable[63]},
+	"azurerm_automation_connection":                                                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_connection_certificate":                                      {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_connection_classic_certificate":                              {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_connection_service_principal":                                {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_connection_type":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_credential":                                                  {&regexpTable[9], &regexpTable[63]},
+	"azurerm_automation_dsc_configuration":                                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_dsc_nodeconfiguration":                                       {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_hybrid_runbook_worker":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_hybrid_runbook_worker_group":                                 {&regexpTable[2], &regexpTable[44]},
+	"azurerm_automation_job_schedule":                                                {&regexpTable[9], &regexpTable[63]},
+	"azurerm_automation_module":                                                      {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_powershell72_module":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_python3_package":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_runbook":                                                     {&regexpTable[26], &regexpTable[186]},
+	"azurerm_automation_schedule":                                                    {&regexpTable[9], &regexpTable[63]},
+	"azurerm_automation_software_update_configuration":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_source_control":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_variable":                                                    {&regexpTable[9], &regexpTable[63]},
+	"azurerm_automation_variable_bool":                                               {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_variable_datetime":                                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_variable_int":                                                {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_variable_object":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_variable_string":                                             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_automation_watcher":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_automation_webhook":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_availability_set":                                                       {&regexpTable[24], &regexpTable[149]},
+	"azurerm_backup_container_storage_account":                                       {&regexpTable[33], &regexpTable[78]},
+	"azurerm_backup_policy_file_share":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_backup_policy_vm":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_backup_policy_vm_workload":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_backup_protected_file_share":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_backup_protected_vm":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bastion_host":                                                           {&regexpTable[24], &regexpTable[131]},
+	"azurerm_batch_account":                                                          {&regexpTable[31], &regexpTable[83]},
+	"azurerm_batch_application":                                                      {&regexpTable[23], &regexpTable[178]},
+	"azurerm_batch_certificate":                                                      {&regexpTable[23], &regexpTable[179]},
+	"azurerm_batch_job":                                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_batch_pool":                                                             {&regexpTable[24], &regexpTable[174]},
+	"azurerm_billing_account_cost_management_export":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_blueprint_assignment":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_blueprint_definition":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_blueprint_published_version":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_Email":                                                      {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_channel_alexa":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_direct_line_speech":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_directline":                                                 {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_channel_email":                                                      {&regexpTable[37], &regexpTable[158]},
+	"azurerm_bot_channel_facebook":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_line":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_ms_teams":                                                   {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_channel_slack":                                                      {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_channel_sms":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channel_web_chat":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_bot_channels_registration":                                              {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_connection":                                                         {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_service":                                                            {&regexpTable[39], &regexpTable[154]},
+	"azurerm_bot_service_azure_bot":                                                  {&regexpTable[24], &regexpTable[152]},
+	"azurerm_bot_web_app":                                                            {&regexpTable[24], &regexpTable[152]},
+	"azurerm_capacity_reservation":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_capacity_reservation_group":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cdn_endpoint":                                                           {&regexpTable[16], &regexpTable[134]},
+	"azurerm_cdn_endpoint_custom_domain":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cdn_frontdoor_custom_domain":                                            {&regexpTable[16], &regexpTable[112]},
+	"azurerm_cdn_frontdoor_custom_domain_association":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cdn_frontdoor_endpoint":                                                 {&regexpTable[16], &regexpTable[114]},
+	"azurerm_cdn_frontdoor_firewall_policy":                                          {&regexpTable[22], &regexpTable[182]},
+	"azurerm_cdn_frontdoor_origin":                                                   {&regexpTable[16], &regexpTable[115]},
+	"azurerm_cdn_frontdoor_origin_group":                                             {&regexpTable[16], &regexpTable[115]},
+	"azurerm_cdn_frontdoor_profile":                                                  {&regexpTable[16], &regexpTable[115]},
+	"azurerm_cdn_frontdoor_route":                                                    {&regexpTable[16], &regexpTable[115]},
+	"azurerm_cdn_frontdoor_rule":                                                     {&regexpTable[22], &regexpTable[196]},
+	"azurerm_cdn_frontdoor_rule_set":                                                 {&regexpTable[22], &regexpTable[196]},
+	"azurerm_cdn_frontdoor_secret":                                                   {&regexpTable[16], &regexpTable[133]},
+	"azurerm_cdn_frontdoor_security_policy":                                          {&regexpTable[23], &regexpTable[52]},
+	"azurerm_cdn_profile":                                                            {&regexpTable[16], &regexpTable[133]},
+	"azurerm_chaos_studio_capability":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_chaos_studio_experiment":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_chaos_studio_target":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_client_config":                                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cloud_service":                                                          {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account":                                                      {&regexpTable[16], &regexpTable[138]},
+	"azurerm_cognitive_account_ai_foundry":                                           {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_ai_foundry_project":                                   {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_computer_vision":                                      {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_content_moderator":                                    {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_content_safety":                                       {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_custom_vision_prediction":                             {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_custom_vision_training":                               {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_customer_managed_key":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cognitive_account_face":                                                 {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_form_recognizer":                                      {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_health_insights":                                      {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_immersive_reader":                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_openai":                                               {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_rai_blocklist":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cognitive_account_rai_policy":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cognitive_account_speech_services":                                      {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_text_analytics":                                       {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_account_text_translation":                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_cognitive_deployment":                                                   {&regexpTable[16], &regexpTable[138]},
+	"azurerm_communication_service":                                                  {&regexpTable[23], &regexpTable[178]},
+	"azurerm_communication_service_email_domain_association":                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_confidential_ledger":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_consumption_budget_management_group":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_consumption_budget_resource_group":                                      {&regexpTable[36], &regexpTable[106]},
+	"azurerm_consumption_budget_subscription":                                        {&regexpTable[36], &regexpTable[106]},
+	"azurerm_containerGroups":                                                        {&regexpTable[16], &regexpTable[136]},
+	"azurerm_container_app":                                                          {&regexpTable[28], &regexpTable[74]},
+	"azurerm_container_app_custom_domain":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_app_environment":                                              {&regexpTable[16], &regexpTable[51]},
+	"azurerm_container_app_environment_certificate":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_app_environment_custom_domain":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_app_environment_dapr_component":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_app_environment_storage":                                      {&regexpTable[33], &regexpTable[78]},
+	"azurerm_container_app_job":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_connected_registry":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_group":                                                        {&regexpTable[33], &regexpTable[76]},
+	"azurerm_container_registry":                                                     {&regexpTable[22], &regexpTable[173]},
+	"azurerm_container_registry_agent_pool":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_cache_rule":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_credential_set":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_scope_map":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_task":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_task_schedule_run_now":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_token":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_token_password":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_container_registry_webhook":                                             {&regexpTable[22], &regexpTable[172]},
+	"azurerm_cosmosdb_account":                                                       {&regexpTable[28], &regexpTable[75]},
+	"azurerm_cosmosdb_cassandra_cluster":                                             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_cassandra_datacenter":                                          {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_cassandra_keyspace":                                            {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_cassandra_table":                                               {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_gremlin_database":                                              {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_gremlin_graph":                                                 {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_mongo_collection":                                              {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_mongo_database":                                                {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_mongo_role_definition":                                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_mongo_user_definition":                                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_postgresql_cluster":                                            {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_postgresql_coordinator_configuration":                          {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_postgresql_firewall_rule":                                      {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_postgresql_node_configuration":                                 {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_postgresql_role":                                               {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_sql_container":                                                 {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_sql_database":                                                  {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_sql_dedicated_gateway":                                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_sql_function":                                                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_sql_role_assignment":                                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_sql_role_definition":                                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_sql_stored_procedure":                                          {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cosmosdb_sql_trigger":                                                   {&regexpTable[37], &regexpTable[156]},
+	"azurerm_cosmosdb_table":                                                         {&regexpTable[40], &regexpTable[175]},
+	"azurerm_cost_anomaly_alert":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cost_management_export_resource_group":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_cost_management_scheduled_action":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_custom_ip_prefix":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_custom_provider":                                                        {&regexpTable[0], &regexpTable[59]},
+	"azurerm_dashboard":                                                              {&regexpTable[16], &regexpTable[98]},
+	"azurerm_dashboard_grafana":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dashboard_grafana_managed_private_endpoint":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory":                                                           {&regexpTable[16], &regexpTable[145]},
+	"azurerm_data_factory_credential_service_principal":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_credential_user_managed_identity":                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_custom_dataset":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_data_flow":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_dataset_azure_blob":                                        {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_azure_sql_table":                                   {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_factory_dataset_binary":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_dataset_cosmosdb_sqlapi":                                   {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_delimited_text":                                    {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_http":                                              {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_json":                                              {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_mysql":                                             {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_parquet":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_dataset_postgresql":                                        {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_dataset_snowflake":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_dataset_sql_server_table":                                  {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_flowlet_data_flow":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_integration_runtime_azure":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_integration_runtime_azure_ssis":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_integration_runtime_managed":                               {&regexpTable[16], &regexpTable[145]},
+	"azurerm_data_factory_integration_runtime_self_hosted":                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_custom_service":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_azure_blob_storage":                         {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_azure_databricks":                           {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_azure_file_storage":                         {&regexpTable[33], &regexpTable[78]},
+	"azurerm_data_factory_linked_service_azure_function":                             {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_azure_search":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_azure_sql_database":                         {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_azure_table_storage":                        {&regexpTable[33], &regexpTable[78]},
+	"azurerm_data_factory_linked_service_cosmosdb":                                   {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_cosmosdb_mongoapi":                          {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_factory_linked_service_data_lake_storage_gen2":                     {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_key_vault":                                  {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_kusto":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_mysql":                                      {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_odata":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_odbc":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_postgresql":                                 {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_sftp":                                       {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_snowflake":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_sql_server":                                 {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_linked_service_synapse":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_linked_service_web":                                        {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_managed_private_endpoint":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_pipeline":                                                  {&regexpTable[19], &regexpTable[118]},
+	"azurerm_data_factory_trigger_blob_event":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_trigger_custom_event":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_factory_trigger_schedule":                                          {&regexpTable[19], &regexpTable[119]},
+	"azurerm_data_factory_trigger_tumbling_window":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_lake_analytics_account":                                            {&regexpTable[31], &regexpTable[83]},
+	"azurerm_data_lake_analytics_firewall_rule":                                      {&regexpTable[32], &regexpTable[72]},
+	"azurerm_data_lake_store":                                                        {&regexpTable[31], &regexpTable[83]},
+	"azurerm_data_lake_store_file":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_lake_store_firewall_rule":                                          {&regexpTable[23], &regexpTable[109]},
+	"azurerm_data_protection_backup_instance_blob_storage":                           {&regexpTable[33], &regexpTable[78]},
+	"azurerm_data_protection_backup_instance_disk":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_protection_backup_instance_kubernetes_cluster":                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_protection_backup_instance_mysql_flexible_server":                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_protection_backup_instance_postgresql":                             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_protection_backup_instance_postgresql_flexible_server":             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_protection_backup_policy":                                          {&regexpTable[39], &regexpTable[154]},
+	"azurerm_data_protection_backup_policy_blob_storage":                             {&regexpTable[35], &regexpTable[195]},
+	"azurerm_data_protection_backup_policy_disk":                                     {&regexpTable[35], &regexpTable[195]},
+	"azurerm_data_protection_backup_policy_kubernetes_cluster":                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_protection_backup_policy_mysql_flexible_server":                    {&regexpTable[37], &regexpTable[156]},
+	"azurerm_data_protection_backup_policy_postgresql":                               {&regexpTable[35], &regexpTable[195]},
+	"azurerm_data_protection_backup_policy_postgresql_flexible_server":               {&regexpTable[35], &regexpTable[195]},
+	"azurerm_data_protection_backup_vault":                                           {&regexpTable[35], &regexpTable[190]},
+	"azurerm_data_protection_backup_vault_customer_managed_key":                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_protection_resource_guard":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share":                                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share_account":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share_dataset_blob_storage":                                        {&regexpTable[33], &regexpTable[78]},
+	"azurerm_data_share_dataset_data_lake_gen1":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share_dataset_data_lake_gen2":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share_dataset_kusto_cluster":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_data_share_dataset_kusto_database":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_database_migration_project":                                             {&regexpTable[24], &regexpTable[150]},
+	"azurerm_database_migration_service":                                             {&regexpTable[24], &regexpTable[151]},
+	"azurerm_databox_edge_device":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_databricks_access_connector":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_databricks_virtual_network_peering":                                     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_databricks_workspace":                                                   {&regexpTable[23], &regexpTable[111]},
+	"azurerm_databricks_workspace_root_dbfs_customer_managed_key":                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_datadog_monitor":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_datadog_monitor_sso_configuration":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_datadog_monitor_tag_rule":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dedicated_hardware_security_module":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dedicated_host":                                                         {&regexpTable[24], &regexpTable[149]},
+	"azurerm_dedicated_host_group":                                                   {&regexpTable[24], &regexpTable[149]},
+	"azurerm_dev_center":                                                             {&regexpTable[16], &regexpTable[140]},
+	"azurerm_dev_center_attached_network":                                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_dev_center_catalog":                                                     {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_dev_box_definition":                                          {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_environment_type":                                            {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_gallery":                                                     {&regexpTable[25], &regexpTable[117]},
+	"azurerm_dev_center_network_connection":                                          {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_project":                                                     {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_project_environment_type":                                    {&regexpTable[16], &regexpTable[145]},
+	"azurerm_dev_center_project_pool":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dev_test_global_vm_shutdown_schedule":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dev_test_lab":                                                           {&regexpTable[23], &regexpTable[105]},
+	"azurerm_dev_test_linux_virtual_machine":                                         {&regexpTable[16], &regexpTable[97]},
+	"azurerm_dev_test_policy":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dev_test_schedule":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dev_test_virtual_network":                                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_dev_test_windows_virtual_machine":                                       {&regexpTable[16], &regexpTable[93]},
+	"azurerm_devspace_controller":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_digital_twins_endpoint_eventgrid":                                       {&regexpTable[23], &regexpTable[176]},
+	"azurerm_digital_twins_endpoint_eventhub":                                        {&regexpTable[23], &regexpTable[176]},
+	"azurerm_digital_twins_endpoint_servicebus":                                      {&regexpTable[23], &regexpTable[176]},
+	"azurerm_digital_twins_instance":                                                 {&regexpTable[23], &regexpTable[177]},
+	"azurerm_digital_twins_time_series_database_connection":                          {&regexpTable[37], &regexpTable[156]},
+	"azurerm_disk_access":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_disk_encryption_set":                                                    {&regexpTable[23], &regexpTable[107]},
+	"azurerm_dns_a_record":                                                           {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_aaaa_record":                                                        {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_caa_record":                                                         {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_cname_record":                                                       {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_forwarding_ruleset":                                                 {&regexpTable[39], &regexpTable[154]},
+	"azurerm_dns_mx_record":                                                          {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_ns_record":                                                          {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_private_resolver":                                                   {&regexpTable[39], &regexpTable[154]},
+	"azurerm_dns_private_resolver_inbound_endpoint":                                  {&regexpTable[39], &regexpTable[154]},
+	"azurerm_dns_private_resolver_outbound_endpoint":                                 {&regexpTable[39], &regexpTable[154]},
+	"azurerm_dns_ptr_record":                                                         {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_srv_record":                                                         {&regexpTable[37], &regexpTable[160]},
+	"azurerm_dns_txt_record":                                                         {&regexpTable[38], &regexpTable[163]},
+	"azurerm_dns_zone":                                                               {&regexpTable[24], &regexpTable[129]},
+	"azurerm_dynatrace_monitor":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_dynatrace_tag_rules":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_elastic_cloud_elasticsearch":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_elastic_san":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_elastic_san_volume":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_elastic_san_volume_group":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_email_communication_service":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_email_communication_service_domain":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_email_communication_service_domain_sender_username":                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventgrid_domain":                                                       {&regexpTable[16], &regexpTable[99]},
+	"azurerm_eventgrid_domain_topic":                                                 {&regexpTable[16], &regexpTable[99]},
+	"azurerm_eventgrid_event_subscription":                                           {&regexpTable[16], &regexpTable[100]},
+	"azurerm_eventgrid_namespace":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventgrid_partner_configuration":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventgrid_subscription":                                                 {&regexpTable[39], &regexpTable[154]},
+	"azurerm_eventgrid_system_topic":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventgrid_system_topic_event_subscription":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventgrid_topic":                                                        {&regexpTable[16], &regexpTable[99]},
+	"azurerm_eventhub":                                                               {&regexpTable[24], &regexpTable[126]},
+	"azurerm_eventhub_authorization_rule":                                            {&regexpTable[24], &regexpTable[126]},
+	"azurerm_eventhub_cluster":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventhub_consumer_group":                                                {&regexpTable[24], &regexpTable[126]},
+	"azurerm_eventhub_namespace":                                                     {&regexpTable[16], &regexpTable[184]},
+	"azurerm_eventhub_namespace_authorization_rule":                                  {&regexpTable[24], &regexpTable[126]},
+	"azurerm_eventhub_namespace_customer_managed_key":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_eventhub_namespace_disaster_recovery_config":                            {&regexpTable[24], &regexpTable[126]},
+	"azurerm_eventhub_namespace_schema_group":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_circuit":                                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_express_route_circuit_authorization":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_circuit_connection":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_circuit_peering":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_connection":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_gateway":                                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_express_route_port":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_express_route_port_authorization":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_extended_location_custom_location":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_fabric_capacity":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_federated_identity_credential":                                          {&regexpTable[23], &regexpTable[165]},
+	"azurerm_firewall":                                                               {&regexpTable[24], &regexpTable[131]},
+	"azurerm_firewall_application_rule_collection":                                   {&regexpTable[38], &regexpTable[163]},
+	"azurerm_firewall_ip_configuration":                                              {&regexpTable[38], &regexpTable[163]},
+	"azurerm_firewall_nat_rule_collection":                                           {&regexpTable[38], &regexpTable[163]},
+	"azurerm_firewall_network_rule_collection":                                       {&regexpTable[38], &regexpTable[163]},
+	"azurerm_firewall_policy":                                                        {&regexpTable[24], &regexpTable[131]},
+	"azurerm_firewall_policy_rule_collection_group":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_fluid_relay_server":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_frontdoor":                                                              {&regexpTable[16], &regexpTable[148]},
+	"azurerm_frontdoor_custom_https_configuration":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_frontdoor_endpoint":                                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_frontdoor_firewall_policy":                                              {&regexpTable[22], &regexpTable[164]},
+	"azurerm_frontdoor_profile":                                                      {&regexpTable[39], &regexpTable[154]},
+	"azurerm_frontdoor_rules_engine":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app":                                                           {&regexpTable[16], &regexpTable[51]},
+	"azurerm_function_app_active_slot":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_connection":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_flex_consumption":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_function":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_host_keys":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_hybrid_connection":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_function_app_slot":                                                      {&regexpTable[16], &regexpTable[50]},
+	"azurerm_gallery_application":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_gallery_application_version":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_graph_services_account":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hdinsight_cluster":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hdinsight_hadoop_cluster":                                               {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_hbase_cluster":                                                {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_interactive_query_cluster":                                    {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_kafka_cluster":                                                {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_ml_services_cluster":                                          {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_rserver_cluster":                                              {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_spark_cluster":                                                {&regexpTable[16], &regexpTable[143]},
+	"azurerm_hdinsight_storm_cluster":                                                {&regexpTable[16], &regexpTable[143]},
+	"azurerm_healthbot":                                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_healthcare_dicom_service":                                               {&regexpTable[28], &regexpTable[77]},
+	"azurerm_healthcare_fhir_service":                                                {&regexpTable[28], &regexpTable[77]},
+	"azurerm_healthcare_medtech_service":                                             {&regexpTable[28], &regexpTable[77]},
+	"azurerm_healthcare_medtech_service_fhir_destination":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_healthcare_service":                                                     {&regexpTable[28], &regexpTable[77]},
+	"azurerm_healthcare_workspace":                                                   {&regexpTable[31], &regexpTable[83]},
+	"azurerm_hpc_cache":                                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hpc_cache_access_policy":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hpc_cache_blob_nfs_target":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hpc_cache_blob_target":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_hpc_cache_nfs_target":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_image":                                                                  {&regexpTable[24], &regexpTable[149]},
+	"azurerm_image_template":                                                         {&regexpTable[39], &regexpTable[154]},
+	"azurerm_images":                                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_integration_service_environment":                                        {&regexpTable[21], &regexpTable[49]},
+	"azurerm_iot_dps":                                                                {&regexpTable[39], &regexpTable[154]},
+	"azurerm_iot_dps_certificate":                                                    {&regexpTable[39], &regexpTable[154]},
+	"azurerm_iot_security_device_group":                                              {&regexpTable[15], &regexpTable[89]},
+	"azurerm_iot_security_solution":                                                  {&regexpTable[17], &regexpTable[104]},
+	"azurerm_iot_time_series_insights_access_policy":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iot_time_series_insights_reference_data_set":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iot_time_series_insights_standard_environment":                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iotcentral_application":                                                 {&regexpTable[28], &regexpTable[76]},
+	"azurerm_iotcentral_application_network_rule_set":                                {&regexpTable[37], &regexpTable[160]},
+	"azurerm_iotcentral_organization":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub":                                                                 {&regexpTable[16], &regexpTable[142]},
+	"azurerm_iothub_certificate":                                                     {&regexpTable[15], &regexpTable[91]},
+	"azurerm_iothub_consumer_group":                                                  {&regexpTable[24], &regexpTable[90]},
+	"azurerm_iothub_device_update_account":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_device_update_instance":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_dps":                                                             {&regexpTable[16], &regexpTable[96]},
+	"azurerm_iothub_dps_certificate":                                                 {&regexpTable[24], &regexpTable[91]},
+	"azurerm_iothub_dps_shared_access_policy":                                        {&regexpTable[15], &regexpTable[91]},
+	"azurerm_iothub_endpoint_cosmosdb_account":                                       {&regexpTable[37], &regexpTable[156]},
+	"azurerm_iothub_endpoint_eventhub":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_endpoint_servicebus_queue":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_endpoint_servicebus_topic":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_endpoint_storage_container":                                      {&regexpTable[33], &regexpTable[78]},
+	"azurerm_iothub_enrichment":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_fallback_route":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_file_upload":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_route":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_iothub_shared_access_policy":                                            {&regexpTable[15], &regexpTable[91]},
+	"azurerm_ip_group":                                                               {&regexpTable[24], &regexpTable[131]},
+	"azurerm_ip_group_cidr":                                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault":                                                              {&regexpTable[16], &regexpTable[189]},
+	"azurerm_key_vault_access_policy":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_certificate":                                                  {&regexpTable[16], &regexpTable[92]},
+	"azurerm_key_vault_certificate_contacts":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_certificate_issuer":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_key":                                                          {&regexpTable[16], &regexpTable[92]},
+	"azurerm_key_vault_managed_hardware_security_module":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_managed_hardware_security_module_key":                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_managed_hardware_security_module_key_rotation_policy":         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_managed_hardware_security_module_role_assignment":             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_managed_hardware_security_module_role_definition":             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_key_vault_managed_storage_account":                                      {&regexpTable[33], &regexpTable[78]},
+	"azurerm_key_vault_managed_storage_account_sas_token_definition":                 {&regexpTable[33], &regexpTable[78]},
+	"azurerm_key_vault_secret":                                                       {&regexpTable[24], &regexpTable[92]},
+	"azurerm_kubernetes_cluster":                                                     {&regexpTable[23], &regexpTable[155]},
+	"azurerm_kubernetes_cluster_extension":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_cluster_node_pool":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_cluster_node_pool_system":                                    {&regexpTable[39], &regexpTable[154]},
+	"azurerm_kubernetes_cluster_trusted_access_role_binding":                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_fleet_manager":                                               {&regexpTable[28], &regexpTable[55]},
+	"azurerm_kubernetes_fleet_member":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_fleet_update_run":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_fleet_update_strategy":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_flux_configuration":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kubernetes_service_versions":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_attached_database_configuration":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_cluster":                                                          {&regexpTable[22], &regexpTable[202]},
+	"azurerm_kusto_cluster_customer_managed_key":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_cluster_managed_private_endpoint":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_cluster_principal_assignment":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_cosmosdb_data_connection":                                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_kusto_database":                                                         {&regexpTable[11], &regexpTable[85]},
+	"azurerm_kusto_database_principal":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_database_principal_assignment":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_eventgrid_data_connection":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_eventhub_data_connection":                                         {&regexpTable[11], &regexpTable[86]},
+	"azurerm_kusto_iothub_data_connection":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_kusto_script":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_lb":                                                                     {&regexpTable[16], &regexpTable[131]},
+	"azurerm_lb_backend_address_pool":                                                {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lb_backend_address_pool_address":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_lb_backend_pool":                                                        {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lb_internal":                                                            {&regexpTable[39], &regexpTable[154]},
+	"azurerm_lb_nat_pool":                                                            {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lb_nat_rule":                                                            {&regexpTable[24], &regexpTable[131]},
+	"azurerm_lb_outbound_rule":                                                       {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lb_probe":                                                               {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lb_rule":                                                                {&regexpTable[23], &regexpTable[177]},
+	"azurerm_lighthouse_assignment":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_lighthouse_definition":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_linux_function_app":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_linux_function_app_slot":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_linux_virtual_machine":                                                  {&regexpTable[7], &regexpTable[68]},
+	"azurerm_linux_virtual_machine_scale_set":                                        {&regexpTable[7], &regexpTable[68]},
+	"azurerm_linux_web_app":                                                          {&regexpTable[16], &regexpTable[51]},
+	"azurerm_linux_web_app_slot":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_load_test":                                                              {&regexpTable[17], &regexpTable[192]},
+	"azurerm_local_network_gateway":                                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_log_analytics_cluster":                                                  {&regexpTable[16], &regexpTable[147]},
+	"azurerm_log_analytics_cluster_customer_managed_key":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_data_export_rule":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_datasource_windows_event":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_datasource_windows_performance_counter":                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_linked_service":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_linked_storage_account":                                   {&regexpTable[33], &regexpTable[78]},
+	"azurerm_log_analytics_query_pack":                                               {&regexpTable[16], &regexpTable[147]},
+	"azurerm_log_analytics_query_pack_query":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_saved_search":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_log_analytics_solution":                                                 {&regexpTable[16], &regexpTable[147]},
+	"azurerm_log_analytics_storage_insights":                                         {&regexpTable[16], &regexpTable[147]},
+	"azurerm_log_analytics_workspace":                                                {&regexpTable[16], &regexpTable[147]},
+	"azurerm_log_analytics_workspace_table":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_action_custom":                                                {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_action_http":                                                  {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_integration_account":                                          {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_integration_account_agreement":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_assembly":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_batch_configuration":                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_certificate":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_map":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_partner":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_schema":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_integration_account_session":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_standard":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_logic_app_trigger_custom":                                               {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_trigger_http_request":                                         {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_trigger_recurrence":                                           {&regexpTable[20], &regexpTable[48]},
+	"azurerm_logic_app_workflow":                                                     {&regexpTable[20], &regexpTable[48]},
+	"azurerm_machine_learning_compute_cluster":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_machine_learning_compute_instance":                                      {&regexpTable[28], &regexpTable[120]},
+	"azurerm_machine_learning_datastore_blobstorage":                                 {&regexpTable[33], &regexpTable[78]},
+	"azurerm_machine_learning_datastore_datalake_gen2":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_machine_learning_datastore_fileshare":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_machine_learning_inference_cluster":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_machine_learning_synapse_spark":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_machine_learning_workspace":                                             {&regexpTable[5], &regexpTable[64]},
+	"azurerm_machine_learning_workspace_hub":                                         {&regexpTable[39], &regexpTable[154]},
+	"azurerm_machine_learning_workspace_network_outbound_rule_fqdn":                  {&regexpTable[37], &regexpTable[160]},
+	"azurerm_machine_learning_workspace_network_outbound_rule_private_endpoint":      {&regexpTable[37], &regexpTable[160]},
+	"azurerm_machine_learning_workspace_network_outbound_rule_service_tag":           {&regexpTable[37], &regexpTable[160]},
+	"azurerm_machine_learning_workspace_project":                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_maintenance_assignment_dedicated_host":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_maintenance_assignment_dynamic_scope":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_maintenance_assignment_virtual_machine":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_maintenance_assignment_virtual_machine_scale_set":                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_maintenance_configuration":                                              {&regexpTable[24], &regexpTable[128]},
+	"azurerm_managed_application":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_managed_application_definition":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_managed_disk":                                                           {&regexpTable[24], &regexpTable[167]},
+	"azurerm_managed_disk_os":                                                        {&regexpTable[39], &regexpTable[154]},
+	"azurerm_managed_disk_sas_token":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_managed_lustre_file_system":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_policy_assignment":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_policy_exemption":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_policy_remediation":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_policy_set_definition":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_subscription_association":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_group_template_deployment":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_management_lock":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_maps_account":                                                           {&regexpTable[24], &regexpTable[132]},
+	"azurerm_maps_creator":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mariadb_configuration":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mariadb_database":                                                       {&regexpTable[23], &regexpTable[106]},
+	"azurerm_mariadb_firewall_rule":                                                  {&regexpTable[23], &regexpTable[102]},
+	"azurerm_mariadb_server":                                                         {&regexpTable[16], &regexpTable[81]},
+	"azurerm_mariadb_virtual_network_rule":                                           {&regexpTable[23], &regexpTable[102]},
+	"azurerm_marketplace_agreement":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_marketplace_role_assignment":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_media_services_account":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_migrate_project":                                                        {&regexpTable[39], &regexpTable[154]},
+	"azurerm_mobile_network":                                                         {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_attached_data_network":                                   {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_data_network":                                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_packet_core_control_plane":                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_packet_core_data_plane":                                  {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_service":                                                 {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_sim":                                                     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_sim_group":                                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_sim_policy":                                              {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_site":                                                    {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mobile_network_slice":                                                   {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mongo_cluster":                                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_aad_diagnostic_setting":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_action_group":                                                   {&regexpTable[42], &regexpTable[71]},
+	"azurerm_monitor_action_rule_action_group":                                       {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_action_rule_suppression":                                        {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_activity_log_alert":                                             {&regexpTable[18], &regexpTable[62]},
+	"azurerm_monitor_alert_processing_rule_action_group":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_alert_processing_rule_suppression":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_alert_prometheus_rule_group":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_autoscale_setting":                                              {&regexpTable[10], &regexpTable[137]},
+	"azurerm_monitor_data_collection_endpoint":                                       {&regexpTable[24], &regexpTable[141]},
+	"azurerm_monitor_data_collection_rule":                                           {&regexpTable[24], &regexpTable[141]},
+	"azurerm_monitor_data_collection_rule_association":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_diagnostic_categories":                                          {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_diagnostic_setting":                                             {&regexpTable[10], &regexpTable[84]},
+	"azurerm_monitor_log_profile":                                                    {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_metric_alert":                                                   {&regexpTable[1], &regexpTable[60]},
+	"azurerm_monitor_private_link_scope":                                             {&regexpTable[13], &regexpTable[45]},
+	"azurerm_monitor_private_link_scoped_service":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_scheduled_query_rules_alert":                                    {&regexpTable[3], &regexpTable[61]},
+	"azurerm_monitor_scheduled_query_rules_alert_v2":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_monitor_scheduled_query_rules_log":                                      {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_smart_detector_alert_rule":                                      {&regexpTable[37], &regexpTable[157]},
+	"azurerm_monitor_workspace":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_database":                                                         {&regexpTable[4], &regexpTable[65]},
+	"azurerm_mssql_database_extended_auditing_policy":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_database_vulnerability_assessment_rule_baseline":                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_elasticpool":                                                      {&regexpTable[5], &regexpTable[65]},
+	"azurerm_mssql_failover_group":                                                   {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_firewall_rule":                                                    {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job":                                                              {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job_agent":                                                        {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job_credential":                                                   {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job_schedule":                                                     {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job_step":                                                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_job_target_group":                                                 {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_database":                                                 {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance":                                                 {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_active_directory_administrator":                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_failover_group":                                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_security_alert_policy":                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_sql_start_stop_schedule":                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_transparent_data_encryption":                     {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_managed_instance_vulnerability_assessment":                        {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_mi":                                                               {&regexpTable[16], &regexpTable[76]},
+	"azurerm_mssql_outbound_firewall_rule":                                           {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_server":                                                           {&regexpTable[16], &regexpTable[76]},
+	"azurerm_mssql_server_dns_alias":                                                 {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mssql_server_extended_auditing_policy":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_server_microsoft_support_auditing_policy":                         {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_server_security_alert_policy":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_server_transparent_data_encryption":                               {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mssql_server_vulnerability_assessment":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_virtual_machine":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_virtual_machine_availability_group_listener":                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_virtual_machine_group":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mssql_virtual_network_rule":                                             {&regexpTable[37], &regexpTable[160]},
+	"azurerm_mysql_active_directory_administrator":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mysql_configuration":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mysql_database":                                                         {&regexpTable[23], &regexpTable[106]},
+	"azurerm_mysql_firewall_rule":                                                    {&regexpTable[23], &regexpTable[102]},
+	"azurerm_mysql_flexible_database":                                                {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mysql_flexible_server":                                                  {&regexpTable[16], &regexpTable[81]},
+	"azurerm_mysql_flexible_server_active_directory_administrator":                   {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mysql_flexible_server_configuration":                                    {&regexpTable[37], &regexpTable[156]},
+	"azurerm_mysql_flexible_server_database":                                         {&regexpTable[23], &regexpTable[106]},
+	"azurerm_mysql_flexible_server_firewall_rule":                                    {&regexpTable[23], &regexpTable[102]},
+	"azurerm_mysql_server":                                                           {&regexpTable[16], &regexpTable[81]},
+	"azurerm_mysql_server_key":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_mysql_virtual_network_rule":                                             {&regexpTable[23], &regexpTable[102]},
+	"azurerm_nat_gateway":                                                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_nat_gateway_public_ip_association":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_nat_gateway_public_ip_prefix_association":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_account":                                                         {&regexpTable[23], &regexpTable[153]},
+	"azurerm_netapp_account_encryption":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_backup_policy":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_backup_vault":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_pool":                                                            {&regexpTable[23], &regexpTable[155]},
+	"azurerm_netapp_snapshot":                                                        {&regexpTable[23], &regexpTable[155]},
+	"azurerm_netapp_snapshot_policy":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_volume":                                                          {&regexpTable[23], &regexpTable[155]},
+	"azurerm_netapp_volume_group_oracle":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_volume_group_sap_hana":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_netapp_volume_quota_rule":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_network_connection_monitor":                                             {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_ddos_protection_plan":                                           {&regexpTable[38], &regexpTable[163]},
+	"azurerm_network_function_azure_traffic_collector":                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_function_collector_policy":                                      {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_interface":                                                      {&regexpTable[24], &regexpTable[131]},
+	"azurerm_network_interface_application_gateway_backend_address_pool_association": {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_interface_application_security_group_association":               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_interface_backend_address_pool_association":                     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_interface_nat_rule_association":                                 {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_interface_security_group_association":                           {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager":                                                        {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_admin_rule":                                             {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_admin_rule_collection":                                  {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_connectivity_configuration":                             {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_deployment":                                             {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_ipam_pool":                                              {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_management_group_connection":                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_network_group":                                          {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_routing_configuration":                                  {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_scope_connection":                                       {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_security_admin_configuration":                           {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_static_member":                                          {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_subscription_connection":                                {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_verifier_workspace":                                     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_manager_verifier_workspace_reachability_analysis_intent":        {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_packet_capture":                                                 {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_profile":                                                        {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_security_group":                                                 {&regexpTable[24], &regexpTable[131]},
+	"azurerm_network_security_group_rule":                                            {&regexpTable[24], &regexpTable[131]},
+	"azurerm_network_security_perimeter":                                             {&regexpTable[39], &regexpTable[154]},
+	"azurerm_network_security_rule":                                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_network_service_tags":                                                   {&regexpTable[37], &regexpTable[160]},
+	"azurerm_network_watcher":                                                        {&regexpTable[24], &regexpTable[131]},
+	"azurerm_network_watcher_flow_log":                                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_new_relic_monitor":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_new_relic_tag_rule":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_nginx_api_key":                                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_nginx_certificate":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_nginx_configuration":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_nginx_deployment":                                                       {&regexpTable[16], &regexpTable[113]},
+	"azurerm_notification_hub":                                                       {&regexpTable[24], &regexpTable[125]},
+	"azurerm_notification_hub_authorization_rule":                                    {&regexpTable[24], &regexpTable[122]},
+	"azurerm_notification_hub_namespace":                                             {&regexpTable[16], &regexpTable[191]},
+	"azurerm_oracle_autonomous_database":                                             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_oracle_cloud_vm_cluster":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_oracle_exadata_infrastructure":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_orbital_contact":                                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_orbital_contact_profile":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_orbital_spacecraft":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_orchestrated_virtual_machine_scale_set":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_packet_capture":                                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_certificate":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_fqdn_list":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_outbound_trust_certificate_association":       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_outbound_untrust_certificate_association":     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_prefix_list":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_local_rulestack_rule":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_next_generation_firewall_virtual_hub_local_rulestack":         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_next_generation_firewall_virtual_hub_panorama":                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_palo_alto_next_generation_firewall_virtual_network_local_rulestack":     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_palo_alto_next_generation_firewall_virtual_network_panorama":            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_palo_alto_virtual_network_appliance":                                    {&regexpTable[37], &regexpTable[160]},
+	"azurerm_pim_active_role_assignment":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_pim_eligible_role_assignment":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_platform_image":                                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_point_to_site_vpn_gateway":                                              {&regexpTable[24], &regexpTable[131]},
+	"azurerm_policy_assignment":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_policy_definition":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_policy_remediation":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_policy_set_definition":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_policy_virtual_machine_configuration_assignment":                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_portal_dashboard":                                                       {&regexpTable[16], &regexpTable[98]},
+	"azurerm_portal_tenant_configuration":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_postgresql_active_directory_administrator":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_postgresql_configuration":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_postgresql_database":                                                    {&regexpTable[23], &regexpTable[106]},
+	"azurerm_postgresql_firewall_rule":                                               {&regexpTable[23], &regexpTable[102]},
+	"azurerm_postgresql_flexible_server":                                             {&regexpTable[28], &regexpTable[78]},
+	"azurerm_postgresql_flexible_server_active_directory_administrator":              {&regexpTable[37], &regexpTable[156]},
+	"azurerm_postgresql_flexible_server_configuration":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_postgresql_flexible_server_database":                                    {&regexpTable[23], &regexpTable[106]},
+	"azurerm_postgresql_flexible_server_firewall_rule":                               {&regexpTable[23], &regexpTable[102]},
+	"azurerm_postgresql_flexible_server_virtual_endpoint":                            {&regexpTable[37], &regexpTable[156]},
+	"azurerm_postgresql_server":                                                      {&regexpTable[16], &regexpTable[81]},
+	"azurerm_postgresql_server_key":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_postgresql_virtual_network_rule":                                        {&regexpTable[23], &regexpTable[102]},
+	"azurerm_powerbi_embedded":                                                       {&regexpTable[31], &regexpTable[80]},
+	"azurerm_private_dns_a_record":                                                   {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_aaaa_record":                                                {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_cname_record":                                               {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_mx_record":                                                  {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_ptr_record":                                                 {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_resolver":                                                   {&regexpTable[23], &regexpTable[194]},
+	"azurerm_private_dns_resolver_dns_forwarding_ruleset":                            {&regexpTable[23], &regexpTable[193]},
+	"azurerm_private_dns_resolver_forwarding_rule":                                   {&regexpTable[23], &regexpTable[116]},
+	"azurerm_private_dns_resolver_inbound_endpoint":                                  {&regexpTable[23], &regexpTable[194]},
+	"azurerm_private_dns_resolver_outbound_endpoint":                                 {&regexpTable[23], &regexpTable[194]},
+	"azurerm_private_dns_resolver_virtual_network_link":                              {&regexpTable[23], &regexpTable[116]},
+	"azurerm_private_dns_srv_record":                                                 {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_txt_record":                                                 {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_zone":                                                       {&regexpTable[24], &regexpTable[129]},
+	"azurerm_private_dns_zone_group":                                                 {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_dns_zone_virtual_network_link":                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_private_endpoint":                                                       {&regexpTable[24], &regexpTable[166]},
+	"azurerm_private_endpoint_application_security_group_association":                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_private_endpoint_connection":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_private_link_service":                                                   {&regexpTable[38], &regexpTable[163]},
+	"azurerm_private_link_service_endpoint_connections":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_private_service_connection":                                             {&regexpTable[38], &regexpTable[163]},
+	"azurerm_proximity_placement_group":                                              {&regexpTable[38], &regexpTable[163]},
+	"azurerm_public_ip":                                                              {&regexpTable[24], &regexpTable[131]},
+	"azurerm_public_ip_prefix":                                                       {&regexpTable[24], &regexpTable[131]},
+	"azurerm_public_ips":                                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_purview_account":                                                        {&regexpTable[16], &regexpTable[146]},
+	"azurerm_qumulo_file_system":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_recovery_services_vault":                                                {&regexpTable[35], &regexpTable[190]},
+	"azurerm_recovery_services_vault_backup_police":                                  {&regexpTable[35], &regexpTable[195]},
+	"azurerm_recovery_services_vault_resource_guard_association":                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_redhat_openshift_cluster":                                               {&regexpTable[22], &regexpTable[171]},
+	"azurerm_redhat_openshift_domain":                                                {&regexpTable[22], &regexpTable[171]},
+	"azurerm_redis_cache":                                                            {&regexpTable[16], &regexpTable[136]},
+	"azurerm_redis_cache_access_policy":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_redis_cache_access_policy_assignment":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_redis_enterprise_cluster":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_redis_enterprise_database":                                              {&regexpTable[37], &regexpTable[156]},
+	"azurerm_redis_firewall_rule":                                                    {&regexpTable[22], &regexpTable[170]},
+	"azurerm_redis_linked_server":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_relay_hybrid_connection":                                                {&regexpTable[24], &regexpTable[123]},
+	"azurerm_relay_hybrid_connection_authorization_rule":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_relay_namespace":                                                        {&regexpTable[16], &regexpTable[191]},
+	"azurerm_relay_namespace_authorization_rule":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_deployment_script_azure_cli":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_deployment_script_azure_power_shell":                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_group":                                                         {&regexpTable[34], &regexpTable[87]},
+	"azurerm_resource_group_cost_management_export":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_group_cost_management_view":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_group_policy_assignment":                                       {&regexpTable[38], &regexpTable[162]},
+	"azurerm_resource_group_policy_exemption":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_group_policy_remediation":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_group_template_deployment":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_management_private_link":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_management_private_link_association":                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_policy_assignment":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_policy_exemption":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_policy_remediation":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_resource_provider_registration":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_restore_point_collection":                                               {&regexpTable[39], &regexpTable[154]},
+	"azurerm_role_assignment":                                                        {&regexpTable[24], &regexpTable[58]},
+	"azurerm_role_definition":                                                        {&regexpTable[24], &regexpTable[58]},
+	"azurerm_role_management_policy":                                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_route":                                                                  {&regexpTable[24], &regexpTable[131]},
+	"azurerm_route_filter":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_route_map":                                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_route_server":                                                           {&regexpTable[24], &regexpTable[131]},
+	"azurerm_route_server_bgp_connection":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_route_table":                                                            {&regexpTable[24], &regexpTable[131]},
+	"azurerm_search_service":                                                         {&regexpTable[43], &regexpTable[73]},
+	"azurerm_search_shared_private_link_service":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_assessment":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_assessment_policy":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_auto_provisioning":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_automation":                                             {&regexpTable[37], &regexpTable[156]},
+	"azurerm_security_center_contact":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_server_vulnerability_assessment_virtual_machine":        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_server_vulnerability_assessments_setting":               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_setting":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_storage_defender":                                       {&regexpTable[33], &regexpTable[78]},
+	"azurerm_security_center_subscription_pricing":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_security_center_workspace":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_anomaly_built_in":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_anomaly_duplicate":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_fusion":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_machine_learning_behavior_analytics":                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_ms_security_incident":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_nrt":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_scheduled":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_alert_rule_threat_intelligence":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_automation_rule":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_aws_cloud_trail":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_aws_s3":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_azure_active_directory":                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_azure_advanced_threat_protection":               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_azure_security_center":                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_dynamics_365":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_iot":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_microsoft_cloud_app_security":                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_microsoft_defender_advanced_threat_protection":  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_microsoft_threat_intelligence":                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_microsoft_threat_protection":                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_office_365":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_office_365_project":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_office_atp":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_office_irm":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_office_power_bi":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_threat_intelligence":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_data_connector_threat_intelligence_taxii":                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_log_analytics_workspace_onboarding":                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_metadata":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_threat_intelligence_indicator":                                 {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_watchlist":                                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sentinel_watchlist_item":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_service_endpoint_policy":                                                {&regexpTable[39], &regexpTable[154]},
+	"azurerm_service_fabric_cluster":                                                 {&regexpTable[28], &regexpTable[200]},
+	"azurerm_service_fabric_managed_cluster":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_service_fabric_mesh_application":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_service_fabric_mesh_local_network":                                      {&regexpTable[37], &regexpTable[160]},
+	"azurerm_service_fabric_mesh_secret":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_service_fabric_mesh_secret_value":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_service_plan":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_servicebus_namespace":                                                   {&regexpTable[16], &regexpTable[191]},
+	"azurerm_servicebus_namespace_authorization_rule":                                {&regexpTable[24], &regexpTable[126]},
+	"azurerm_servicebus_namespace_customer_managed_key":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_servicebus_namespace_disaster_recovery_config":                          {&regexpTable[24], &regexpTable[126]},
+	"azurerm_servicebus_namespace_network_rule_set":                                  {&regexpTable[37], &regexpTable[160]},
+	"azurerm_servicebus_queue":                                                       {&regexpTable[24], &regexpTable[124]},
+	"azurerm_servicebus_queue_authorization_rule":                                    {&regexpTable[24], &regexpTable[126]},
+	"azurerm_servicebus_subscription":                                                {&regexpTable[24], &regexpTable[126]},
+	"azurerm_servicebus_subscription_rule":                                           {&regexpTable[24], &regexpTable[126]},
+	"azurerm_servicebus_topic":                                                       {&regexpTable[24], &regexpTable[123]},
+	"azurerm_servicebus_topic_authorization_rule":                                    {&regexpTable[24], &regexpTable[126]},
+	"azurerm_shared_image":                                                           {&regexpTable[24], &regexpTable[149]},
+	"azurerm_shared_image_gallery":                                                   {&regexpTable[25], &regexpTable[161]},
+	"azurerm_shared_image_version":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_shared_image_versions":                                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_signalr_service":                                                        {&regexpTable[16], &regexpTable[145]},
+	"azurerm_signalr_service_custom_certificate":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_signalr_service_custom_domain":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_signalr_service_network_acl":                                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_signalr_shared_private_link_resource":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_fabric":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_hyperv_network_mapping":                                   {&regexpTable[37], &regexpTable[160]},
+	"azurerm_site_recovery_hyperv_replication_policy":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_hyperv_replication_policy_association":                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_network_mapping":                                          {&regexpTable[37], &regexpTable[160]},
+	"azurerm_site_recovery_protection_container":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_protection_container_mapping":                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_replicated_vm":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_replication_policy":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_replication_recovery_plan":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_services_vault_hyperv_site":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_vmware_replicated_vm":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_vmware_replication_policy":                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_site_recovery_vmware_replication_policy_association":                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_snapshot":                                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_snapshots":                                                              {&regexpTable[24], &regexpTable[131]},
+	"azurerm_source_control_token":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spatial_anchors_account":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_accelerator":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_active_deployment":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_api_portal":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_api_portal_custom_domain":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_app":                                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_app_cosmosdb_association":                                  {&regexpTable[37], &regexpTable[156]},
+	"azurerm_spring_cloud_app_dynamics_application_performance_monitoring":           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_app_mysql_association":                                     {&regexpTable[37], &regexpTable[156]},
+	"azurerm_spring_cloud_app_redis_association":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_application_insights_application_performance_monitoring":   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_application_live_view":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_build_deployment":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_build_pack_binding":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_builder":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_certificate":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_configuration_service":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_connection":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_container_deployment":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_custom_domain":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_customized_accelerator":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_dev_tool_portal":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_dynatrace_application_performance_monitoring":              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_elastic_application_performance_monitoring":                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_gateway":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_gateway_custom_domain":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_gateway_route_config":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_java_deployment":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_new_relic_application_performance_monitoring":              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_service":                                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_spring_cloud_storage":                                                   {&regexpTable[33], &regexpTable[78]},
+	"azurerm_sql_active_directory_administrator":                                     {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sql_database":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_sql_database_stretch":                                                   {&regexpTable[39], &regexpTable[154]},
+	"azurerm_sql_elasticpool":                                                        {&regexpTable[5], &regexpTable[65]},
+	"azurerm_sql_failover_group":                                                     {&regexpTable[28], &regexpTable[76]},
+	"azurerm_sql_firewall_rule":                                                      {&regexpTable[6], &regexpTable[66]},
+	"azurerm_sql_server":                                                             {&regexpTable[28], &regexpTable[76]},
+	"azurerm_sql_virtual_network_rule":                                               {&regexpTable[37], &regexpTable[160]},
+	"azurerm_ssh_public_key":                                                         {&regexpTable[39], &regexpTable[154]},
+	"azurerm_stack_hci_cluster":                                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stack_hci_deployment_setting":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stack_hci_extension":                                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stack_hci_logical_network":                                              {&regexpTable[37], &regexpTable[160]},
+	"azurerm_stack_hci_marketplace_gallery_image":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stack_hci_network_interface":                                            {&regexpTable[37], &regexpTable[160]},
+	"azurerm_stack_hci_storage_path":                                                 {&regexpTable[33], &regexpTable[78]},
+	"azurerm_stack_hci_virtual_hard_disk":                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_static_site":                                                            {&regexpTable[16], &regexpTable[95]},
+	"azurerm_static_site_custom_domain":                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_static_web_app":                                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_static_web_app_custom_domain":                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_static_web_app_function_app_registration":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_storage_account":                                                        {&regexpTable[31], &regexpTable[83]},
+	"azurerm_storage_account_blob_container_sas":                                     {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_customer_managed_key":                                   {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_local_user":                                             {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_network_rules":                                          {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_queue_properties":                                       {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_sas":                                                    {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_static_website":                                         {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_account_vm":                                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_storage_blob":                                                           {&regexpTable[8], &regexpTable[70]},
+	"azurerm_storage_blob_inventory_policy":                                          {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_container":                                                      {&regexpTable[28], &regexpTable[79]},
+	"azurerm_storage_container_immutability_policy":                                  {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_data_lake_gen2_filesystem":                                      {&regexpTable[28], &regexpTable[78]},
+	"azurerm_storage_data_lake_gen2_path":                                            {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_encryption_scope":                                               {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_management_policy":                                              {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover":                                                          {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover_agent":                                                    {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover_job_definition":                                           {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover_project":                                                  {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover_source_endpoint":                                          {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_mover_target_endpoint":                                          {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_object_replication":                                             {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_queue":                                                          {&regexpTable[28], &regexpTable[78]},
+	"azurerm_storage_share":                                                          {&regexpTable[28], &regexpTable[78]},
+	"azurerm_storage_share_directory":                                                {&regexpTable[28], &regexpTable[78]},
+	"azurerm_storage_share_file":                                                     {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_sync":                                                           {&regexpTable[5], &regexpTable[64]},
+	"azurerm_storage_sync_cloud_endpoint":                                            {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_sync_group":                                                     {&regexpTable[5], &regexpTable[64]},
+	"azurerm_storage_sync_server_endpoint":                                           {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storage_table":                                                          {&regexpTable[28], &regexpTable[78]},
+	"azurerm_storage_table_entity":                                                   {&regexpTable[33], &regexpTable[78]},
+	"azurerm_storsimple_manager":                                                     {&regexpTable[39], &regexpTable[154]},
+	"azurerm_stream_analytics_cluster":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_function_javascript_uda":                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_function_javascript_udf":                               {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_job":                                                   {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_job_schedule":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_job_storage_account":                                   {&regexpTable[33], &regexpTable[78]},
+	"azurerm_stream_analytics_managed_private_endpoint":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_output_blob":                                           {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_output_cosmosdb":                                       {&regexpTable[37], &regexpTable[156]},
+	"azurerm_stream_analytics_output_eventhub":                                       {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_output_function":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_output_mssql":                                          {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_output_powerbi":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_output_servicebus_queue":                               {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_output_servicebus_topic":                               {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_output_synapse":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_output_table":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_reference_input_blob":                                  {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_reference_input_mssql":                                 {&regexpTable[37], &regexpTable[156]},
+	"azurerm_stream_analytics_stream_input_blob":                                     {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_stream_input_eventhub":                                 {&regexpTable[23], &regexpTable[110]},
+	"azurerm_stream_analytics_stream_input_eventhub_v2":                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_stream_analytics_stream_input_iothub":                                   {&regexpTable[23], &regexpTable[110]},
+	"azurerm_subnet":                                                                 {&regexpTable[24], &regexpTable[131]},
+	"azurerm_subnet_nat_gateway_association":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subnet_network_security_group_association":                              {&regexpTable[37], &regexpTable[160]},
+	"azurerm_subnet_route_table_association":                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subnet_service_endpoint_storage_policy":                                 {&regexpTable[33], &regexpTable[78]},
+	"azurerm_subscription":                                                           {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscription_cost_management_export":                                    {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscription_cost_management_view":                                      {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscription_policy_assignment":                                         {&regexpTable[38], &regexpTable[162]},
+	"azurerm_subscription_policy_exemption":                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscription_policy_remediation":                                        {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscription_template_deployment":                                       {&regexpTable[37], &regexpTable[159]},
+	"azurerm_subscriptions":                                                          {&regexpTable[37], &regexpTable[159]},
+	"azurerm_synapse_firewall_rule":                                                  {&regexpTable[6], &regexpTable[66]},
+	"azurerm_synapse_integration_runtime_azure":                                      {&regexpTable[16], &regexpTable[144]},
+	"azurerm_synapse_integration_runtime_self_hosted":                                {&regexpTable[16], &regexpTable[146]},
+	"azurerm_synapse_linked_service":                                                 {&regexpTable[26], &regexpTable[180]},
+	"azurerm_synapse_managed_private_endpoint":                                       {&regexpTable[24], &regexpTable[168]},
+	"azurerm_synapse_private_link_hub":                                               {&regexpTable[31], &regexpTable[82]},
+	"azurerm_synapse_role_assignment":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_synapse_spark_pool":                                                     {&regexpTable[30], &regexpTable[54]},
+	"azurerm_synapse_sql_pool":                                                       {&regexpTable[26], &regexpTable[169]},
+	"azurerm_synapse_sql_pool_vulnerability_assessment_baseline":                     {&regexpTable[22], &regexpTable[173]},
+	"azurerm_synapse_sql_pool_workload_classifier":                                   {&regexpTable[9], &regexpTable[66]},
+	"azurerm_synapse_sql_pool_workload_group":                                        {&regexpTable[9], &regexpTable[63]},
+	"azurerm_synapse_workspace":                                                      {&regexpTable[31], &regexpTable[56]},
+	"azurerm_template_deployment":                                                    {&regexpTable[14], &regexpTable[88]},
+	"azurerm_template_spec":                                                          {&regexpTable[39], &regexpTable[154]},
+	"azurerm_time_series_insights_environment":                                       {&regexpTable[39], &regexpTable[154]},
+	"azurerm_traffic_manager_endpoint":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_traffic_manager_geographical_location":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_traffic_manager_profile":                                                {&regexpTable[24], &regexpTable[121]},
+	"azurerm_user_assigned_identity":                                                 {&regexpTable[29], &regexpTable[53]},
+	"azurerm_video_indexer_account":                                                  {&regexpTable[39], &regexpTable[154]},
+	"azurerm_virtual_desktop_application_group":                                      {&regexpTable[10], &regexpTable[84]},
+	"azurerm_virtual_desktop_host_pool":                                              {&regexpTable[10], &regexpTable[84]},
+	"azurerm_virtual_desktop_scaling_plan":                                           {&regexpTable[39], &regexpTable[154]},
+	"azurerm_virtual_desktop_workspace":                                              {&regexpTable[10], &regexpTable[84]},
+	"azurerm_virtual_desktop_workspace_application_group_association":                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_hub":                                                            {&regexpTable[24], &regexpTable[127]},
+	"azurerm_virtual_hub_bgp_connection":                                             {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_hub_connection":                                                 {&regexpTable[24], &regexpTable[131]},
+	"azurerm_virtual_hub_ip":                                                         {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_hub_route_table":                                                {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_hub_security_partner_provider":                                  {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_machine":                                                        {&regexpTable[7], &regexpTable[67]},
+	"azurerm_virtual_machine_data_disk_attachment":                                   {&regexpTable[37], &regexpTable[159]},
+	"azurerm_virtual_machine_extension":                                              {&regexpTable[38], &regexpTable[163]},
+	"azurerm_virtual_machine_portal_name":                                            {&regexpTable[7], &regexpTable[68]},
+	"azurerm_virtual_machine_scale_set":                                              {&regexpTable[7], &regexpTable[67]},
+	"azurerm_virtual_machine_scale_set_extension":                                    {&regexpTable[38], &regexpTable[163]},
+	"azurerm_virtual_network":                                                        {&regexpTable[24], &regexpTable[130]},
+	"azurerm_virtual_network_gateway":                                                {&regexpTable[24], &regexpTable[131]},
+	"azurerm_virtual_network_gateway_connection":                                     {&regexpTable[37], &regexpTable[160]},
+	"azurerm_virtual_network_peering":                                                {&regexpTable[24], &regexpTable[131]},
+	"azurerm_virtual_wan":                                                            {&regexpTable[24], &regexpTable[131]},
+	"azurerm_vm_windows_computer_name_prefix":                                        {&regexpTable[7], &regexpTable[69]},
+	"azurerm_vmware_cluster":                                                         {&regexpTable[24], &regexpTable[149]},
+	"azurerm_vmware_express_route_authorization":                                     {&regexpTable[24], &regexpTable[149]},
+	"azurerm_vmware_private_cloud":                                                   {&regexpTable[24], &regexpTable[149]},
+	"azurerm_vpn_gateway":                                                            {&regexpTable[37], &regexpTable[159]},
+	"azurerm_vpn_gateway_connection":                                                 {&regexpTable[24], &regexpTable[131]},
+	"azurerm_vpn_server_configuration":                                               {&regexpTable[37], &regexpTable[159]},
+	"azurerm_vpn_site":                                                               {&regexpTable[24], &regexpTable[131]},
+	"azurerm_web_application_firewall_policy":                                        {&regexpTable[22], &regexpTable[164]},
+	"azurerm_web_application_firewall_policy_rule_group":                             {&regexpTable[39], &regexpTable[154]},
+	"azurerm_web_pubsub":                                                             {&regexpTable[16], &regexpTable[181]},
+	"azurerm_web_pubsub_hub":                                                         {&regexpTable[27], &regexpTable[197]},
+	"azurerm_web_sites":                                                              {&regexpTable[37], &regexpTable[159]},
+	"azurerm_windows_virtual_machine":                                                {&regexpTable[7], &regexpTable[67]},
+	"azurerm_windows_virtual_machine_scale_set":                                      {&regexpTable[7], &regexpTable[67]},
+	"azurerm_windows_web_app":                                                        {&regexpTable[16], &regexpTable[51]},
+	"databricks_cluster":                                                             {&regexpTable[36], &regexpTable[108]},
+	"databricks_high_concurrency_cluster":                                            {&regexpTable[23], &regexpTable[108]},
+	"databricks_standard_cluster":                                                    {&regexpTable[36], &regexpTable[108]},
+	"general":                                                                        {&regexpTable[23], &regexpTable[103]},
+	"general_safe":                                                                   {&regexpTable[41], &regexpTable[204]},
+}
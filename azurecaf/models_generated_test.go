@@ -100,3 +100,78 @@ func TestRegexValidationDashes(t *testing.T) {
 		}
 	}
 }
+
+func TestRegexpTableDeduplicated(t *testing.T) {
+	seen := make(map[string]int, len(regexpTable))
+	for i := range regexpTable {
+		pattern := regexpTable[i].pattern
+		if j, exists := seen[pattern]; exists {
+			t.Errorf("pattern %s is in regexpTable twice, at %d and %d", pattern, j, i)
+		}
+		seen[pattern] = i
+	}
+}
+
+func TestResourceRegexpsMatchDefinitions(t *testing.T) {
+	if len(resourceRegexps) != len(ResourceDefinitions) {
+		t.Errorf("expected %d entries in resourceRegexps, got %d", len(ResourceDefinitions), len(resourceRegexps))
+	}
+	for name, resource := range ResourceDefinitions {
+		patterns, exists := resourceRegexps[name]
+		if !exists {
+			t.Errorf("%s has no entry in resourceRegexps", name)
+			continue
+		}
+		if patterns.cleaner.pattern != resource.RegEx {
+			t.Errorf("%s: cleaner %s, expected %s", name, patterns.cleaner.pattern, resource.RegEx)
+		}
+		if patterns.validator.pattern != resource.ValidationRegExp {
+			t.Errorf("%s: validator %s, expected %s", name, patterns.validator.pattern, resource.ValidationRegExp)
+		}
+	}
+}
+
+func TestCompiledRegexpsShared(t *testing.T) {
+	byPattern := make(map[string]*regexp.Regexp)
+	for name := range ResourceDefinitions {
+		resource := ResourceDefinitions[name]
+		cleaner, err := resource.cleanRegexp()
+		if err != nil {
+			t.Fatalf("%s: %v", name, err)
+		}
+		if shared, exists := byPattern[resource.RegEx]; exists && shared != cleaner {
+			t.Errorf("%s: cleaning regex %s compiled more than once", name, resource.RegEx)
+		}
+		byPattern[resource.RegEx] = cleaner
+		validator, err := resource.validationRegexp()
+		if err != nil {
+			t.Fatalf("%s: %v", name, err)
+		}
+		if again, _ := resource.validationRegexp(); again != validator {
+			t.Errorf("%s: validation regex %s compiled more than once", name, resource.ValidationRegExp)
+		}
+	}
+}
+
+func TestCompiledRegexpsOutsideTable(t *testing.T) {
+	resource := Resources["rg"]
+	first, err := resource.validationRegexp()
+	if err != nil {
+		t.Fatal(err)
+	}
+	second, _ := resource.validationRegexp()
+	if first != second {
+		t.Error("expected the validation regex of a Resources entry to be compiled once")
+	}
+	if first.String() != resource.ValidationRegExp {
+		t.Errorf("expected %s, got %s", resource.ValidationRegExp, first.String())
+	}
+
+	// A definition whose pattern differs from the generated one must not use the table
+	modified := ResourceDefinitions["azurerm_resource_group"]
+	modified.RegEx = "[^a-z]"
+	cleaner, _ := modified.cleanRegexp()
+	if cleaner.String() != "[^a-z]" {
+		t.Errorf("expected the modified pattern [^a-z], got %s", cleaner.String())
+	}
+}
@@ -0,0 +1,54 @@
+package azurecaf
+
+import (
+	"sync"
+	"testing"
+)
+
+func TestRandSeqSeeded(t *testing.T) {
+	// Same sequences as rand.New(rand.NewSource(seed)) and tools/automation/go_rand.py
+	expected := map[int64]string{
+		1:             "gmwjgsapgatl",
+		42:            "fmsaxuhbdser",
+		-7:            "jdpgnfqfcbay",
+		1099511627776: "kakxuknsruyu",
+	}
+	for seed, want := range expected {
+		seed := seed
+		if got := randSeq(12, &seed); got != want {
+			t.Errorf("seed %d: expected %s but received %s", seed, want, got)
+		}
+	}
+	seed := int64(1)
+	if got := randSeq(5, &seed); got != "gmwjg" {
+		t.Errorf("expected a shorter sequence to be a prefix, received %s", got)
+	}
+}
+
+func TestRandSeqConcurrentDeterministic(t *testing.T) {
+	const seeds = 200
+	expected := make([]string, seeds)
+	for i := range expected {
+		seed := int64(i + 1)
+		expected[i] = randSeq(16, &seed)
+	}
+	var wg sync.WaitGroup
+	for worker := 0; worker < 8; worker++ {
+		wg.Add(1)
+		go func(worker int) {
+			defer wg.Done()
+			for round := 0; round < 20; round++ {
+				for i := range expected {
+					// Each worker walks the seeds from a different offset
+					index := (i + worker*25) % seeds
+					seed := int64(index + 1)
+					if got := randSeq(16, &seed); got != expected[index] {
+						t.Errorf("seed %d: expected %s but received %s", seed, expected[index], got)
+						return
+					}
+				}
+			}
+		}(worker)
+	}
+	wg.Wait()
+}
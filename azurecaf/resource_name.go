@@ -3,7 +3,6 @@ package azurecaf
 import (
 	"context"
 	"fmt"
-	"regexp"
 	"strings"
 
 	"github.com/hashicorp/terraform-plugin-sdk/v2/helper/schema"
@@ -279,7 +278,7 @@ func resourceNameImport(d *schema.ResourceData, meta interface{}) ([]*schema.Res
 	}
 
 	// Validate the existing name against Azure naming rules for this resource type
-	validationRegEx, err := regexp.Compile(resource.ValidationRegExp)
+	validationRegEx, err := resource.validationRegexp()
 	if err != nil {
 		return nil, fmt.Errorf("invalid validation regex for resource type '%s': %w", resourceType, err)
 	}
@@ -311,14 +310,24 @@ func resourceNameImport(d *schema.ResourceData, meta interface{}) ([]*schema.Res
 }
 
 func cleanSlice(names []string, resourceDefinition *ResourceStructure) []string {
+	keep := resourceDefinition.cleanTable()
 	for i, name := range names {
-		names[i] = cleanString(name, resourceDefinition)
+		if keep != nil {
+			names[i] = keep.filter(name)
+		} else {
+			names[i] = cleanString(name, resourceDefinition)
+		}
 	}
 	return names
 }
 
+// cleanString removes the characters matched by the RegEx of the resource, with a
+// byte table for simple character classes and the regexp engine otherwise
 func cleanString(name string, resourceDefinition *ResourceStructure) string {
-	myRegex, _ := regexp.Compile(resourceDefinition.RegEx)
+	if keep := resourceDefinition.cleanTable(); keep != nil {
+		return keep.filter(name)
+	}
+	myRegex, _ := resourceDefinition.cleanRegexp()
 	return myRegex.ReplaceAllString(name, "")
 }
 
@@ -385,6 +394,13 @@ func convertInterfaceToString(source []interface{}) []string {
 	return s
 }
 
+// composeSegments is the number of name parts composeName keeps on the stack;
+// longer prefix and suffix lists spill to the heap
+const composeSegments = 8
+
+// composeName joins the name parts with separator in namePrecedence order, skipping
+// the parts that would exceed maxlength. The name, the random suffix and the suffixes
+// are appended; the slug and the prefixes (last first) are prepended.
 func composeName(separator string,
 	prefixes []string,
 	name string,
@@ -393,33 +409,35 @@ func composeName(separator string,
 	randomSuffix string,
 	maxlength int,
 	namePrecedence []string) string {
-	contents := []string{}
+	// Prepended parts are kept in head in reverse order, appended parts in tail
+	var headBuffer, tailBuffer [composeSegments]string
+	head, tail := headBuffer[:0], tailBuffer[:0]
 	currentlength := 0
 
 	for i := 0; i < len(namePrecedence); i++ {
 		initialized := 0
-		if len(contents) > 0 {
+		if len(head)+len(tail) > 0 {
 			initialized = len(separator)
 		}
 		switch c := namePrecedence[i]; c {
 		case "name":
 			if len(name) > 0 {
 				if currentlength+len(name)+initialized <= maxlength {
-					contents = append(contents, name)
+					tail = append(tail, name)
 					currentlength = currentlength + len(name) + initialized
 				}
 			}
 		case "slug":
 			if len(slug) > 0 {
 				if currentlength+len(slug)+initialized <= maxlength {
-					contents = append([]string{slug}, contents...)
+					head = append(head, slug)
 					currentlength = currentlength + len(slug) + initialized
 				}
 			}
 		case "random":
 			if len(randomSuffix) > 0 {
 				if currentlength+len(randomSuffix)+initialized <= maxlength {
-					contents = append(contents, randomSuffix)
+					tail = append(tail, randomSuffix)
 					currentlength = currentlength + len(randomSuffix) + initialized
 				}
 			}
@@ -427,7 +445,7 @@ func composeName(separator string,
 			if len(suffixes) > 0 {
 				if len(suffixes[0]) > 0 {
 					if currentlength+len(suffixes[0])+initialized <= maxlength {
-						contents = append(contents, suffixes[0])
+						tail = append(tail, suffixes[0])
 						currentlength = currentlength + len(suffixes[0]) + initialized
 					}
 				}
@@ -440,7 +458,7 @@ func composeName(separator string,
 			if len(prefixes) > 0 {
 				if len(prefixes[len(prefixes)-1]) > 0 {
 					if currentlength+len(prefixes[len(prefixes)-1])+initialized <= maxlength {
-						contents = append([]string{prefixes[len(prefixes)-1]}, contents...)
+						head = append(head, prefixes[len(prefixes)-1])
 						currentlength = currentlength + len(prefixes[len(prefixes)-1]) + initialized
 					}
 				}
@@ -453,8 +471,36 @@ func composeName(separator string,
 		}
 
 	}
-	content := strings.Join(contents, separator)
-	return content
+	return joinSegments(separator, head, tail, currentlength)
+}
+
+// joinSegments joins head in reverse order then tail with separator into a string
+// of the given length, allocating only when there is more than one part
+func joinSegments(separator string, head []string, tail []string, length int) string {
+	switch len(head) + len(tail) {
+	case 0:
+		return ""
+	case 1:
+		if len(head) == 1 {
+			return head[0]
+		}
+		return tail[0]
+	}
+	var b strings.Builder
+	b.Grow(length)
+	for i := len(head) - 1; i >= 0; i-- {
+		if i < len(head)-1 {
+			b.WriteString(separator)
+		}
+		b.WriteString(head[i])
+	}
+	for i, part := range tail {
+		if i > 0 || len(head) > 0 {
+			b.WriteString(separator)
+		}
+		b.WriteString(part)
+	}
+	return b.String()
 }
 
 func validateResourceType(resourceType string, resourceTypes []string) (bool, error) {
@@ -496,7 +542,7 @@ func getResourceName(resourceTypeName string, separator string,
 	if err != nil {
 		return "", err
 	}
-	validationRegEx, err := regexp.Compile(resource.ValidationRegExp)
+	validationRegEx, err := resource.validationRegexp()
 	if err != nil {
 		return "", err
 	}
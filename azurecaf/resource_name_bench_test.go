@@ -0,0 +1,264 @@
+package azurecaf
+
+import (
+	"sort"
+	"strconv"
+	"strings"
+	"testing"
+
+	"github.com/hashicorp/terraform-plugin-sdk/v2/helper/schema"
+)
+
+var benchmarkNameSink string
+
+var defaultNamePrecedence = []string{"name", "slug", "random", "suffixes", "prefixes"}
+
+func numberedParts(prefix string, count int) []string {
+	parts := make([]string, count)
+	for i := range parts {
+		parts[i] = prefix + strconv.Itoa(i)
+	}
+	return parts
+}
+
+// composeNameCases are the typical azurecaf_name inputs and worst cases for composeName
+var composeNameCases = []struct {
+	name      string
+	prefixes  []string
+	suffixes  []string
+	maxlength int
+}{
+	{"NoAffixes", nil, nil, 80},
+	{"Typical", []string{"pr1", "pr2"}, []string{"su1", "su2"}, 80},
+	{"ManyAffixes", numberedParts("pr", 16), numberedParts("su", 16), 1024},
+	{"ManyAffixesTruncated", numberedParts("pr", 16), numberedParts("su", 16), 40},
+}
+
+// BenchmarkReference is a fixed workload that does not depend on the provider code;
+// check_benchmarks.py divides the other timings by it to compare them across machines
+func BenchmarkReference(b *testing.B) {
+	words := make([]string, 512)
+	for i := range words {
+		words[i] = strconv.Itoa(i*7919%512) + "-reference"
+	}
+	scratch := make([]string, len(words))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		copy(scratch, words)
+		sort.Strings(scratch)
+	}
+}
+
+func BenchmarkComposeName(b *testing.B) {
+	for _, tc := range composeNameCases {
+		b.Run(tc.name, func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				benchmarkNameSink = composeName("-", tc.prefixes, "myname", "rg", tc.suffixes, "abcde", tc.maxlength, defaultNamePrecedence)
+			}
+		})
+	}
+}
+
+// benchmarkResourceTypes returns every ResourceDefinitions key in a fixed order,
+// so each benchmark iteration names the next resource type
+func benchmarkResourceTypes() []string {
+	resourceTypes := make([]string, 0, len(ResourceDefinitions))
+	for resourceType := range ResourceDefinitions {
+		resourceTypes = append(resourceTypes, resourceType)
+	}
+	sort.Strings(resourceTypes)
+	return resourceTypes
+}
+
+// nameInputs are azurecaf_name inputs of increasing size
+var nameInputs = []struct {
+	name         string
+	prefixes     []string
+	baseName     string
+	suffixes     []string
+	randomSuffix string
+}{
+	{"Short", nil, "app", nil, ""},
+	{"Typical", []string{"pr1", "dev"}, "my_App-01", []string{"su1"}, "xvlbz"},
+	{"Long", numberedParts("prefix_", 6), strings.Repeat("my-App_name.", 8), numberedParts("suffix_", 6), "abcdefghijklmnop"},
+}
+
+func BenchmarkGetResourceName(b *testing.B) {
+	resourceTypes := benchmarkResourceTypes()
+	for _, input := range nameInputs {
+		b.Run(input.name, func(b *testing.B) {
+			// cleanSlice cleans the lists in place, so each call gets a fresh copy
+			prefixes := make([]string, len(input.prefixes))
+			suffixes := make([]string, len(input.suffixes))
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				copy(prefixes, input.prefixes)
+				copy(suffixes, input.suffixes)
+				// Some resource types reject some inputs; the error path is timed as well
+				benchmarkNameSink, _ = getResourceName(resourceTypes[i%len(resourceTypes)], "-", prefixes, input.baseName, suffixes, input.randomSuffix, ConventionCafClassic, true, false, true, false, defaultNamePrecedence)
+			}
+		})
+	}
+}
+
+func BenchmarkCleanString(b *testing.B) {
+	resourceTypes := benchmarkResourceTypes()
+	resources := make([]*ResourceStructure, len(resourceTypes))
+	for i, resourceType := range resourceTypes {
+		resource := ResourceDefinitions[resourceType]
+		resources[i] = &resource
+	}
+	inputs := []struct{ name, value string }{
+		{"Clean", "myapp01"},
+		{"Dirty", "my_App-01.(x)"},
+		{"Long", strings.Repeat("my_App-01.(x) ", 16)},
+	}
+	for _, input := range inputs {
+		b.Run(input.name, func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				benchmarkNameSink = cleanString(input.value, resources[i%len(resources)])
+			}
+		})
+	}
+}
+
+var benchmarkResourceSink *ResourceStructure
+
+func BenchmarkGetResource(b *testing.B) {
+	resourceTypes := benchmarkResourceTypes()
+	b.Run("AllResources", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			benchmarkResourceSink, _ = getResource(resourceTypes[i%len(resourceTypes)])
+		}
+	})
+	b.Run("Unknown", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			benchmarkResourceSink, _ = getResource("azurerm_does_not_exist")
+		}
+	})
+}
+
+func BenchmarkValidateResourceType(b *testing.B) {
+	resourceTypes := benchmarkResourceTypes()
+	b.Run("Single", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			validateResourceType(resourceTypes[i%len(resourceTypes)], nil)
+		}
+	})
+	b.Run("List10", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			start := (i * 10) % (len(resourceTypes) - 10)
+			validateResourceType("", resourceTypes[start:start+10])
+		}
+	})
+}
+
+func BenchmarkRandSeq(b *testing.B) {
+	for _, length := range []int{5, 16, 64} {
+		b.Run(strconv.Itoa(length), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				seed := int64(i + 1)
+				benchmarkNameSink = randSeq(length, &seed)
+			}
+		})
+	}
+}
+
+// BenchmarkRandSeqParallel names from all GOMAXPROCS goroutines at once; run it with
+// -cpu 1,2,4,8 to see the throughput scale with the number of processors
+func BenchmarkRandSeqParallel(b *testing.B) {
+	b.ReportAllocs()
+	b.RunParallel(func(pb *testing.PB) {
+		seed := int64(0)
+		for pb.Next() {
+			seed++
+			if len(randSeq(5, &seed)) != 5 {
+				b.Error("expected 5 random characters")
+			}
+		}
+	})
+}
+
+func toInterfaceList(values []string) []interface{} {
+	list := make([]interface{}, len(values))
+	for i, value := range values {
+		list[i] = value
+	}
+	return list
+}
+
+func BenchmarkGetNameResult(b *testing.B) {
+	resourceTypes := benchmarkResourceTypes()
+	for _, input := range nameInputs {
+		b.Run(input.name, func(b *testing.B) {
+			// One resource per type, as a configuration with an azurecaf_name for each would have
+			data := make([]*schema.ResourceData, len(resourceTypes))
+			for i, resourceType := range resourceTypes {
+				d := resourceName().TestResourceData()
+				values := map[string]interface{}{
+					"name":            input.baseName,
+					"prefixes":        toInterfaceList(input.prefixes),
+					"suffixes":        toInterfaceList(input.suffixes),
+					"random_length":   len(input.randomSuffix),
+					"random_seed":     i + 1,
+					"separator":       "-",
+					"clean_input":     true,
+					"passthrough":     false,
+					"resource_type":   resourceType,
+					"resource_types":  []interface{}{},
+					"use_slug":        true,
+					"use_legacy_slug": false,
+				}
+				for key, value := range values {
+					if err := d.Set(key, value); err != nil {
+						b.Fatalf("setting %s: %v", key, err)
+					}
+				}
+				data[i] = d
+			}
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				getNameResult(data[i%len(data)], nil)
+			}
+		})
+	}
+}
+
+func TestComposeNameAllocations(t *testing.T) {
+	for _, tc := range composeNameCases {
+		// Longer lists spill the parts to the heap
+		if len(tc.prefixes) >= composeSegments || len(tc.suffixes)+2 > composeSegments {
+			continue
+		}
+		allocs := testing.AllocsPerRun(100, func() {
+			benchmarkNameSink = composeName("-", tc.prefixes, "myname", "rg", tc.suffixes, "abcde", tc.maxlength, defaultNamePrecedence)
+		})
+		if allocs > 1 {
+			t.Errorf("%s: expected the result string as the only allocation, got %v", tc.name, allocs)
+		}
+	}
+}
+
+func TestComposeNameManyAffixes(t *testing.T) {
+	prefixes := numberedParts("p", 10)
+	suffixes := numberedParts("s", 10)
+	name := composeName("-", prefixes, "name", "slug", suffixes, "rd", 1024, defaultNamePrecedence)
+	expected := "p0-p1-p2-p3-p4-p5-p6-p7-p8-p9-slug-name-rd-s0-s1-s2-s3-s4-s5-s6-s7-s8-s9"
+	if name != expected {
+		t.Errorf("Expected %s but received %s", expected, name)
+	}
+	name = composeName("", prefixes, "name", "slug", suffixes, "rd", 20, defaultNamePrecedence)
+	expected = "slugnamerds0s1s2s3s4"
+	if name != expected {
+		t.Errorf("Expected %s but received %s", expected, name)
+	}
+}
@@ -4,7 +4,6 @@ import (
 	"fmt"
 	"log"
 	"math/rand"
-	"regexp"
 	"strings"
 
 	"github.com/hashicorp/terraform-plugin-sdk/v2/helper/schema"
@@ -152,8 +151,8 @@ func getResult(d *schema.ResourceData, meta interface{}) error {
 	}
 
 	// joning the elements performing first filter to remove non compatible characters based on the resource type
-	myRegex, _ := regexp.Compile(regExFilter)
-	validationRegEx, _ := regexp.Compile(validationRegExPattern)
+	myRegex, _ := resource.cleanRegexp()
+	validationRegEx, _ := resource.validationRegexp()
 	// clear the name first based on the regexp filter of the resource type
 	nameList := []string{}
 	for _, s := range []string{prefix, cafPrefix, name, postfix} {
@@ -26,8 +26,13 @@ import (
 	"os"
 	"path"
 	"regexp"
+	"regexp/syntax"
 	"sort"
+	"strconv"
+	"strings"
 	"text/template"
+	"unicode"
+	"unicode/utf8"
 )
 
 // OfficialData defines the official Azure CAF documentation attributes for a resource
@@ -95,6 +100,133 @@ type ResourceStructure struct {
 type templateData struct {
 	ResourceStructures []ResourceStructure // All resource definitions from JSON
 	SlugMap            map[string]string   // Mapping of CAF prefixes to resource types
+	Patterns           []patternEntry      // Distinct cleaning and validation regexes
+	PatternIndex       map[string]int      // Index in Patterns of every regex literal used by a resource
+	ByteTables         []byteTableData     // Byte tables of the cleaning regexes that are simple classes
+}
+
+// patternEntry is one distinct regex of the generated table
+type patternEntry struct {
+	Literal string // Go string literal of the pattern, as written in resourceDefinition.json
+	Table   int    // Index of its byte table in ByteTables, -1 when it needs the regexp engine
+}
+
+// byteTableData is a 256-entry table of the bytes a cleaning regex keeps, as Go source rows
+type byteTableData struct {
+	Literal string
+	Rows    []string
+}
+
+// classByteTable returns the bytes kept by a cleaning regex that is a single
+// character class, such as [^0-9A-Za-z-], or false when the regexp engine is needed.
+//
+// Removing the bytes of a class is only equivalent to ReplaceAllString when the
+// class treats every non-ASCII rune alike: the bytes of a multi-byte rune and an
+// invalid byte (matched as utf8.RuneError) are then all removed or all kept.
+func classByteTable(pattern string) ([256]bool, bool) {
+	var keep [256]bool
+	re, err := syntax.Parse(pattern, syntax.Perl)
+	if err != nil || re.Op != syntax.OpCharClass {
+		return keep, false
+	}
+	// re.Rune holds the sorted [lo, hi] ranges of the class, already complemented for [^...]
+	nonASCII := 0
+	for i := 0; i < len(re.Rune); i += 2 {
+		lo, hi := re.Rune[i], re.Rune[i+1]
+		if hi >= utf8.RuneSelf {
+			if lo < utf8.RuneSelf {
+				lo = utf8.RuneSelf
+			}
+			nonASCII += int(hi - lo + 1)
+		}
+	}
+	// Every non-ASCII rune is in the class (removed) or none is (kept)
+	allNonASCII := int(unicode.MaxRune - utf8.RuneSelf + 1)
+	if nonASCII != 0 && nonASCII != allNonASCII {
+		return keep, false
+	}
+	for c := 0; c < len(keep); c++ {
+		if c < utf8.RuneSelf {
+			keep[c] = !classContains(re.Rune, rune(c))
+		} else {
+			keep[c] = nonASCII == 0
+		}
+	}
+	return keep, true
+}
+
+func classContains(ranges []rune, c rune) bool {
+	for i := 0; i < len(ranges); i += 2 {
+		if ranges[i] <= c && c <= ranges[i+1] {
+			return true
+		}
+	}
+	return false
+}
+
+// byteTableRows formats a byte table as rows of 16 entries
+func byteTableRows(keep [256]bool) []string {
+	rows := make([]string, 0, len(keep)/16)
+	for row := 0; row < len(keep); row += 16 {
+		values := make([]string, 16)
+		for i := range values {
+			values[i] = strconv.FormatBool(keep[row+i])
+		}
+		rows = append(rows, fmt.Sprintf("%s, // 0x%02x", strings.Join(values, ", "), row))
+	}
+	return rows
+}
+
+// buildPatternTable deduplicates the cleaning and validation regexes of all resources.
+// The definitions hold Go string literals, so two spellings of the same pattern
+// ("\\." and `\.`) are compared by their unquoted value. Patterns are sorted by
+// value for a stable table, and every literal is mapped to its table index.
+// Cleaning regexes that are simple character classes also get a byte table.
+func buildPatternTable(resources []ResourceStructure) ([]patternEntry, map[string]int, []byteTableData, error) {
+	literals := make(map[string]string) // unquoted pattern -> first literal spelling
+	cleaners := make(map[string]bool)   // unquoted patterns used as RegEx
+	for _, res := range resources {
+		for _, literal := range []string{res.RegEx, res.ValidationRegExp} {
+			pattern, err := strconv.Unquote(literal)
+			if err != nil {
+				return nil, nil, nil, fmt.Errorf("invalid regex literal %s for %s: %w", literal, res.ResourceTypeName, err)
+			}
+			if _, exists := literals[pattern]; !exists {
+				literals[pattern] = literal
+			}
+			if literal == res.RegEx {
+				cleaners[pattern] = true
+			}
+		}
+	}
+
+	values := make([]string, 0, len(literals))
+	for pattern := range literals {
+		values = append(values, pattern)
+	}
+	sort.Strings(values)
+
+	patterns := make([]patternEntry, len(values))
+	tables := []byteTableData{}
+	byValue := make(map[string]int, len(values))
+	for i, pattern := range values {
+		patterns[i] = patternEntry{Literal: literals[pattern], Table: -1}
+		if cleaners[pattern] {
+			if keep, simple := classByteTable(pattern); simple {
+				patterns[i].Table = len(tables)
+				tables = append(tables, byteTableData{Literal: literals[pattern], Rows: byteTableRows(keep)})
+			}
+		}
+		byValue[pattern] = i
+	}
+	index := make(map[string]int)
+	for _, res := range resources {
+		for _, literal := range []string{res.RegEx, res.ValidationRegExp} {
+			pattern, _ := strconv.Unquote(literal)
+			index[literal] = byValue[pattern]
+		}
+	}
+	return patterns, index, tables, nil
 }
 
 // main is the entry point for the code generator.
@@ -170,6 +302,12 @@ func main() {
 		}
 	}
 
+	// Each distinct regex is emitted once and compiled lazily by the provider
+	patterns, patternIndex, byteTables, err := buildPatternTable(uniqueData)
+	if err != nil {
+		log.Fatal(err)
+	}
+
 	// Generate the Go source file using the parsed template
 	modelsFile, err := os.OpenFile(path.Join(wd, "azurecaf/models_generated.go"), os.O_TRUNC|os.O_CREATE|os.O_WRONLY, 0644)
 	if err != nil {
@@ -181,6 +319,9 @@ func main() {
 	err = parsedTemplate.ExecuteTemplate(modelsFile, "model.tmpl", templateData{
 		ResourceStructures: uniqueData,
 		SlugMap:            slugMap,
+		Patterns:           patterns,
+		PatternIndex:       patternIndex,
+		ByteTables:         byteTables,
 	})
 
 	if err != nil {
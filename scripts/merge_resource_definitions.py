@@ -1,34 +1,60 @@
 #!/usr/bin/env python3
 """
-Script to merge resourceDefinition.json and resourceDefinition_out_of_docs.json
-according to the requirements:
-1. Combine both files into a single resourceDefinition.json
+Script to merge resourceDefinition.json, resourceDefinition_out_of_docs.json
+and any number of overlay files according to the requirements:
+1. Combine all inputs into a single resourceDefinition.json
 2. Add out_of_doc: true to resources that are not in official documentation
 3. Add official documentation attributes for all resources
+
+The inputs are merged with a streaming k-way merge by name: every input must be
+sorted by name (the canonical layout written by the tooling is), only the
+current definition of each input is held in memory, and the output is written
+as the merge goes. The legacy three-file form sorts its inputs in memory, as
+the main file predates the sorted layout. A name present in more than one
+input is a conflict; each field is taken from the last input that defines it
+unless a per-field precedence rule says otherwise, and every conflict is
+reported. out_of_doc defaults to the 'all' rule: a resource is out of docs
+only when every input it comes from says so.
+
+Usage:
+    python3 merge_resource_definitions.py <main_file> <out_of_docs_file> <output_file>
+    python3 merge_resource_definitions.py -o OUTPUT [--out-of-docs FILE]... [--prefer FIELD=first|last|all]...
+                                          [--conflicts REPORT] [--sort-inputs] INPUT...
 """
 
+import argparse
+import heapq
 import json
 import sys
 import os
-from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools', 'automation'))
+from resource_definitions import save_resource_definitions
+from stream_definitions import iter_resource_definitions
+
+PRECEDENCE_MODES = ('first', 'last', 'all')
+DEFAULT_PRECEDENCE = 'last'
+# Rules applied unless --prefer overrides them: a resource documented in any source is documented
+FIELD_PRECEDENCE = {'out_of_doc': 'all'}
+
+class MergeError(Exception):
+    """An input cannot take part in the streaming merge"""
+
 
 def load_json_file(filepath):
-    """Load and parse a JSON file."""
+    """Load and parse a JSON file; raises MergeError when it cannot be read."""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
-    except Exception as e:
-        print(f"Error loading {filepath}: {e}")
-        sys.exit(1)
+    except (OSError, ValueError) as e:
+        raise MergeError(f"cannot load {filepath}: {e}") from e
 
 def save_json_file(data, filepath):
-    """Save data to a JSON file with proper formatting."""
+    """Save data to a JSON file in the canonical resource definition layout; raises MergeError on failure."""
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-    except Exception as e:
-        print(f"Error saving {filepath}: {e}")
-        sys.exit(1)
+        save_resource_definitions(data, filepath)
+    except (OSError, ValueError) as e:
+        raise MergeError(f"cannot save {filepath}: {e}") from e
 
 def get_official_doc_mapping():
     """
@@ -104,103 +130,259 @@ def get_official_doc_mapping():
     
     return official_mapping
 
-def merge_resource_definitions(main_file, out_of_docs_file, output_file):
+def add_official_attributes(resource, official_mapping):
+    """Add the official documentation attributes (or placeholders) to a resource."""
+    resource_name = resource.get("name", "")
+    if resource_name in official_mapping:
+        mapping = official_mapping[resource_name]
+        resource["resource"] = mapping["resource"]
+        resource["resource_provider_namespace"] = mapping["resource_provider_namespace"]
+        # Keep existing slug but could update if needed
+        if "slug" not in resource:
+            resource["slug"] = mapping["slug"]
+    else:
+        # For resources not in our mapping, we'll assume they are in official docs
+        # and add placeholder values that can be updated later
+        if "resource" not in resource:
+            resource["resource"] = f"Azure {resource_name.replace('azurerm_', '').replace('_', ' ').title()}"
+        if "resource_provider_namespace" not in resource:
+            resource["resource_provider_namespace"] = "Unknown"
+    return resource
+
+
+def iter_source(path, out_of_doc=False, sort=False):
     """
-    Merge the two resource definition files according to requirements.
+    Yield the definitions of one input in name order.
+
+    Raises MergeError when the input is not sorted by name or repeats a name,
+    unless sort is set, in which case the input is loaded and sorted in memory.
     """
-    
-    print("Loading resource definition files...")
-    main_resources = load_json_file(main_file)
-    out_of_docs_resources = load_json_file(out_of_docs_file)
-    
-    print(f"Loaded {len(main_resources)} resources from main file")
-    print(f"Loaded {len(out_of_docs_resources)} resources from out of docs file")
-    
+    if sort:
+        resources = sorted(load_json_file(path), key=lambda r: r.get("name", ""))
+    else:
+        resources = iter_resource_definitions(path)
+    previous = None
+    for resource in resources:
+        name = resource.get("name", "")
+        if previous is not None:
+            if name == previous:
+                raise MergeError(f"{path}: name '{name}' appears more than once")
+            if name < previous:
+                raise MergeError(f"{path}: not sorted by name ('{name}' after '{previous}'), "
+                                 "use --sort-inputs to sort it in memory")
+        previous = name
+        if out_of_doc:
+            resource["out_of_doc"] = True
+        yield resource
+
+
+def resolve_fields(entries, precedence):
+    """
+    Merge the definitions of one name found in several sources.
+
+    entries is a list of (source index, resource) in source order. Each field
+    is taken from the first or the last source defining it, as precedence
+    says (DEFAULT_PRECEDENCE for fields without a rule). A field with the
+    'all' rule is true only when every source sets it to true; otherwise it
+    comes from the last source that does not, and is left out when that
+    source does not define it. Returns the merged resource and {field:
+    winning source index} for the fields the sources disagree on.
+    """
+    # Every field of every source, in first-seen order
+    fields = list(dict.fromkeys(key for _, resource in entries for key in resource))
+    merged = {}
+    winners = {}
+    for field in fields:
+        defining = [(index, resource[field]) for index, resource in entries if field in resource]
+        mode = precedence.get(field, DEFAULT_PRECEDENCE)
+        if mode == 'all':
+            dissenting = [(index, resource) for index, resource in entries if resource.get(field) is not True]
+            if not dissenting:
+                merged[field] = True
+                continue
+            winner, resource = dissenting[-1]
+            if field in resource:
+                merged[field] = resource[field]
+            winners[field] = winner
+            continue
+        if mode == 'first':
+            winner, value = defining[0]
+        else:
+            winner, value = defining[-1]
+        merged[field] = value
+        if any(v != value for _, v in defining):
+            winners[field] = winner
+    return merged, winners
+
+
+def merge_sources(sources, precedence, on_conflict):
+    """
+    Streaming k-way merge of name-sorted sources.
+
+    sources is a list of iterators of definitions sorted by name. Yields the
+    merged definitions in name order and calls on_conflict(name, source
+    indexes, field winners) for every name found in more than one source.
+    Only one pending definition per source is held in memory.
+    """
+    keyed = [_keyed(index, source) for index, source in enumerate(sources)]
+    group = []
+    for name, index, resource in heapq.merge(*keyed, key=lambda item: item[:2]):
+        if group and group[0][0] != name:
+            yield _flush(group, precedence, on_conflict)
+            group = []
+        group.append((name, index, resource))
+    if group:
+        yield _flush(group, precedence, on_conflict)
+
+
+def _keyed(index, source):
+    for resource in source:
+        yield resource.get("name", ""), index, resource
+
+
+def _flush(group, precedence, on_conflict):
+    if len(group) == 1:
+        return group[0][2]
+    merged, winners = resolve_fields([(index, resource) for _, index, resource in group], precedence)
+    on_conflict(group[0][0], [index for _, index, _ in group], winners)
+    return merged
+
+
+def parse_precedence(rules):
+    """Parse FIELD=first|last rules into a dict"""
+    precedence = {}
+    for rule in rules or ():
+        field, _, mode = rule.partition("=")
+        if not field or mode not in PRECEDENCE_MODES:
+            raise ValueError(f"invalid precedence rule '{rule}', expected FIELD=first, FIELD=last or FIELD=all")
+        precedence[field] = mode
+    return precedence
+
+
+def merge_resource_definitions(main_file, out_of_docs_file, output_file, overlays=(), precedence=None,
+                               conflict_report=None, sort_inputs=False):
+    """
+    Merge resource definition files according to requirements.
+
+    main_file and out_of_docs_file may each be a path, a list of paths or
+    None; overlays are further inputs merged after them. Later inputs take
+    precedence over earlier ones field by field, unless precedence maps a
+    field to 'first' or 'all' (FIELD_PRECEDENCE applies to fields it does
+    not map). Conflicts are printed, and written as JSON lines to
+    conflict_report when given.
+    """
+
+    def as_list(paths):
+        if paths is None:
+            return []
+        return [paths] if isinstance(paths, str) else list(paths)
+
+    inputs = ([(path, False) for path in as_list(main_file)] +
+              [(path, True) for path in as_list(out_of_docs_file)] +
+              [(path, False) for path in as_list(overlays)])
+    if not inputs:
+        print("Error: no input files")
+        return False
+    precedence = dict(FIELD_PRECEDENCE, **(precedence or {}))
+    paths = [path for path, _ in inputs]
+
+    print(f"Merging {len(inputs)} resource definition files...")
+    for path, out_of_doc in inputs:
+        print(f"  • {path}{' (out of docs)' if out_of_doc else ''}")
+
     # Get official documentation mapping
     official_mapping = get_official_doc_mapping()
-    
-    # Create a combined list
-    combined_resources = []
-    
-    # Process main resources (these are considered to be in official docs)
-    for resource in main_resources:
-        resource_name = resource.get("name", "")
-        
-        # Add official doc attributes if available
-        if resource_name in official_mapping:
-            mapping = official_mapping[resource_name]
-            resource["resource"] = mapping["resource"]
-            resource["resource_provider_namespace"] = mapping["resource_provider_namespace"]
-            # Keep existing slug but could update if needed
-            if "slug" not in resource:
-                resource["slug"] = mapping["slug"]
-        else:
-            # For resources not in our mapping, we'll assume they are in official docs
-            # and add placeholder values that can be updated later
-            if "resource" not in resource:
-                resource["resource"] = f"Azure {resource_name.replace('azurerm_', '').replace('_', ' ').title()}"
-            if "resource_provider_namespace" not in resource:
-                resource["resource_provider_namespace"] = "Unknown"
-        
-        combined_resources.append(resource)
-    
-    # Process out-of-docs resources (these get out_of_doc: true)
-    for resource in out_of_docs_resources:
-        resource_name = resource.get("name", "")
-        
-        # Add the out_of_doc flag
-        resource["out_of_doc"] = True
-        
-        # Add official doc attributes if available (some out_of_doc resources might have been added to official docs)
-        if resource_name in official_mapping:
-            mapping = official_mapping[resource_name]
-            resource["resource"] = mapping["resource"]
-            resource["resource_provider_namespace"] = mapping["resource_provider_namespace"]
-            # Keep existing slug
-            if "slug" not in resource:
-                resource["slug"] = mapping["slug"]
+
+    counts = {"total": 0, "out_of_doc": 0, "conflicts": 0}
+    report = open(conflict_report, 'w', encoding='utf-8') if conflict_report else None
+
+    def on_conflict(name, indexes, winners):
+        counts["conflicts"] += 1
+        sources = [paths[i] for i in indexes]
+        if winners:
+            fields = ", ".join(f"{field} from {paths[winner]}" for field, winner in winners.items())
         else:
-            # Add placeholder values for consistency
-            if "resource" not in resource:
-                resource["resource"] = f"Azure {resource_name.replace('azurerm_', '').replace('_', ' ').title()}"
-            if "resource_provider_namespace" not in resource:
-                resource["resource_provider_namespace"] = "Unknown"
-        
-        combined_resources.append(resource)
-    
-    # Sort by resource name for consistency
-    combined_resources.sort(key=lambda x: x.get("name", ""))
-    
-    print(f"Combined {len(combined_resources)} resources total")
-    print(f"Resources marked as out_of_doc: {len(out_of_docs_resources)}")
-    
-    # Save the combined file
-    save_json_file(combined_resources, output_file)
+            fields = "identical"
+        print(f"⚠️  {name}: in {', '.join(sources)} ({fields})")
+        if report is not None:
+            entry = {"name": name, "sources": sources,
+                     "fields": {field: paths[winner] for field, winner in winners.items()}}
+            report.write(json.dumps(entry) + "\n")
+
+    def merged_resources():
+        sources = [iter_source(path, out_of_doc, sort_inputs) for path, out_of_doc in inputs]
+        for resource in merge_sources(sources, precedence, on_conflict):
+            counts["total"] += 1
+            if resource.get("out_of_doc") is True:
+                counts["out_of_doc"] += 1
+            yield add_official_attributes(resource, official_mapping)
+
+    partial_file = f"{output_file}.partial"
+    try:
+        # The merge is already in name order, so the output is written as it is produced
+        save_resource_definitions(merged_resources(), partial_file, presorted=True)
+        os.replace(partial_file, output_file)
+    except (OSError, ValueError, MergeError) as e:
+        print(f"Error merging into {output_file}: {e}")
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+        return False
+    finally:
+        if report is not None:
+            report.close()
+
+    print(f"Combined {counts['total']} resources total")
+    print(f"Resources marked as out_of_doc: {counts['out_of_doc']}")
+    print(f"Names present in more than one source: {counts['conflicts']}")
+    if conflict_report:
+        print(f"Conflict report written to {conflict_report}")
     print(f"Saved combined resources to {output_file}")
-    
+
     return True
 
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python3 merge_resource_definitions.py <main_file> <out_of_docs_file> <output_file>")
+    parser = argparse.ArgumentParser(description='Merge resource definition files with a streaming k-way merge by name')
+    parser.add_argument('inputs', nargs='*', help='input files, in increasing precedence')
+    parser.add_argument('-o', '--output', help='merged output file')
+    parser.add_argument('--out-of-docs', action='append', default=[], metavar='FILE',
+                        help='input whose resources are marked out_of_doc, merged after the main inputs (repeatable)')
+    parser.add_argument('--prefer', action='append', metavar='FIELD=first|last|all',
+                        help=f'per-field precedence on conflicts (default: {DEFAULT_PRECEDENCE}, '
+                             'out_of_doc=all); all keeps true only when every input sets it')
+    parser.add_argument('--conflicts', metavar='REPORT', help='write the conflict report as JSON lines to REPORT')
+    parser.add_argument('--sort-inputs', action='store_true',
+                        help='sort unsorted inputs in memory instead of failing')
+    args = parser.parse_intermixed_args()
+
+    if args.output is None:
+        # Legacy form: <main_file> <out_of_docs_file> <output_file>
+        if len(args.inputs) != 3 or args.out_of_docs:
+            print("Usage: python3 merge_resource_definitions.py <main_file> <out_of_docs_file> <output_file>")
+            print("       python3 merge_resource_definitions.py -o OUTPUT [--out-of-docs FILE]... INPUT...")
+            sys.exit(1)
+        main_files, out_of_docs_files, output_file = [args.inputs[0]], [args.inputs[1]], args.inputs[2]
+        # The legacy inputs were never kept sorted
+        sort_inputs = True
+    else:
+        main_files, out_of_docs_files, output_file = args.inputs, args.out_of_docs, args.output
+        sort_inputs = args.sort_inputs
+
+    try:
+        precedence = parse_precedence(args.prefer)
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
-    
-    main_file = sys.argv[1]
-    out_of_docs_file = sys.argv[2] 
-    output_file = sys.argv[3]
-    
+
     # Verify input files exist
-    if not os.path.exists(main_file):
-        print(f"Error: {main_file} does not exist")
-        sys.exit(1)
-    
-    if not os.path.exists(out_of_docs_file):
-        print(f"Error: {out_of_docs_file} does not exist")
-        sys.exit(1)
-    
+    for path in main_files + out_of_docs_files:
+        if not os.path.exists(path):
+            print(f"Error: {path} does not exist")
+            sys.exit(1)
+
     # Perform the merge
-    success = merge_resource_definitions(main_file, out_of_docs_file, output_file)
-    
+    success = merge_resource_definitions(main_files, out_of_docs_files, output_file, precedence=precedence,
+                                         conflict_report=args.conflicts, sort_inputs=sort_inputs)
+
     if success:
         print("Resource definition files merged successfully!")
     else:
@@ -208,4 +390,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -238,8 +238,9 @@ add_resource_intelligent() {
             lowercase=false
             regex="\"[^a-zA-Z0-9._-]\""
             
-            # Generate slug from resource name
-            slug=$(echo "$name" | sed 's/azurerm_//' | sed 's/_//g' | cut -c1-8)
+            # Propose a slug from the resource's family and name tokens, unique against the current definitions
+            slug=$(python3 "$SCRIPT_DIR/automation/slug_generator.py" --file "$RESDEF" --slug-only "$name" 2>/dev/null) || \
+                slug=$(echo "$name" | sed 's/azurerm_//' | sed 's/_//g' | cut -c1-8)
             resource_description="Azure $(echo "$name" | sed 's/azurerm_//' | tr '_' ' ' | sed 's/\b\w/\U&/g')"
             ;;
     esac
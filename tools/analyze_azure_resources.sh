@@ -46,8 +46,18 @@ show_help() {
     echo ""
 }
 
+# Whether the columnar NumPy statistics module can replace the jq passes
+have_numpy_stats() {
+    [[ -f "$RESDEF" ]] && python3 -c 'import numpy' 2>/dev/null
+}
+
 # Function to get resource statistics
 show_statistics() {
+    if have_numpy_stats; then
+        python3 "$SCRIPT_DIR/automation/definition_stats.py" --file "$RESDEF" stats
+        return
+    fi
+    
     echo -e "${BLUE}📊 Azure Resource Statistics${NC}"
     echo "============================="
     echo ""
@@ -199,29 +209,33 @@ validate_resources() {
 
 # Function to show coverage analysis
 show_coverage() {
-    echo -e "${PURPLE}📈 Coverage Analysis${NC}"
-    echo "===================="
-    echo ""
-    
-    if [[ ! -f "$RESDEF" ]]; then
-        echo -e "${RED}❌ resourceDefinition.json not found${NC}"
-        return 1
+    if have_numpy_stats; then
+        python3 "$SCRIPT_DIR/automation/definition_stats.py" --file "$RESDEF" coverage
+    else
+        echo -e "${PURPLE}📈 Coverage Analysis${NC}"
+        echo "===================="
+        echo ""
+        
+        if [[ ! -f "$RESDEF" ]]; then
+            echo -e "${RED}❌ resourceDefinition.json not found${NC}"
+            return 1
+        fi
+        
+        # Provider namespace coverage
+        echo -e "${CYAN}🏢 Azure Provider Coverage:${NC}"
+        jq -r '[.[] | select(.official.resource_provider_namespace != null) | .official.resource_provider_namespace] | group_by(.) | .[] | "\(.[0]): \(length) resources"' "$RESDEF" | \
+        sort -k2 -nr | head -10 | while read line; do
+            echo -e "${CYAN}  • $line${NC}"
+        done
+        
+        # Service category analysis
+        echo ""
+        echo -e "${CYAN}📊 Service Categories (Top 10):${NC}"
+        jq -r '.[] | .name | split("_")[1]' "$RESDEF" | sort | uniq -c | sort -nr | head -10 | while read count service; do
+            echo -e "${CYAN}  • $service: $count resources${NC}"
+        done
     fi
     
-    # Provider namespace coverage
-    echo -e "${CYAN}🏢 Azure Provider Coverage:${NC}"
-    jq -r '[.[] | select(.official.resource_provider_namespace != null) | .official.resource_provider_namespace] | group_by(.) | .[] | "\(.[0]): \(length) resources"' "$RESDEF" | \
-    sort -k2 -nr | head -10 | while read line; do
-        echo -e "${CYAN}  • $line${NC}"
-    done
-    
-    # Service category analysis
-    echo ""
-    echo -e "${CYAN}📊 Service Categories (Top 10):${NC}"
-    jq -r '.[] | .name | split("_")[1]' "$RESDEF" | sort | uniq -c | sort -nr | head -10 | while read count service; do
-        echo -e "${CYAN}  • $service: $count resources${NC}"
-    done
-    
     # Implementation completeness
     if [[ -f "$README" ]]; then
         echo ""
@@ -7,15 +7,15 @@ https://learn.microsoft.com/en-us/azure/cloud-adoption-framework/ready/azure-bes
 
 import json
 import sys
-from collections import Counter
+
+from resource_registry import ResourceRegistry
 
 def add_all_missing_caf_resources():
     """Agrega todos los recursos oficiales de Microsoft CAF que faltan"""
     
     try:
         # Cargar resourceDefinition.json
-        with open('resourceDefinition.json', 'r', encoding='utf-8') as f:
-            resources = json.load(f)
+        registry = ResourceRegistry.load()
         
         # Mapeo COMPLETO de recursos oficiales Microsoft CAF
         # Cada entrada incluye: nombre del recurso terraform, slug CAF, descripción
@@ -1079,15 +1079,12 @@ def add_all_missing_caf_resources():
             }
         }
         
-        # Obtener recursos existentes
-        existing_resources = {resource.get('name', '') for resource in resources}
-        
         # Identificar recursos faltantes
         missing_resources = []
         updated_resources = []
         
         for resource_name, caf_info in official_caf_resources.items():
-            if resource_name not in existing_resources:
+            if resource_name not in registry:
                 missing_resources.append({
                     'name': resource_name,
                     'slug': caf_info['slug'],
@@ -1096,13 +1093,10 @@ def add_all_missing_caf_resources():
                 })
             else:
                 # Verificar si el slug actual coincide con CAF
-                for existing_resource in resources:
-                    if existing_resource.get('name') == resource_name:
-                        current_slug = existing_resource.get('slug', '')
-                        expected_slug = caf_info['slug']
-                        if current_slug != expected_slug:
-                            existing_resource['slug'] = expected_slug
-                            updated_resources.append(f"  • {resource_name}: '{current_slug}' → '{expected_slug}' (CAF oficial)")
+                expected_slug = caf_info['slug']
+                current_slug = registry.set_slug(resource_name, expected_slug)
+                if current_slug != expected_slug:
+                    updated_resources.append(f"  • {resource_name}: '{current_slug}' → '{expected_slug}' (CAF oficial)")
         
         # Agregar recursos faltantes con configuración estándar
         for missing in missing_resources:
@@ -1116,12 +1110,11 @@ def add_all_missing_caf_resources():
                 "scope": "resourceGroup",
                 "dashes": True
             }
-            resources.append(new_resource)
+            registry.add(new_resource)
         
         # Guardar cambios si hay modificaciones
         if missing_resources or updated_resources:
-            with open('resourceDefinition.json', 'w', encoding='utf-8') as f:
-                json.dump(resources, f, indent=2, ensure_ascii=False)
+            registry.save()
             
             print("🏷️ ADICIÓN COMPLETA DE RECURSOS OFICIALES MICROSOFT CAF:")
             print("=" * 80)
@@ -1143,11 +1136,9 @@ def add_all_missing_caf_resources():
                     print(update)
             
             # Verificar estado final
-            total_resources = len(resources)
-            slugs = [r.get('slug', '') for r in resources]
-            unique_slugs = len(set(slugs))
-            slug_counts = Counter(slugs)
-            duplicates = sum(1 for count in slug_counts.values() if count > 1)
+            total_resources = len(registry)
+            unique_slugs = len(registry.slugs())
+            duplicates = len(registry.duplicate_slugs())
             
             print(f"\n📊 ESTADO DESPUÉS DE AGREGAR RECURSOS CAF:")
             print(f"   • Total recursos: {total_resources}")
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the resource definition tooling
+
+Runs each benchmark on the real resourceDefinition.json and on synthetic
+definition lists built by cloning real entries under new names, so the tooling
+can be measured at sizes well beyond the current file.
+
+Usage:
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... [--repeat N] serializer
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... records
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... [--repeat N] stats
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... [--repeat N] snapshot
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... stream
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--synthetic N]... [--repeat N] index
+    python3 tools/automation/benchmark_definitions.py [--file PATH] [--repeat N] solver
+
+solver is a scale test: it fails when the unique slug solver needs more than
+SOLVER_BUDGET_S for SOLVER_RESOURCES colliding resources or assigns a slug twice.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from resource_definitions import (
+    JSON_BACKENDS, RESOURCE_DEFINITION_FILE, dumps_resource_definitions,
+    load_resource_definitions, loads_resource_definitions, save_resource_definitions,
+)
+from definition_index import DefinitionIndex, build_index, index_path
+from resource_record import records_from_definitions, records_to_definitions
+from resource_registry import ResourceRegistry, snapshot_path
+from slug_solver import SlugSolver
+from stream_definitions import SlugStreamIndex, iter_resource_definitions
+
+# The unique slug solver must handle this many resources within the budget
+SOLVER_RESOURCES = 10000
+SOLVER_BUDGET_S = 1.0
+SOLVER_GROUP_SIZE = 2500
+
+
+def synthetic_resources(count, templates, seed=0, unique_slugs=True):
+    """Build count definitions cloned from templates, with unique names.
+
+    Slugs are made unique too unless unique_slugs is False, in which case
+    clones share their template's slug like definitions merged from several
+    providers do.
+
+    The list is shuffled with a fixed seed so the output is reproducible and
+    writers still have to sort it.
+    """
+    resources = []
+    for i in range(count):
+        template = templates[i % len(templates)]
+        resource = dict(template)
+        resource['name'] = f"{template.get('name', '')}_synth{i:07d}"
+        if unique_slugs:
+            resource['slug'] = f"{template.get('slug', '')}{i:x}"
+        if isinstance(template.get('official'), dict):
+            resource['official'] = dict(template['official'])
+        resources.append(resource)
+    random.Random(seed).shuffle(resources)
+    return resources
+
+
+def best_time(func, repeat):
+    """Best wall-clock time of repeat calls, and the last result"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_serializer(label, resources, repeat):
+    """Time load and canonical dump with every available backend"""
+    reference = dumps_resource_definitions(resources, 'json')
+    print(f"\n📦 {label}: {len(resources)} resources, {len(reference) / 1024 / 1024:.1f} MiB")
+    print(f"{'Backend':<12}{'Load (ms)':>14}{'Dump (ms)':>14}{'Identical':>12}")
+    print("-" * 52)
+    identical = True
+    for backend in JSON_BACKENDS:
+        load_time, _ = best_time(lambda: loads_resource_definitions(reference, backend), repeat)
+        dump_time, output = best_time(lambda: dumps_resource_definitions(resources, backend), repeat)
+        same = output == reference
+        identical = identical and same
+        print(f"{backend:<12}{load_time * 1000:>14.1f}{dump_time * 1000:>14.1f}{'yes' if same else 'NO':>12}")
+    return identical
+
+
+def run_serializer(args):
+    resources = load_resource_definitions(args.file)
+    identical = bench_serializer(args.file, resources, args.repeat)
+    for count in args.synthetic:
+        identical = bench_serializer(f'synthetic x{count}', synthetic_resources(count, resources), args.repeat) and identical
+    if not identical:
+        print("\n❌ Backends produced different output")
+        return 1
+    print("\n✅ All backends produced byte-identical output")
+    return 0
+
+
+def traced_memory(build):
+    """Memory retained by the result of build() and the peak while building it, in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def bench_records(label, encoded):
+    """Compare the memory of dict definitions and ResourceRecord lists parsed from the same bytes"""
+    dicts, dict_current, dict_peak = traced_memory(lambda: loads_resource_definitions(encoded))
+    count = len(dicts)
+    del dicts
+    records, record_current, record_peak = traced_memory(
+        lambda: records_from_definitions(loads_resource_definitions(encoded)))
+    lossless = dumps_resource_definitions(records_to_definitions(records)) == encoded
+    del records
+    mib = 1024 * 1024
+    print(f"\n📦 {label}: {count} resources")
+    print(f"{'Representation':<16}{'Retained (MiB)':>16}{'Peak (MiB)':>14}{'Bytes/resource':>16}")
+    print("-" * 62)
+    print(f"{'dict':<16}{dict_current / mib:>16.1f}{dict_peak / mib:>14.1f}{dict_current // max(count, 1):>16}")
+    print(f"{'ResourceRecord':<16}{record_current / mib:>16.1f}{record_peak / mib:>14.1f}"
+          f"{record_current // max(count, 1):>16}")
+    print(f"🔁 Lossless JSON round trip: {'yes' if lossless else 'NO'}")
+    return lossless
+
+
+def run_records(args):
+    resources = load_resource_definitions(args.file)
+    lossless = bench_records(args.file, dumps_resource_definitions(resources))
+    for count in args.synthetic:
+        encoded = dumps_resource_definitions(synthetic_resources(count, resources))
+        lossless = bench_records(f'synthetic x{count}', encoded) and lossless
+    if not lossless:
+        print("\n❌ Records did not round-trip to the same JSON")
+        return 1
+    print("\n✅ Records round-trip losslessly")
+    return 0
+
+
+def bench_stats(label, resources, repeat):
+    """Time building the columns and printing the full statistics and coverage reports"""
+    from definition_stats import DefinitionColumns, print_coverage, print_statistics
+
+    build_time, columns = best_time(lambda: DefinitionColumns(resources), repeat)
+
+    def report():
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_statistics(columns)
+            print_coverage(columns)
+
+    report_time, _ = best_time(report, repeat)
+    print(f"📦 {label}: {len(resources)} resources, columns {build_time * 1000:.1f} ms, "
+          f"reports {report_time * 1000:.1f} ms, total {(build_time + report_time) * 1000:.1f} ms")
+
+
+def run_stats(args):
+    resources = load_resource_definitions(args.file)
+    bench_stats(args.file, resources, args.repeat)
+    for count in args.synthetic:
+        bench_stats(f'synthetic x{count}', synthetic_resources(count, resources), args.repeat)
+    return 0
+
+
+def bench_snapshot(label, resources, repeat):
+    """Time registry loads from JSON against loads from the pickled snapshot"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, RESOURCE_DEFINITION_FILE)
+        save_resource_definitions(resources, path)
+        # Age the JSON like a checked-out file so the snapshot can trust its mtime
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+        json_time, _ = best_time(lambda: ResourceRegistry.load(path, snapshot=False), repeat)
+
+        def cold():
+            if os.path.exists(snapshot_path(path)):
+                os.remove(snapshot_path(path))
+            return ResourceRegistry.load(path)
+
+        cold_time, _ = best_time(cold, repeat)
+        hot_time, registry = best_time(lambda: ResourceRegistry.load(path), repeat)
+        same = registry.resources == load_resource_definitions(path)
+        size = os.path.getsize(snapshot_path(path))
+    print(f"📦 {label}: {len(resources)} resources, snapshot {size / 1024 / 1024:.1f} MiB")
+    print(f"  • JSON parse + index:    {json_time * 1000:>9.1f} ms")
+    print(f"  • Snapshot rebuild:      {cold_time * 1000:>9.1f} ms")
+    print(f"  • Snapshot load:         {hot_time * 1000:>9.1f} ms ({json_time / hot_time:.1f}x)")
+    print(f"  • Same definitions:      {'yes' if same else 'NO'}")
+    return same
+
+
+def run_snapshot(args):
+    resources = load_resource_definitions(args.file)
+    same = bench_snapshot(args.file, resources, args.repeat)
+    for count in args.synthetic:
+        same = bench_snapshot(f'synthetic x{count}', synthetic_resources(count, resources), args.repeat) and same
+    return 0 if same else 1
+
+
+def bench_stream(label, path, count):
+    """Peak memory of duplicate detection over a whole loaded file against the streaming index"""
+    def batch():
+        return len(ResourceRegistry.load(path, snapshot=False).duplicate_slugs())
+
+    def stream():
+        index = SlugStreamIndex()
+        for resource in iter_resource_definitions(path):
+            index.add(resource.get('name', ''), resource.get('slug', ''))
+        return index.duplicate_count
+
+    start = time.perf_counter()
+    batch_duplicates, _, batch_peak = traced_memory(batch)
+    batch_time = time.perf_counter() - start
+    start = time.perf_counter()
+    stream_duplicates, _, stream_peak = traced_memory(stream)
+    stream_time = time.perf_counter() - start
+    mib = 1024 * 1024
+    print(f"📦 {label}: {count} resources, {os.path.getsize(path) / mib:.1f} MiB")
+    print(f"  • Registry:  peak {batch_peak / mib:>8.1f} MiB, {batch_time:.2f} s (traced), {batch_duplicates} duplicates")
+    print(f"  • Streaming: peak {stream_peak / mib:>8.1f} MiB, {stream_time:.2f} s (traced), {stream_duplicates} duplicates")
+    return batch_duplicates == stream_duplicates
+
+
+def run_stream(args):
+    resources = load_resource_definitions(args.file)
+    same = bench_stream(args.file, args.file, len(resources))
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.synthetic:
+            path = os.path.join(directory, f'synthetic_{count}.json')
+            save_resource_definitions(synthetic_resources(count, resources, unique_slugs=False), path)
+            same = bench_stream(f'synthetic x{count}', path, count) and same
+    return 0 if same else 1
+
+
+def bench_index(label, path, count, names, repeat):
+    """Time point lookups through a full parse against the mmapped offset index"""
+    def parse():
+        by_name = {resource.get('name'): resource for resource in load_resource_definitions(path)}
+        return [by_name.get(name) for name in names]
+
+    parse_time, expected = best_time(parse, repeat)
+    build_time, _ = best_time(lambda: build_index(path), 1)
+    # Age the file like a checked-out one so the index can trust its mtime
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+    build_index(path)
+    open_time, index = best_time(lambda: DefinitionIndex(path), repeat)
+    with index:
+        lookup_time, found = best_time(lambda: [index.get(name) for name in names], repeat)
+    same = found == expected
+    print(f"📦 {label}: {count} resources, index {os.path.getsize(index_path(path)) / 1024 / 1024:.1f} MiB")
+    print(f"  • Full parse + lookup:   {parse_time * 1000:>9.1f} ms")
+    print(f"  • Index build:           {build_time * 1000:>9.1f} ms")
+    print(f"  • Index open:            {open_time * 1e6:>9.1f} µs")
+    print(f"  • Lookup:                {lookup_time / len(names) * 1e6:>9.1f} µs per name")
+    print(f"  • Same definitions:      {'yes' if same else 'NO'}")
+    return same
+
+
+def run_index(args):
+    resources = load_resource_definitions(args.file)
+    with tempfile.TemporaryDirectory() as directory:
+        sources = [(args.file, resources)] + [
+            (f'synthetic x{count}', synthetic_resources(count, resources)) for count in args.synthetic]
+        same = True
+        for label, definitions in sources:
+            path = os.path.join(directory, RESOURCE_DEFINITION_FILE)
+            save_resource_definitions(definitions, path)
+            names = [resource['name'] for resource in random.Random(0).sample(definitions, min(100, len(definitions)))]
+            same = bench_index(label, path, len(definitions), names, args.repeat) and same
+    return 0 if same else 1
+
+
+def collision_groups(count, group_size):
+    """count resources sharing one slug per group_size, with name tokens that yield no slug
+    candidate, so that every resource but the keeper takes the numbered fallback"""
+    return [{'name': f'azurerm_svc{i // group_size}_X{i:06d}', 'slug': f'sv{i // group_size}'}
+            for i in range(count)]
+
+
+def bench_solver(label, resources, repeat):
+    """Time SlugSolver.solve(); returns whether it met the budget with unique slugs"""
+    registry = ResourceRegistry(resources)
+    elapsed, assignments = best_time(lambda: SlugSolver(registry, protected={}).solve(), repeat)
+    slugs = [slug for slug in registry.slugs() if registry.slug_count(slug) == 1]
+    slugs.extend(new_slug for _, _, new_slug, _ in assignments)
+    unique = len(slugs) == len(set(slugs))
+    within = elapsed <= SOLVER_BUDGET_S
+    print(f"{'✅' if within and unique else '❌'} {label}: {len(resources)} resources, "
+          f"{len(assignments)} slugs assigned in {elapsed * 1000:.1f} ms"
+          f"{'' if unique else ', duplicate slugs assigned'}")
+    return within and unique
+
+
+def run_solver(args):
+    resources = load_resource_definitions(args.file)
+    print(f"🧩 Unique slug solver, budget {SOLVER_BUDGET_S:g}s for {SOLVER_RESOURCES} resources")
+    ok = bench_solver(f'groups of {SOLVER_GROUP_SIZE}', collision_groups(SOLVER_RESOURCES, SOLVER_GROUP_SIZE),
+                      args.repeat)
+    ok = bench_solver(f'{args.file} clones sharing slugs',
+                      synthetic_resources(SOLVER_RESOURCES, resources, unique_slugs=False), args.repeat) and ok
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the resource definition tooling')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file used as input and template')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the best one is reported')
+    parser.add_argument('--synthetic', type=int, action='append', metavar='N',
+                        help='size of a synthetic definition list to benchmark, repeatable (default: 100000)')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serializer', help='canonical JSON load and dump per backend').set_defaults(func=run_serializer)
+    commands.add_parser('records', help='tracemalloc memory of dicts against ResourceRecord').set_defaults(func=run_records)
+    commands.add_parser('stats', help='columnar statistics and coverage reports').set_defaults(func=run_stats)
+    commands.add_parser('snapshot', help='registry load from JSON against the pickled snapshot').set_defaults(func=run_snapshot)
+    commands.add_parser('stream', help='peak memory of registry against streaming duplicate detection').set_defaults(func=run_stream)
+    commands.add_parser('index', help='point lookups through a full parse against the offset index').set_defaults(func=run_index)
+    commands.add_parser('solver', help='scale test of the unique slug solver').set_defaults(func=run_solver)
+    args = parser.parse_args()
+    if args.synthetic is None:
+        args.synthetic = [100000]
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
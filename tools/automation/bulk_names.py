@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Bulk CAF name generation
+
+Generates and validates one azurecaf_name result per row of a CSV or JSONL
+file, the way getNameResult() does for a resource (see caf_naming.py), and
+streams the rows back to stdout in input order with `result` and `error`
+columns added. Rows that fail keep an empty result and carry the provider's
+error message; the exit code is 1 when any row failed.
+
+Columns (only resource_type is required):
+    resource_type, name, prefixes, suffixes, separator, random_length,
+    random_seed (or seed), clean_input, passthrough, use_slug, use_legacy_slug
+
+In CSV, prefixes and suffixes are a JSON array or a --list-separator
+separated string (pr1;pr2); in JSONL they can also be arrays. Missing values
+and empty cells take the azurecaf_name defaults. A row without a seed gets time-based random
+characters, as in the provider.
+
+Rows are read lazily and named in batches on a process pool, sharing the
+definitions loaded once by the parent. A few batches per worker are in flight at a
+time and results are written oldest batch first, so the output keeps the
+input order and memory stays bounded whatever the input size.
+
+Usage:
+    python3 tools/automation/bulk_names.py [--format csv|jsonl] [--jobs N]
+        [--batch-size N] [--list-separator SEP] [--file PATH] INPUT|-
+"""
+
+import argparse
+import collections
+import contextlib
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from caf_naming import DEFAULT_SEPARATOR, CafNamingEngine, NamingError
+from resource_definitions import RESOURCE_DEFINITION_FILE
+
+INPUT_FORMATS = ('csv', 'jsonl')
+DEFAULT_BATCH_SIZE = 500
+# Batches queued per worker before waiting for the oldest one
+BATCHES_PER_WORKER = 4
+DEFAULT_LIST_SEPARATOR = ';'
+OUTPUT_COLUMNS = ('result', 'error')
+
+_TRUE = {'1', 'true', 'yes', 'y', 'on'}
+_FALSE = {'0', 'false', 'no', 'n', 'off', ''}
+
+# Per-process engine and list separator, set by _init_worker
+_engine = None
+_list_separator = DEFAULT_LIST_SEPARATOR
+
+
+def _init_worker(engine, list_separator):
+    global _engine, _list_separator
+    _engine = engine
+    _list_separator = list_separator
+
+
+def _text(value, default=''):
+    return default if value is None or value == '' else str(value)
+
+
+def _integer(row, *columns):
+    for column in columns:
+        value = row.get(column)
+        if value is not None and value != '':
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                raise NamingError(f"{column} must be an integer, got: {value}") from None
+    return 0
+
+
+def _flag(row, column, default):
+    value = row.get(column)
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise NamingError(f"{column} must be a boolean, got: {value}")
+
+
+def _list(value, separator):
+    if value is None or value == '':
+        return []
+    if isinstance(value, list):
+        return [_text(item) for item in value]
+    text = str(value)
+    if text.startswith('['):
+        try:
+            items = json.loads(text)
+        except ValueError:
+            raise NamingError(f"invalid JSON list: {text}") from None
+        return [_text(item) for item in items]
+    return [item for item in text.split(separator) if item]
+
+
+def name_row(row, engine, list_separator=DEFAULT_LIST_SEPARATOR):
+    """(result, error) of one input row; exactly one of them is empty"""
+    try:
+        result, _ = engine.name_result(
+            resource_type=_text(row.get('resource_type')),
+            name=_text(row.get('name')),
+            prefixes=_list(row.get('prefixes'), list_separator),
+            suffixes=_list(row.get('suffixes'), list_separator),
+            separator=_text(row.get('separator'), DEFAULT_SEPARATOR),
+            random_length=_integer(row, 'random_length'),
+            random_seed=_integer(row, 'random_seed', 'seed'),
+            clean_input=_flag(row, 'clean_input', True),
+            passthrough=_flag(row, 'passthrough', False),
+            use_slug=_flag(row, 'use_slug', True),
+            use_legacy_slug=_flag(row, 'use_legacy_slug', False),
+        )
+    except NamingError as e:
+        return '', str(e)
+    return result or '', ''
+
+
+def _name_batch(rows):
+    return [name_row(row, _engine, _list_separator) for row in rows]
+
+
+def _batches(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def read_rows(stream, input_format):
+    """Yield the input rows as dicts; JSONL lines that are not objects raise ValueError"""
+    if input_format == 'csv':
+        yield from csv.DictReader(stream)
+        return
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError(f"line {number}: expected a JSON object")
+        yield row
+
+
+def generate_names(rows, definitions_path=RESOURCE_DEFINITION_FILE, jobs=None,
+                   batch_size=DEFAULT_BATCH_SIZE, list_separator=DEFAULT_LIST_SEPARATOR):
+    """Yield (row, result, error) for each row, in input order"""
+    jobs = jobs or os.cpu_count() or 1
+    # Loaded here so that a bad definitions file fails once instead of in every
+    # worker, which the pool would respawn forever; fork workers inherit it
+    engine = CafNamingEngine.load(definitions_path)
+    batches = _batches(rows, batch_size)
+    if jobs == 1:
+        _init_worker(engine, list_separator)
+        for batch in batches:
+            yield from _paired(batch, _name_batch(batch))
+        return
+    # imap would drain the input in its feeder thread; a window of batches in flight keeps memory bounded
+    window = collections.deque()
+    with multiprocessing.Pool(jobs, _init_worker, (engine, list_separator)) as pool:
+        for batch in batches:
+            window.append((batch, pool.apply_async(_name_batch, (batch,))))
+            if len(window) >= jobs * BATCHES_PER_WORKER:
+                yield from _drain(window)
+        while window:
+            yield from _drain(window)
+
+
+def _paired(batch, named):
+    return ((row, result, error) for row, (result, error) in zip(batch, named))
+
+
+def _drain(window):
+    batch, named = window.popleft()
+    return _paired(batch, named.get())
+
+
+class _Writer:
+    """Streams named rows in the input format"""
+
+    def __init__(self, stream, output_format):
+        self.stream = stream
+        self.format = output_format
+        self._csv = None
+
+    def write(self, row, result, error):
+        if self.format == 'jsonl':
+            self.stream.write(json.dumps({**row, 'result': result, 'error': error}, ensure_ascii=False) + '\n')
+            return
+        if self._csv is None:
+            columns = [c for c in row if c is not None] + [c for c in OUTPUT_COLUMNS if c not in row]
+            self._csv = csv.DictWriter(self.stream, columns, extrasaction='ignore', lineterminator='\n')
+            self._csv.writeheader()
+        self._csv.writerow({**row, 'result': result, 'error': error})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate and validate CAF names for every row of a CSV or JSONL file')
+    parser.add_argument('input', metavar='INPUT', help="CSV or JSONL file of rows to name, '-' for stdin")
+    parser.add_argument('--format', choices=INPUT_FORMATS,
+                        help='input and output format (default: from the extension, csv for stdin)')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count, 1 runs inline)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='rows per worker task')
+    parser.add_argument('--list-separator', default=DEFAULT_LIST_SEPARATOR,
+                        help='separator of prefixes and suffixes given as a CSV string')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file')
+    args = parser.parse_args()
+    if args.batch_size < 1 or (args.jobs is not None and args.jobs < 1):
+        parser.error('--jobs and --batch-size must be positive')
+
+    input_format = args.format
+    if input_format is None:
+        extension = os.path.splitext(args.input)[1].lower()
+        input_format = 'jsonl' if extension in ('.jsonl', '.ndjson') else 'csv'
+
+    # Trimming can split a multi-byte character; write the provider's bytes as they are
+    sys.stdout.reconfigure(errors='surrogateescape')
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8', newline='')
+    writer = _Writer(sys.stdout, input_format)
+    start = time.perf_counter()
+    named = failed = 0
+    try:
+        with source if source is not sys.stdin else contextlib.nullcontext(source):
+            rows = read_rows(source, input_format)
+            for row, result, error in generate_names(rows, args.file, args.jobs, args.batch_size,
+                                                     args.list_separator):
+                writer.write(row, result, error)
+                named += 1
+                failed += bool(error)
+    except BrokenPipeError:
+        # The reader went away (| head); keep the interpreter from flushing into the closed pipe
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"✅ {named - failed} names generated, {failed} rows failed in {elapsed:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
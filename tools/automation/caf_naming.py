@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+CAF naming engine
+
+A Python port of the azurecaf_name logic in azurecaf/resource_name.go, working
+directly on resourceDefinition.json so names can be generated without running
+the provider: getResource, getSlug, cleanString, composeName,
+trimResourceName, getResourceName and getNameResult, plus randSeq on top of a
+port of Go's math/rand source (go_rand.py). For the same inputs and
+random_seed the results and error messages are the ones the provider returns.
+
+The definitions are indexed like gen.go builds ResourceDefinitions and
+ResourceMaps (slug -> first resource by name, azurerm_storage_account owning
+"st"). Cleaning and validation patterns are Go string literals in the
+definitions file; they are unquoted, translated to Python re syntax and
+compiled once per pattern, and the compiled pair is cached per resource type.
+
+Lengths and trimming count UTF-8 bytes like Go. A trim that splits a multi-byte
+character leaves the partial bytes as surrogate escapes, so
+result.encode('utf-8', 'surrogateescape') is the provider's exact output.
+
+Usage:
+    python3 tools/automation/caf_naming.py --type TYPE [--type TYPE]... [--name NAME]
+        [--prefix P]... [--suffix S]... [--separator SEP] [--random-length N]
+        [--random-seed SEED] [--no-clean-input] [--passthrough] [--no-slug]
+        [--legacy-slug] [--file PATH]
+"""
+
+import argparse
+import functools
+import re
+import sys
+import time
+
+from go_rand import GoRand
+from resource_definitions import RESOURCE_DEFINITION_FILE, load_resource_definitions
+
+CONVENTION_CAF_CLASSIC = 'cafclassic'
+CONVENTION_CAF_RANDOM = 'cafrandom'
+CONVENTION_RANDOM = 'random'
+CONVENTION_PASSTHROUGH = 'passthrough'
+
+DEFAULT_NAME_PRECEDENCE = ('name', 'slug', 'random', 'suffixes', 'prefixes')
+DEFAULT_SEPARATOR = '-'
+
+# randSeq draws from the first 25 letters, so 'z' is never generated
+ALPHA_GENERATOR = 'abcdefghijklmnopqrstuvwxyz'
+
+# Slugs getSlug returns with use_legacy_slug, hardcoded in resource_name.go
+LEGACY_SLUGS = {
+    'azurerm_mssql_database': 'database',
+    'azurerm_mssql_elasticpool': 'elasticpool',
+}
+
+# gen.go gives this resource the "st" slug in ResourceMaps whatever sorts first
+SLUG_MAP_OVERRIDES = {'st': 'azurerm_storage_account'}
+
+_GO_ESCAPES = {'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+               '\\': '\\', '"': '"', "'": "'"}
+_GO_ESCAPE = re.compile(r'\\(?:([abfnrtv\\"\'])|x([0-9A-Fa-f]{2})|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|([0-7]{3}))')
+
+# RE2 classes whose Python spelling differs: \s has no \v, POSIX classes are ASCII ranges
+_RE2_SPACE = '\\t\\n\\f\\r '
+_RE2_POSIX = {
+    'alnum': '0-9A-Za-z', 'alpha': 'A-Za-z', 'ascii': '\\x00-\\x7f', 'blank': '\\t ',
+    'cntrl': '\\x00-\\x1f\\x7f', 'digit': '0-9', 'graph': '!-~', 'lower': 'a-z',
+    'print': ' -~', 'punct': '!-/:-@\\[-`{-~', 'space': _RE2_SPACE, 'upper': 'A-Z',
+    'word': '0-9A-Za-z_', 'xdigit': '0-9A-Fa-f',
+}
+
+
+class NamingError(ValueError):
+    """A name the provider would refuse, with the provider's error message"""
+
+
+def go_unquote(literal):
+    """Value of a Go string literal as written in the definitions file ("..." or `...`)"""
+    if len(literal) >= 2 and literal[0] == literal[-1] == '`':
+        return literal[1:-1]
+    if len(literal) < 2 or literal[0] != '"' or literal[-1] != '"':
+        raise ValueError(f"not a Go string literal: {literal}")
+
+    def unescape(match):
+        simple, byte, short, wide, octal = match.groups()
+        if simple:
+            return _GO_ESCAPES[simple]
+        if octal:
+            return chr(int(octal, 8))
+        return chr(int(byte or short or wide, 16))
+
+    return _GO_ESCAPE.sub(unescape, literal[1:-1])
+
+
+def translate_go_regexp(pattern):
+    """Python re pattern matching what a Go (RE2) pattern matches.
+
+    Covers the RE2 syntax the definitions use: $ and \\z only match at the end
+    of the text, \\s is the ASCII space class without \\v and POSIX classes
+    are spelled out. Compile the result with re.ASCII so \\d and \\w stay ASCII.
+    """
+    out = []
+    i, in_class, n = 0, False, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == '\\' and i + 1 < n:
+            escaped = pattern[i + 1]
+            if escaped == 's':
+                out.append(_RE2_SPACE if in_class else f'[{_RE2_SPACE}]')
+            elif escaped == 'z' and not in_class:
+                out.append('\\Z')
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == '[' and pattern.startswith('[:', i):
+                end = pattern.find(':]', i + 2)
+                if end != -1 and pattern[i + 2:end] in _RE2_POSIX:
+                    out.append(_RE2_POSIX[pattern[i + 2:end]])
+                    i = end + 2
+                    continue
+                out.append('\\[')
+            elif char == '[':
+                out.append('\\[')
+            elif char == ']':
+                in_class = False
+                out.append(char)
+            else:
+                out.append(char)
+            i += 1
+            continue
+        if char == '[':
+            in_class = True
+            out.append(char)
+            i += 1
+            # A ] right after [ or [^ is a literal
+            if pattern.startswith('^', i):
+                out.append('^')
+                i += 1
+            if pattern.startswith(']', i):
+                out.append('\\]')
+                i += 1
+            continue
+        out.append('\\Z' if char == '$' else char)
+        i += 1
+    return ''.join(out)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_go_regexp(pattern):
+    """Compiled Python equivalent of a Go regexp, cached per pattern"""
+    try:
+        return re.compile(translate_go_regexp(pattern), re.ASCII)
+    except re.error as e:
+        raise ValueError(f"error parsing regexp: {e}: `{pattern}`") from None
+
+
+def byte_length(value):
+    """len() of a Go string: its length in UTF-8 bytes"""
+    return len(value) if value.isascii() else len(value.encode('utf-8', 'surrogateescape'))
+
+
+def go_to_lower(value):
+    """strings.ToLower, including its handling of bytes that are not valid UTF-8"""
+    if value.isascii():
+        return value.lower()
+    out = []
+    for char in value:
+        if '\udc80' <= char <= '\udcff':
+            # Map() rewrites an invalid byte as the replacement character
+            out.append('\ufffd')
+            continue
+        lower = char.lower()
+        # unicode.ToLower is a one-rune mapping; only U+0130 lowers to several characters in Python
+        out.append(lower if len(lower) == 1 else lower[0])
+    return ''.join(out)
+
+
+def _matchable(value):
+    """Text as Go's regexp sees it: every invalid UTF-8 byte is one U+FFFD rune"""
+    if value.isascii():
+        return value
+    return re.sub('[\udc80-\udcff]', '\ufffd', value)
+
+
+def rand_seq(length, seed=None):
+    """randSeq(): length letters for a seed; a missing or zero seed uses the current time"""
+    if length <= 0:
+        return ''
+    if not seed:
+        seed = time.time_ns()
+    generator = GoRand(seed)
+    return ''.join(ALPHA_GENERATOR[generator.intn(len(ALPHA_GENERATOR) - 1)] for _ in range(length))
+
+
+def trim_resource_name(resource_name, max_length):
+    """trimResourceName(): the first max_length bytes of the name"""
+    if byte_length(resource_name) <= max_length:
+        return resource_name
+    if resource_name.isascii():
+        return resource_name[:max_length]
+    return resource_name.encode('utf-8', 'surrogateescape')[:max_length].decode('utf-8', 'surrogateescape')
+
+
+def compose_name(separator, prefixes, name, slug, suffixes, random_suffix, max_length,
+                 name_precedence=DEFAULT_NAME_PRECEDENCE):
+    """composeName(): assemble the parts in precedence order while they fit in max_length.
+
+    name, random and suffixes are appended, slug and prefixes prepended;
+    suffixes are taken first to last and prefixes last to first, each one
+    holding its precedence step until the list is consumed.
+    """
+    contents = []
+    current_length = 0
+    separator_length = byte_length(separator)
+    suffixes, prefixes = list(suffixes), list(prefixes)
+    i = 0
+    while i < len(name_precedence):
+        initialized = separator_length if contents else 0
+        part = name_precedence[i]
+        if part == 'name':
+            length = byte_length(name)
+            if length and current_length + length + initialized <= max_length:
+                contents.append(name)
+                current_length += length + initialized
+        elif part == 'slug':
+            length = byte_length(slug)
+            if length and current_length + length + initialized <= max_length:
+                contents.insert(0, slug)
+                current_length += length + initialized
+        elif part == 'random':
+            length = byte_length(random_suffix)
+            if length and current_length + length + initialized <= max_length:
+                contents.append(random_suffix)
+                current_length += length + initialized
+        elif part == 'suffixes':
+            if suffixes:
+                suffix = suffixes.pop(0)
+                length = byte_length(suffix)
+                if length and current_length + length + initialized <= max_length:
+                    contents.append(suffix)
+                    current_length += length + initialized
+                if suffixes:
+                    continue
+        elif part == 'prefixes':
+            if prefixes:
+                prefix = prefixes.pop()
+                length = byte_length(prefix)
+                if length and current_length + length + initialized <= max_length:
+                    contents.insert(0, prefix)
+                    current_length += length + initialized
+                if prefixes:
+                    continue
+        i += 1
+    return separator.join(contents)
+
+
+class CafNamingEngine:
+    """Name generation against a definitions file, with the rules of each resource type compiled once"""
+
+    def __init__(self, resources):
+        # Sorted like gen.go, which decides which resource owns a shared slug
+        resources = sorted(resources, key=lambda r: r.get('name', ''))
+        self.definitions = {}
+        self.resource_maps = {}
+        for resource in resources:
+            name = resource.get('name', '')
+            self.definitions[name] = resource
+            self.resource_maps.setdefault(resource.get('slug', ''), name)
+        for slug, name in SLUG_MAP_OVERRIDES.items():
+            if self.definitions.get(name, {}).get('slug') == slug:
+                self.resource_maps[slug] = name
+        self._rules = {}
+
+    @classmethod
+    def load(cls, path=RESOURCE_DEFINITION_FILE):
+        return cls(load_resource_definitions(path))
+
+    def get_resource(self, resource_type):
+        """getResource(): the definition for a resource type or slug"""
+        resource_type = self.resource_maps.get(resource_type, resource_type)
+        resource = self.definitions.get(resource_type)
+        if resource is None:
+            raise NamingError(f"invalid resource type {resource_type}")
+        return resource
+
+    def rules(self, resource):
+        """(cleaning regex, validation pattern, validation regex) of a definition, compiled once per type"""
+        name = resource.get('name', '')
+        rules = self._rules.get(name)
+        if rules is None:
+            validation = go_unquote(resource.get('validation_regex', '""'))
+            rules = self._rules[name] = (compile_go_regexp(go_unquote(resource.get('regex', '""'))),
+                                         validation, compile_go_regexp(validation))
+        return rules
+
+    def get_slug(self, resource_type, convention=CONVENTION_CAF_CLASSIC, use_legacy_slug=False):
+        """getSlug(): the slug of a resource type name for the CAF conventions, '' otherwise"""
+        if convention not in (CONVENTION_CAF_CLASSIC, CONVENTION_CAF_RANDOM):
+            return ''
+        if use_legacy_slug and resource_type in LEGACY_SLUGS:
+            return LEGACY_SLUGS[resource_type]
+        resource = self.definitions.get(resource_type)
+        return resource.get('slug', '') if resource is not None else ''
+
+    def clean_string(self, value, resource):
+        """cleanString(): remove every character the definition's cleaning regex matches"""
+        return self.rules(resource)[0].sub('', value)
+
+    def get_resource_name(self, resource_type, separator=DEFAULT_SEPARATOR, prefixes=(), name='', suffixes=(),
+                          random_suffix='', convention=CONVENTION_CAF_CLASSIC, clean_input=True, passthrough=False,
+                          use_slug=True, use_legacy_slug=False, name_precedence=DEFAULT_NAME_PRECEDENCE):
+        """getResourceName(): the validated name of one resource type; raises NamingError"""
+        resource = self.get_resource(resource_type)
+        clean, validation, validation_regex = self.rules(resource)
+        slug = self.get_slug(resource_type, convention, use_legacy_slug) if use_slug else ''
+        if clean_input:
+            prefixes = [clean.sub('', prefix) for prefix in prefixes]
+            suffixes = [clean.sub('', suffix) for suffix in suffixes]
+            name = clean.sub('', name)
+            separator = clean.sub('', separator)
+            random_suffix = clean.sub('', random_suffix)
+
+        max_length = resource.get('max_length', 0)
+        if passthrough:
+            resource_name = name
+        else:
+            resource_name = compose_name(separator, prefixes, name, slug, suffixes, random_suffix, max_length,
+                                         name_precedence)
+        resource_name = trim_resource_name(resource_name, max_length)
+        if resource.get('lowercase', False):
+            resource_name = go_to_lower(resource_name)
+
+        if not validation_regex.search(_matchable(resource_name)):
+            raise NamingError(f"invalid name for CAF naming {resource.get('name', '')} {name}, "
+                              f"the pattern {validation} doesn't match {resource_name}")
+        return resource_name
+
+    def validate_resource_type(self, resource_type='', resource_types=()):
+        """validateResourceType(): raises NamingError listing every unknown type"""
+        if not resource_type and not resource_types:
+            raise NamingError("resource_type and resource_types parameters are empty, "
+                              "you must specify at least one resource type")
+        errors = []
+        for candidate in list(resource_types) + ([resource_type] if resource_type else []):
+            try:
+                self.get_resource(candidate)
+            except NamingError as e:
+                errors.append(str(e))
+        if errors:
+            raise NamingError('\n'.join(errors))
+
+    def name_result(self, resource_type='', resource_types=(), name='', prefixes=(), suffixes=(),
+                    separator=DEFAULT_SEPARATOR, random_length=0, random_seed=0, clean_input=True,
+                    passthrough=False, use_slug=True, use_legacy_slug=False):
+        """getNameResult(): (result, results) of an azurecaf_name resource; raises NamingError.
+
+        result is None without resource_type, results maps each of resource_types
+        to its name. Every name shares one random suffix, as in the provider.
+        """
+        if random_length < 0:
+            raise NamingError(f"random_length must be non-negative, got: {random_length}")
+        if resource_type and resource_type in self.definitions:
+            max_length = self.definitions[resource_type].get('max_length', 0)
+            if random_length > max_length:
+                raise NamingError(f"random_length ({random_length}) exceeds maximum length "
+                                  f"for resource type {resource_type} ({max_length})")
+        random_suffix = rand_seq(random_length, random_seed)
+        self.validate_resource_type(resource_type, resource_types)
+
+        def resource_name(type_name):
+            return self.get_resource_name(type_name, separator, prefixes, name, suffixes, random_suffix,
+                                          CONVENTION_CAF_CLASSIC, clean_input, passthrough, use_slug,
+                                          use_legacy_slug)
+
+        result = resource_name(resource_type) if resource_type else None
+        results = {type_name: resource_name(type_name) for type_name in resource_types}
+        return result, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate azurecaf_name results without running the provider')
+    parser.add_argument('--type', dest='types', action='append', required=True, metavar='TYPE',
+                        help='resource type or slug, repeatable (the first is resource_type)')
+    parser.add_argument('--name', default='', help='name to build on')
+    parser.add_argument('--prefix', dest='prefixes', action='append', default=[], help='prefix, repeatable')
+    parser.add_argument('--suffix', dest='suffixes', action='append', default=[], help='suffix, repeatable')
+    parser.add_argument('--separator', default=DEFAULT_SEPARATOR, help='separator between the name parts')
+    parser.add_argument('--random-length', type=int, default=0, help='number of random characters')
+    parser.add_argument('--random-seed', type=int, default=0, help='seed of the random characters (0: time based)')
+    parser.add_argument('--no-clean-input', dest='clean_input', action='store_false', help='keep invalid characters')
+    parser.add_argument('--passthrough', action='store_true', help='only clean and validate the name')
+    parser.add_argument('--no-slug', dest='use_slug', action='store_false', help='leave the slug out')
+    parser.add_argument('--legacy-slug', action='store_true', help='use the slugs of provider v3')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file')
+    args = parser.parse_args()
+
+    try:
+        engine = CafNamingEngine.load(args.file)
+        result, results = engine.name_result(
+            args.types[0], args.types[1:], args.name, args.prefixes, args.suffixes, args.separator,
+            args.random_length, args.random_seed, args.clean_input, args.passthrough, args.use_slug,
+            args.legacy_slug)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.types[0]}: {result}")
+    for type_name, resource_name in results.items():
+        print(f"{type_name}: {resource_name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark regression check for the azurecaf naming functions
+
+Runs the Go benchmarks of the azurecaf package (or reads saved `go test
+-bench` output) and compares ns/op and allocs/op with the committed
+baseline. When a benchmark ran several times (-count), the median is used.
+
+Timings are compared relative to BenchmarkReference, a fixed workload that
+does not depend on the provider code: a benchmark regresses when its ns/op
+grows by more than --threshold percent beyond what the change of the
+reference explains, or when its allocs/op grows by at least one allocation.
+Without the reference in both runs, absolute ns/op are compared.
+
+The check is advisory: regressions are reported and the exit code stays 0
+unless --strict is given, as shared CI machines are too noisy to gate on.
+A baseline must hold every benchmark in REQUIRED_BENCHMARKS: --update refuses
+to write one without them, and a committed baseline missing some is reported
+(an error with --strict) until it is regenerated on the full module.
+
+Usage:
+    python3 tools/automation/check_benchmarks.py [--baseline PATH] [--threshold PCT] [--strict]
+        [--bench REGEX] [--count N] [--benchtime D] [--update] [INPUT|-]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BASELINE_FILE = 'azurecaf/testdata/benchmarks.txt'
+BENCH_PACKAGE = './azurecaf'
+DEFAULT_THRESHOLD = 20.0
+DEFAULT_COUNT = 5
+DEFAULT_BENCHTIME = '1s'
+REFERENCE_BENCHMARK = 'BenchmarkReference'
+# Benchmarks (with their sub-benchmarks) a baseline must hold to cover the naming path
+REQUIRED_BENCHMARKS = (
+    REFERENCE_BENCHMARK, 'BenchmarkComposeName', 'BenchmarkGetResourceName', 'BenchmarkCleanString',
+    'BenchmarkGetResource', 'BenchmarkValidateResourceType', 'BenchmarkRandSeq', 'BenchmarkGetNameResult',
+)
+# An increase below one allocation is rounding in the per-op average
+ALLOCS_TOLERANCE = 1.0
+
+_BENCH_LINE = re.compile(r'^(Benchmark\S+?)(?:-\d+)?\s+\d+\s+([\d.]+) ns/op(.*)$')
+_ALLOCS = re.compile(r'([\d.]+) allocs/op')
+
+
+def parse_benchmarks(lines):
+    """{name: (ns/op, allocs/op or None)} with the median of repeated runs"""
+    runs = {}
+    for line in lines:
+        match = _BENCH_LINE.match(line.strip())
+        if not match:
+            continue
+        name, ns, rest = match.groups()
+        allocs = _ALLOCS.search(rest)
+        samples = runs.setdefault(name, ([], []))
+        samples[0].append(float(ns))
+        if allocs:
+            samples[1].append(float(allocs.group(1)))
+    return {
+        name: (statistics.median(ns), statistics.median(allocs) if allocs else None)
+        for name, (ns, allocs) in runs.items()
+    }
+
+
+def run_benchmarks(bench, count, benchtime):
+    """Output lines of `go test -bench` on the azurecaf package, with the reference benchmark"""
+    patterns = [bench] if bench == '.' else [f'^{REFERENCE_BENCHMARK}$', bench]
+    lines = []
+    for pattern in patterns:
+        command = ['go', 'test', '-run', '^$', '-bench', pattern, '-benchmem',
+                   '-count', str(count), '-benchtime', benchtime, BENCH_PACKAGE]
+        print(f"⏱️  {' '.join(command)}", file=sys.stderr)
+        result = subprocess.run(command, capture_output=True, text=True,
+                                env={**os.environ, 'CHECKPOINT_DISABLE': '1'})
+        if result.returncode != 0:
+            sys.stderr.write(result.stdout + result.stderr)
+            raise RuntimeError(f"go test exited with {result.returncode}")
+        lines.extend(result.stdout.splitlines(keepends=True))
+    return lines
+
+
+def missing_required(results):
+    """REQUIRED_BENCHMARKS without a result of their own or of a sub-benchmark"""
+    families = {name.split('/', 1)[0] for name in results}
+    return [name for name in REQUIRED_BENCHMARKS if name not in families]
+
+
+def reference_scale(baseline, current):
+    """How much slower the current run is on the reference workload, or None without it"""
+    if REFERENCE_BENCHMARK in baseline and REFERENCE_BENCHMARK in current:
+        return current[REFERENCE_BENCHMARK][0] / baseline[REFERENCE_BENCHMARK][0]
+    return None
+
+
+def compare(baseline, current, threshold):
+    """Rows of (status, name, old ns, new ns, ns change %, old allocs, new allocs) for the current
+    benchmarks; the change is relative to the reference benchmark when both runs have it"""
+    scale = reference_scale(baseline, current) or 1.0
+    rows = []
+    for name in sorted(current):
+        ns, allocs = current[name]
+        if name not in baseline:
+            rows.append(('new', name, None, ns, None, None, allocs))
+            continue
+        old_ns, old_allocs = baseline[name]
+        if name == REFERENCE_BENCHMARK:
+            rows.append(('reference', name, old_ns, ns, (ns - old_ns) / old_ns * 100, old_allocs, allocs))
+            continue
+        expected = old_ns * scale
+        change = (ns - expected) / expected * 100 if expected else 0.0
+        more_allocs = allocs is not None and old_allocs is not None and allocs - old_allocs >= ALLOCS_TOLERANCE
+        if change > threshold or more_allocs:
+            status = 'regression'
+        elif change < -threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        rows.append((status, name, old_ns, ns, change, old_allocs, allocs))
+    return rows
+
+
+_ICONS = {'regression': '🔴', 'improvement': '🟢', 'unchanged': '⚪', 'new': '🆕', 'reference': '📏'}
+
+
+def _number(value, digits=1):
+    return '-' if value is None else f'{value:.{digits}f}'
+
+
+def print_report(rows, threshold, not_run=0, relative=True, strict=False):
+    width = max((len(row[1]) for row in rows), default=10)
+    if relative:
+        print(f"📏 Changes are relative to {REFERENCE_BENCHMARK}")
+    else:
+        print(f"⚠️  {REFERENCE_BENCHMARK} is missing from a run; comparing absolute ns/op")
+    print(f"   {'benchmark':<{width}}  {'old ns/op':>12}  {'new ns/op':>12}  {'change':>8}  {'allocs/op':>13}")
+    for status, name, old_ns, ns, change, old_allocs, allocs in rows:
+        delta = '' if change is None else f'{change:+.1f}%'
+        allocs_text = f'{_number(old_allocs, 0)} → {_number(allocs, 0)}'
+        print(f"{_ICONS[status]} {name:<{width}}  {_number(old_ns):>12}  {_number(ns):>12}  {delta:>8}  {allocs_text:>13}")
+    regressions = sum(row[0] == 'regression' for row in rows)
+    print()
+    if not_run:
+        print(f"⚠️  {not_run} baseline benchmarks were not run")
+    if regressions:
+        icon = '❌' if strict else '⚠️ '
+        advisory = '' if strict else ' (advisory; --strict fails on it)'
+        print(f"{icon} {regressions} benchmarks regressed beyond {threshold:g}% ns/op or gained allocations{advisory}")
+    else:
+        print(f"✅ No regression beyond {threshold:g}% ns/op in {len(rows)} benchmarks")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the azurecaf Go benchmarks with the committed baseline')
+    parser.add_argument('input', metavar='INPUT', nargs='?',
+                        help="saved `go test -bench -benchmem` output, '-' for stdin (default: run the benchmarks)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='baseline benchmark output')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed ns/op increase in percent')
+    parser.add_argument('--bench', default='.', help='benchmarks to run (go test -bench)')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='runs of each benchmark')
+    parser.add_argument('--benchtime', default=DEFAULT_BENCHTIME, help='go test -benchtime')
+    parser.add_argument('--update', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--strict', action='store_true', help='exit with 1 when a benchmark regressed')
+    args = parser.parse_args()
+
+    try:
+        if args.input is None:
+            lines = run_benchmarks(args.bench, args.count, args.benchtime)
+        elif args.input == '-':
+            lines = sys.stdin.readlines()
+        else:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+    except (OSError, RuntimeError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    current = parse_benchmarks(lines)
+    if not current:
+        print("❌ Error: no benchmark results found", file=sys.stderr)
+        return 1
+
+    if args.update:
+        missing = missing_required(current)
+        if missing:
+            print(f"❌ Error: refusing to write a baseline without {', '.join(missing)}; "
+                  "run every benchmark on the full module", file=sys.stderr)
+            return 1
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        print(f"✅ Baseline of {len(current)} benchmarks written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = parse_benchmarks(f)
+    except OSError as e:
+        print(f"❌ Error: cannot read the baseline ({e}); create it with --update", file=sys.stderr)
+        return 1
+    not_run = len(set(baseline) - set(current))
+    relative = reference_scale(baseline, current) is not None
+    regressions = print_report(compare(baseline, current, args.threshold), args.threshold, not_run,
+                               relative, args.strict)
+    incomplete = missing_required(baseline)
+    if incomplete:
+        icon = '❌' if args.strict else '⚠️ '
+        print(f"{icon} The baseline lacks {', '.join(incomplete)}; regenerate it with `make bench_baseline` "
+              "on the full module")
+    return 1 if (regressions or incomplete) and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Byte-offset index for point lookups in a definitions file
+
+A sidecar file next to the definitions (.resourceDefinition.json.index) maps
+each resource name to the byte range of its record. The index is built with
+one full parse and records the size, mtime and SHA-256 of the file it
+describes; like the registry snapshot it is trusted while the size and mtime
+are unchanged, checked against the SHA-256 otherwise, and rebuilt when stale
+or truncated.
+
+DefinitionIndex memory-maps both files. The index stores fixed-size entries
+sorted by name, so a lookup is a binary search over the mapped index followed
+by decoding the one record it points at; neither file is read as a whole.
+
+Index layout (little-endian):
+    magic, header length (uint32), header (JSON), entries, names
+    entry: name offset (uint64), name length (uint32), start (uint64), end (uint64)
+
+Usage:
+    python3 tools/automation/definition_index.py [--file PATH] build
+    python3 tools/automation/definition_index.py [--file PATH] get NAME... [--field FIELD]...
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from result_cache import file_digest
+
+INDEX_MAGIC = b'AZCAFIDX'
+# Bump when the index layout changes
+INDEX_FORMAT = 1
+# An index written this close to the file mtime cannot trust the mtime alone
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+_HEADER_LENGTH = struct.Struct('<I')
+_ENTRY = struct.Struct('<QIQQ')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def index_path(path):
+    """Index file kept next to a definitions file"""
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f'.{filename}.index')
+
+
+def scan_offsets(data):
+    """Yield (name, start, end) byte ranges of the records of a definitions file's top-level array"""
+    text = data.decode('utf-8')
+    ascii_only = len(text) == len(data)
+    decoder = json.JSONDecoder()
+    # Character offset -> byte offset, advanced incrementally for non-ASCII files
+    char_pos, byte_pos = 0, 0
+
+    def byte_offset(pos):
+        nonlocal char_pos, byte_pos
+        if ascii_only:
+            return pos
+        byte_pos += len(text[char_pos:pos].encode('utf-8'))
+        char_pos = pos
+        return byte_pos
+
+    pos = _WHITESPACE.match(text).end()
+    if text[pos:pos + 1] != '[':
+        raise ValueError('indexing needs a top-level JSON array')
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text[pos:pos + 1] == ']':
+        return
+    while True:
+        resource, end = decoder.raw_decode(text, pos)
+        name = resource.get('name') if isinstance(resource, dict) else None
+        if isinstance(name, str):
+            yield name, byte_offset(pos), byte_offset(end)
+        pos = _WHITESPACE.match(text, end).end()
+        separator = text[pos:pos + 1]
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f"expected ',' or ']' in the top-level array, found {separator!r}")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
+
+def build_index(path=RESOURCE_DEFINITION_FILE):
+    """Write the index of a definitions file; returns the number of indexed records"""
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Sorted by encoded name for the binary search, then by position so the first record of a name wins
+    entries = sorted((name.encode('utf-8'), start, end) for name, start, end in scan_offsets(data))
+    header = json.dumps({
+        'format': INDEX_FORMAT, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_digest(path), 'written_ns': time.time_ns(), 'count': len(entries),
+    }).encode('utf-8')
+    names_offset = len(INDEX_MAGIC) + _HEADER_LENGTH.size + len(header) + _ENTRY.size * len(entries)
+    table, names = [], []
+    for name, start, end in entries:
+        table.append(_ENTRY.pack(names_offset, len(name), start, end))
+        names.append(name)
+        names_offset += len(name)
+
+    target = index_path(path)
+    tmp = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(INDEX_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            f.write(b''.join(table))
+            f.write(b''.join(names))
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return len(entries)
+
+
+def _read_header(index):
+    """Header of a mapped index and the offset of its entries, or None when it is not a
+    complete index: a truncated file would otherwise read as missing names"""
+    start = len(INDEX_MAGIC) + _HEADER_LENGTH.size
+    if len(index) < start or index[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+        return None
+    (length,) = _HEADER_LENGTH.unpack_from(index, len(INDEX_MAGIC))
+    try:
+        header = json.loads(index[start:start + length])
+    except ValueError:
+        return None
+    entries = start + length
+    count = header.get('count') if isinstance(header, dict) else None
+    if type(count) is not int or count < 0 or len(index) < entries + count * _ENTRY.size:
+        return None
+    # The names follow the entries in entry order, so the last name ends the file
+    names_offset = entries + count * _ENTRY.size
+    if count:
+        first = _ENTRY.unpack_from(index, entries)
+        last = _ENTRY.unpack_from(index, names_offset - _ENTRY.size)
+        if first[0] != names_offset or last[0] + last[1] != len(index):
+            return None
+    elif len(index) != names_offset:
+        return None
+    return header, entries
+
+
+def _map(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _refresh_header(path, index, header, entries):
+    """Rewrite a verified index with a new written_ns; the entries keep their offsets
+    while the header keeps its length, otherwise the index is rebuilt"""
+    header = json.dumps(dict(header, written_ns=time.time_ns())).encode('utf-8')
+    start = len(INDEX_MAGIC) + _HEADER_LENGTH.size
+    try:
+        if start + len(header) != entries:
+            build_index(path)
+            return
+        target = index_path(path)
+        tmp = f'{target}.{os.getpid()}.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(index[:start] + header)
+                f.write(index[entries:])
+            os.replace(tmp, target)
+        except OSError:
+            os.remove(tmp)
+            raise
+    except OSError:
+        # The refresh only saves later opens a hash; a read-only checkout keeps hashing
+        pass
+
+
+class DefinitionIndex:
+    """Point lookups of resource definitions through a memory-mapped file and its offset index"""
+
+    def __init__(self, path=RESOURCE_DEFINITION_FILE):
+        if os.path.isdir(path):
+            raise ValueError(f"{path} is a shard directory; use ShardedDefinitions for lookups")
+        self.path = path
+        self._data = self._index = None
+        self._open()
+
+    def _open(self):
+        stat = os.stat(self.path)
+        if not self._load_index(stat):
+            build_index(self.path)
+            if not self._load_index(os.stat(self.path), verify=False):
+                raise ValueError(f"could not index {self.path}")
+        self._data = _map(self.path)
+
+    def _load_index(self, stat, verify=True):
+        """Map the index if it describes the file as it is now"""
+        try:
+            index = _map(index_path(self.path))
+        except OSError:
+            return False
+        header = _read_header(index) if index is not None else None
+        if header is None:
+            return False
+        header, entries = header
+        valid = header.get('format') == INDEX_FORMAT and header.get('size') == stat.st_size
+        if valid and verify:
+            # Trust an unchanged mtime only if the index was written well after it
+            trusted = header.get('mtime_ns') == stat.st_mtime_ns and \
+                header.get('written_ns', 0) - stat.st_mtime_ns > RACY_WINDOW_NS
+            valid = trusted or header.get('sha256') == file_digest(self.path)
+            if valid and not trusted and time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+                # An index built right after the file was written would be hashed on every
+                # open; now that the mtime is old enough, record it as trusted once
+                _refresh_header(self.path, index, dict(header, mtime_ns=stat.st_mtime_ns), entries)
+        if not valid:
+            index.close()
+            return False
+        self._index, self._entries, self._count = index, entries, header['count']
+        return True
+
+    def close(self):
+        for mapped in (self._data, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._data = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, i):
+        return _ENTRY.unpack_from(self._index, self._entries + i * _ENTRY.size)
+
+    def _name(self, entry):
+        return self._index[entry[0]:entry[0] + entry[1]]
+
+    def span(self, name):
+        """(start, end) byte range of a resource's record, or None when it is not in the file"""
+        key = name.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(self._entry(middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            entry = self._entry(low)
+            if self._name(entry) == key:
+                return entry[2], entry[3]
+        return None
+
+    def get(self, name, default=None):
+        """Definition of a resource, decoding only its record"""
+        span = self.span(name)
+        if span is None:
+            return default
+        return json.loads(self._data[span[0]:span[1]])
+
+    def __contains__(self, name):
+        return self.span(name) is not None
+
+    def names(self):
+        """Every indexed name, sorted by its UTF-8 encoding"""
+        return [self._name(self._entry(i)).decode('utf-8') for i in range(self._count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offset index for point lookups in a resource definition file')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('build', help='build or rebuild the index')
+    get = commands.add_parser('get', help='print the definitions of resources')
+    get.add_argument('names', nargs='+', metavar='NAME')
+    get.add_argument('--field', action='append', help='only print this field, repeatable')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            count = build_index(args.file)
+            print(f"✅ Indexed {count} resources of {args.file} in {index_path(args.file)}")
+            return 0
+        missing = 0
+        with DefinitionIndex(args.file) as index:
+            for name in args.names:
+                resource = index.get(name)
+                if resource is None:
+                    print(f"❌ {name} not found", file=sys.stderr)
+                    missing += 1
+                    continue
+                if args.field:
+                    resource = {field: resource.get(field) for field in args.field}
+                print(json.dumps(resource, ensure_ascii=False))
+        return 1 if missing else 0
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
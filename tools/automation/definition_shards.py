@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Sharded resource definitions
+
+resourceDefinition.d/ optionally holds the definitions split into one file per
+azurerm_<service> prefix (resourceDefinition.d/key.json holds every
+azurerm_key_* resource), each in the canonical layout of resourceDefinition.json.
+Changes to different service families then touch different files, and a tool
+that only needs one family reads one shard.
+
+ShardedDefinitions loads shards lazily: get() and family() read the single
+shard a name or service belongs to, and only iterating over everything reads
+all of them. Shards are merged by name, so joining them rebuilds the
+monolithic resourceDefinition.json byte-for-byte for gen.go.
+
+load_resource_definitions() and iter_resource_definitions() accept the shard
+directory wherever they accept a definitions file.
+
+Usage:
+    python3 tools/automation/definition_shards.py split [--file PATH] [--directory DIR]
+    python3 tools/automation/definition_shards.py join [--file PATH] [--directory DIR]
+    python3 tools/automation/definition_shards.py check [--file PATH] [--directory DIR]
+"""
+
+import argparse
+import heapq
+import os
+import re
+import sys
+
+from resource_definitions import (
+    DEFAULT_JSON_BACKEND, RESOURCE_DEFINITION_FILE, canonical_resources, iter_encoded_definitions,
+    loads_resource_definitions, save_resource_definitions,
+)
+
+SHARD_DIRECTORY = 'resourceDefinition.d'
+SHARD_SUFFIX = '.json'
+# Shard of the names without an azurerm_<service> prefix usable as a file name
+OTHER_SHARD = '_other'
+
+_SHARD_KEY = re.compile(r'[a-z0-9]+')
+
+
+def shard_key(name):
+    """Shard of a resource name: its service token, as in azurerm_<service>_..."""
+    if type(name) is str:
+        parts = name.split('_', 2)
+        if len(parts) > 1 and _SHARD_KEY.fullmatch(parts[1]):
+            return parts[1]
+    return OTHER_SHARD
+
+
+def shard_path(directory, key):
+    return os.path.join(directory, key + SHARD_SUFFIX)
+
+
+def shard_keys(directory=SHARD_DIRECTORY):
+    """Sorted keys of the shards present in a shard directory"""
+    return sorted(entry[:-len(SHARD_SUFFIX)] for entry in os.listdir(directory)
+                  if entry.endswith(SHARD_SUFFIX) and not entry.startswith('.'))
+
+
+def _by_name(resource):
+    return resource.get('name', '')
+
+
+class ShardedDefinitions:
+    """Resource definitions of a shard directory, loaded one shard at a time"""
+
+    def __init__(self, directory=SHARD_DIRECTORY, backend=DEFAULT_JSON_BACKEND):
+        if not os.path.isdir(directory):
+            raise ValueError(f"{directory} is not a shard directory")
+        self.directory = directory
+        self.backend = backend
+        self._shards = {}
+        self._names = {}
+
+    def keys(self):
+        return shard_keys(self.directory)
+
+    def loaded(self):
+        """Keys of the shards read so far"""
+        return sorted(self._shards)
+
+    def shard(self, key):
+        """Definitions of one shard, [] when it does not exist"""
+        resources = self._shards.get(key)
+        if resources is None:
+            try:
+                with open(shard_path(self.directory, key), 'rb') as f:
+                    resources = loads_resource_definitions(f.read(), self.backend)
+            except FileNotFoundError:
+                resources = []
+            self._shards[key] = resources
+        return resources
+
+    def family(self, service):
+        """Definitions of every azurerm_<service>_* resource"""
+        return self.shard(service)
+
+    def get(self, name, default=None):
+        """Definition of a resource, reading only its shard"""
+        key = shard_key(name)
+        names = self._names.get(key)
+        if names is None:
+            names = self._names[key] = {}
+            for resource in self.shard(key):
+                names.setdefault(resource.get('name'), resource)
+        return names.get(name, default)
+
+    def __iter__(self):
+        """Every definition, in name order"""
+        return heapq.merge(*(self.shard(key) for key in self.keys()), key=_by_name)
+
+
+def load_sharded_definitions(directory=SHARD_DIRECTORY, backend=DEFAULT_JSON_BACKEND):
+    """Load every shard into one definitions list in name order"""
+    return list(ShardedDefinitions(directory, backend))
+
+
+def iter_sharded_definitions(directory=SHARD_DIRECTORY):
+    """Stream every shard, merged in name order; one definition per shard is held in memory"""
+    from stream_definitions import iter_resource_definitions
+    return heapq.merge(*(iter_resource_definitions(shard_path(directory, key)) for key in shard_keys(directory)),
+                       key=_by_name)
+
+
+def split_definitions(resources, directory=SHARD_DIRECTORY, backend=DEFAULT_JSON_BACKEND):
+    """Write definitions as shards, removing shards that no longer have resources.
+
+    Returns a dict of shard key -> number of resources.
+    """
+    shards = {}
+    for resource in canonical_resources(resources):
+        shards.setdefault(shard_key(resource.get('name')), []).append(resource)
+    os.makedirs(directory, exist_ok=True)
+    for key in shard_keys(directory):
+        if key not in shards:
+            os.remove(shard_path(directory, key))
+    for key, shard in shards.items():
+        save_resource_definitions(shard, shard_path(directory, key), backend, presorted=True)
+    return {key: len(shards[key]) for key in sorted(shards)}
+
+
+def join_shards(directory=SHARD_DIRECTORY, path=RESOURCE_DEFINITION_FILE, backend=DEFAULT_JSON_BACKEND):
+    """Rebuild the monolithic definitions file from the shards; returns the number of resources"""
+    count = 0
+
+    def counted():
+        nonlocal count
+        for resource in ShardedDefinitions(directory, backend):
+            count += 1
+            yield resource
+
+    save_resource_definitions(counted(), path, backend, presorted=True)
+    return count
+
+
+def shards_match(directory=SHARD_DIRECTORY, path=RESOURCE_DEFINITION_FILE):
+    """Whether joining the shards reproduces the monolithic file exactly"""
+    try:
+        with open(path, 'rb') as f:
+            current = f.read()
+    except FileNotFoundError:
+        return False
+    return b''.join(iter_encoded_definitions(ShardedDefinitions(directory), presorted=True)) == current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split resourceDefinition.json into shards or rebuild it from them')
+    parser.add_argument('command', choices=('split', 'join', 'check'))
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='monolithic resource definition file')
+    parser.add_argument('--directory', default=SHARD_DIRECTORY, help='shard directory')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'split':
+            from resource_definitions import load_resource_definitions
+            shards = split_definitions(load_resource_definitions(args.file), args.directory)
+            print(f"✅ Split {sum(shards.values())} resources from {args.file} into {len(shards)} shards in {args.directory}")
+        elif args.command == 'join':
+            count = join_shards(args.directory, args.file)
+            print(f"✅ Rebuilt {args.file} with {count} resources from {args.directory}")
+        elif shards_match(args.directory, args.file):
+            print(f"✅ {args.file} matches {args.directory}")
+        else:
+            print(f"❌ {args.file} and {args.directory} have diverged; rebuild {args.file} from the shards with "
+                  f"`make definitions` (join), or the shards from {args.file} with definition_shards.py split")
+            return 1
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
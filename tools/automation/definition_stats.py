@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Columnar statistics over resource definitions
+
+Loads the definitions once into NumPy column arrays (lengths as integers,
+scope, namespace and service category (the token after the provider prefix,
+like jq split("_")[1]) as small integer codes, flags as -1/0/1
+with -1 for a missing value) and answers the statistics and coverage queries of
+analyze_azure_resources.sh with vectorized operations instead of one jq pass
+per number.
+
+Usage:
+    python3 tools/automation/definition_stats.py [--file PATH] stats
+    python3 tools/automation/definition_stats.py [--file PATH] coverage
+    python3 tools/automation/definition_stats.py [--file PATH] histogram [--column COLUMN] [--bin-width N]
+    python3 tools/automation/definition_stats.py [--file PATH] budget [--separator-length N]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from resource_definitions import RESOURCE_DEFINITION_FILE, load_resource_definitions
+
+LENGTH_COLUMNS = ('min_length', 'max_length', 'slug_length')
+FLAG_COLUMNS = ('lowercase', 'dashes', 'out_of_doc')
+
+
+def _label(value):
+    """Render a value the way jq -r prints it"""
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return str(value).lower()
+    return str(value)
+
+
+def _sort_key(value):
+    # jq orders null < false < true < numbers < strings
+    if value is None:
+        return (0, 0, '')
+    if value is False or value is True:
+        return (1, int(value), '')
+    if isinstance(value, (int, float)):
+        return (2, value, '')
+    return (3, 0, str(value))
+
+
+def _code_dtype(count):
+    return np.int8 if count < 2 ** 7 else np.int16 if count < 2 ** 15 else np.int32
+
+
+# Flag value -> code: -1 missing, 0 false, 1 true (any other truthy value counts as 1)
+_FLAG_CODES = {None: -1, False: 0, True: 1}
+
+
+class DefinitionColumns:
+    """Resource definitions as column arrays"""
+
+    def __init__(self, resources):
+        names, slugs, min_length, max_length = [], [], [], []
+        lowercase, dashes, out_of_doc = [], [], []
+        scope_codes, namespace_codes, category_codes = {}, {}, {}
+        scope, namespace, category = [], [], []
+        # One pass over the definitions, filling every column
+        for r in resources:
+            get = r.get
+            name = get('name')
+            names.append(name)
+            slugs.append(get('slug'))
+            min_length.append(get('min_length') or 0)
+            max_length.append(get('max_length') or 0)
+            lowercase.append(_FLAG_CODES.get(get('lowercase'), 1))
+            dashes.append(_FLAG_CODES.get(get('dashes'), 1))
+            out_of_doc.append(_FLAG_CODES.get(get('out_of_doc'), 1))
+            official = get('official')
+            ns = official.get('resource_provider_namespace') if type(official) is dict else None
+            value = get('scope')
+            scope.append(scope_codes.setdefault(value, len(scope_codes)))
+            namespace.append(namespace_codes.setdefault(ns, len(namespace_codes)))
+            value = name.split('_', 2)[1] if type(name) is str and '_' in name else None
+            category.append(category_codes.setdefault(value, len(category_codes)))
+
+        self.count = len(names)
+        self.names = names
+        self.slugs = slugs
+        self.min_length = np.array(min_length, dtype=np.int32)
+        self.max_length = np.array(max_length, dtype=np.int32)
+        self.slug_length = np.array([len(s) if type(s) is str else 0 for s in slugs], dtype=np.int32)
+        self.lowercase = np.array(lowercase, dtype=np.int8)
+        self.dashes = np.array(dashes, dtype=np.int8)
+        self.out_of_doc = np.array(out_of_doc, dtype=np.int8)
+        self.scope, self.scope_labels = self._coded(scope, scope_codes)
+        self.namespace, self.namespace_labels = self._coded(namespace, namespace_codes)
+        self.category, self.category_labels = self._coded(category, category_codes)
+
+    @classmethod
+    def load(cls, path=RESOURCE_DEFINITION_FILE):
+        return cls(load_resource_definitions(path))
+
+    @staticmethod
+    def _coded(codes, labels):
+        """Code array and label list of a column encoded in first-seen order"""
+        return np.array(codes, dtype=_code_dtype(len(labels))), list(labels)
+
+    def _counts(self, codes, labels):
+        """Dict of label -> count for a coded column"""
+        counts = np.bincount(codes, minlength=len(labels))
+        return {labels[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def top(self, column, limit):
+        """The limit most frequent labels of a coded column with their counts.
+
+        Ordered like `sort -nr` on "label: count" lines: count descending, then
+        label descending. Missing labels are left out for the namespace column.
+        """
+        codes, labels = getattr(self, column), getattr(self, f'{column}_labels')
+        counts = np.bincount(codes, minlength=len(labels))
+        if column == 'namespace' and None in labels:
+            counts[labels.index(None)] = 0
+        present = np.flatnonzero(counts)
+        if len(present) > limit:
+            # Only labels tied with or above the limit-th count can make the cut
+            threshold = np.partition(counts[present], len(present) - limit)[len(present) - limit]
+            present = present[counts[present] >= threshold]
+        ranked = sorted(present, key=lambda i: (counts[i], _label(labels[i])), reverse=True)[:limit]
+        return [(labels[i], int(counts[i])) for i in ranked]
+
+    def scope_distribution(self):
+        """Resources per scope, in jq group_by order"""
+        counts = self._counts(self.scope, self.scope_labels)
+        return dict(sorted(counts.items(), key=lambda item: _sort_key(item[0])))
+
+    def namespace_distribution(self):
+        """Resources per official resource provider namespace (resources without one excluded)"""
+        return {ns: n for ns, n in self._counts(self.namespace, self.namespace_labels).items() if ns is not None}
+
+    def category_distribution(self):
+        """Resources per service category"""
+        return self._counts(self.category, self.category_labels)
+
+    def flag_breakdown(self, column):
+        """Counts of true, false and missing values of a flag column (one of FLAG_COLUMNS)"""
+        counts = np.bincount(getattr(self, column).astype(np.int16) + 1, minlength=3)
+        return {'true': int(counts[2]), 'false': int(counts[1]), 'missing': int(counts[0])}
+
+    def unique_slugs(self):
+        """Distinct slug values, counting '' and missing like jq unique does"""
+        return len(set(self.slugs))
+
+    def length_summary(self, column):
+        """floor(mean), min and max of a length column; missing lengths count as 0 like jq add"""
+        values = getattr(self, column)
+        if not len(values):
+            return {'average': 0, 'min': 0, 'max': 0}
+        return {'average': int(values.sum() // len(values)), 'min': int(values.min()), 'max': int(values.max())}
+
+    def length_histogram(self, column, bin_width=1):
+        """Dict of bucket start -> number of resources for a length column"""
+        values = getattr(self, column)
+        if not len(values):
+            return {}
+        counts = np.bincount(values // bin_width)
+        return {int(i) * bin_width: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def slug_budget(self, separator_length=1):
+        """How much of max_length the slug and its separator consume.
+
+        Returns the remaining characters per resource and the resources where
+        the slug alone leaves no room for a name.
+        """
+        remaining = self.max_length - self.slug_length - separator_length
+        has_slug = self.slug_length > 0
+        remaining = np.where(has_slug, remaining, self.max_length)
+        exhausted = np.flatnonzero(has_slug & (remaining < 1))
+        return remaining, [self.names[i] for i in exhausted]
+
+
+def print_statistics(columns):
+    print("📊 Azure Resource Statistics")
+    print("=============================")
+    print()
+    print(f"✅ Total resources: {columns.count}")
+    namespaces = columns.namespace_distribution()
+    print(f"✅ Resources with provider namespace: {sum(namespaces.values())}")
+    print(f"✅ Unique Azure providers: {len(namespaces)}")
+    print(f"✅ Unique slugs: {columns.unique_slugs()}")
+
+    print()
+    print("🔍 Resource Scopes:")
+    for scope, count in columns.scope_distribution().items():
+        print(f"  • {_label(scope)}: {count} resources")
+
+    print()
+    print("📏 Length Constraints:")
+    min_summary = columns.length_summary('min_length')
+    max_summary = columns.length_summary('max_length')
+    print(f"  • Average min length: {min_summary['average']}")
+    print(f"  • Average max length: {max_summary['average']}")
+    print(f"  • Shortest allowed: {min_summary['min']}")
+    print(f"  • Longest allowed: {max_summary['max']}")
+
+    print()
+    print("🔤 Case Requirements:")
+    lowercase = columns.flag_breakdown('lowercase')
+    print(f"  • Lowercase only: {lowercase['true']} resources")
+    print(f"  • Mixed case allowed: {lowercase['false']} resources")
+
+    print()
+    print("➖ Dash Requirements:")
+    dashes = columns.flag_breakdown('dashes')
+    print(f"  • Dashes allowed: {dashes['true']} resources")
+    print(f"  • No dashes: {dashes['false']} resources")
+
+    print()
+    print_budget(columns)
+
+
+def print_budget(columns, separator_length=1):
+    remaining, exhausted = columns.slug_budget(separator_length)
+    print("📐 Slug Length Budget:")
+    if columns.count:
+        print(f"  • Average slug length: {columns.slug_length.mean():.1f}")
+        print(f"  • Median characters left after slug: {int(np.median(remaining))}")
+        print(f"  • Resources with 5 or fewer characters left: {int(np.count_nonzero(remaining <= 5))}")
+    print(f"  • Resources whose slug leaves no room: {len(exhausted)}")
+    for name in exhausted:
+        print(f"    - {name}")
+
+
+def print_coverage(columns, limit=10):
+    print("📈 Coverage Analysis")
+    print("====================")
+    print()
+    print("🏢 Azure Provider Coverage:")
+    for namespace, count in columns.top('namespace', limit):
+        print(f"  • {namespace}: {count} resources")
+    print()
+    print(f"📊 Service Categories (Top {limit}):")
+    for category, count in columns.top('category', limit):
+        print(f"  • {_label(category)}: {count} resources")
+
+
+def print_histogram(columns, column, bin_width):
+    print(f"📊 {column} histogram (bin width {bin_width}):")
+    histogram = columns.length_histogram(column, bin_width)
+    peak = max(histogram.values(), default=0)
+    for start, count in histogram.items():
+        bar = '█' * max(1, round(40 * count / peak))
+        label = f"{start}" if bin_width == 1 else f"{start}-{start + bin_width - 1}"
+        print(f"  {label:>9} {count:>7} {bar}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized statistics over resource definitions')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to analyze')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('stats', help='resource statistics')
+    commands.add_parser('coverage', help='provider namespace and service category coverage')
+    histogram = commands.add_parser('histogram', help='histogram of a length column')
+    histogram.add_argument('--column', choices=LENGTH_COLUMNS, default='max_length')
+    histogram.add_argument('--bin-width', type=int, default=1)
+    budget = commands.add_parser('budget', help='slug length against the max_length budget')
+    budget.add_argument('--separator-length', type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        columns = DefinitionColumns.load(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading {args.file}: {e}")
+        return 1
+
+    if args.command == 'stats':
+        print_statistics(columns)
+    elif args.command == 'coverage':
+        print_coverage(columns)
+    elif args.command == 'histogram':
+        print_histogram(columns, args.column, max(1, args.bin_width))
+    else:
+        print_budget(columns, args.separator_length)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,30 +3,32 @@
 Duplicate slug detection and analysis
 """
 
-import json
+import argparse
 import sys
-from collections import Counter
 
-def detect_duplicates():
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from resource_registry import ResourceRegistry
+from result_cache import run_cached
+from stream_definitions import SlugStreamIndex, iter_resource_definitions, report_duplicate
+
+def detect_duplicates(path=RESOURCE_DEFINITION_FILE):
     try:
-        with open('resourceDefinition.json', 'r') as f:
-            resources = json.load(f)
+        registry = ResourceRegistry.load(path)
         
-        slugs = [r.get('slug', '') for r in resources if r.get('slug')]
-        slug_counts = Counter(slugs)
-        duplicates = {slug: count for slug, count in slug_counts.items() if count > 1}
+        duplicate_groups = registry.duplicate_slugs()
+        duplicates = {slug: len(group) for slug, group in duplicate_groups.items()}
         
         print(f"🔍 DUPLICATE DETECTION REPORT:")
         print("=" * 40)
-        print(f"📊 Total resources: {len(resources)}")
-        print(f"🏷️  Unique slugs: {len(set(slugs))}")
+        print(f"📊 Total resources: {len(registry)}")
+        print(f"🏷️  Unique slugs: {len(registry.slugs())}")
         print(f"❌ Duplicate slugs: {len(duplicates)}")
         
         if duplicates:
             print(f"\n❌ DUPLICATES FOUND:")
             for slug, count in sorted(duplicates.items(), key=lambda x: x[1], reverse=True):
                 print(f"Slug '{slug}' used by {count} resources:")
-                affected_resources = [r['name'] for r in resources if r.get('slug') == slug]
+                affected_resources = [r['name'] for r in duplicate_groups[slug]]
                 for resource in affected_resources:
                     print(f"  - {resource}")
                 print()
@@ -40,6 +42,46 @@ def detect_duplicates():
         print(f"❌ Detection error: {e}")
         return False
 
+def detect_duplicates_streaming(path=RESOURCE_DEFINITION_FILE):
+    """Report duplicates while parsing the file one resource at a time"""
+    try:
+        index = SlugStreamIndex()
+        
+        print(f"🔍 DUPLICATE DETECTION REPORT (streaming):")
+        print("=" * 40)
+        for resource in iter_resource_definitions(path):
+            name, slug = resource.get('name', ''), resource.get('slug', '')
+            duplicate = index.add(name, slug)
+            if duplicate:
+                report_duplicate(slug, name, duplicate)
+        
+        print(f"📊 Total resources: {index.total}")
+        print(f"🏷️  Unique slugs: {index.unique_slugs()}")
+        print(f"❌ Duplicate slugs: {index.duplicate_count}")
+        
+        if not index.duplicate_count:
+            print("\n✅ NO DUPLICATES FOUND - Perfect optimization!")
+            return True
+        
+        return False
+        
+    except Exception as e:
+        print(f"❌ Detection error: {e}")
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description='Report slugs used by more than one resource')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to check')
+    parser.add_argument('--no-cache', action='store_true', help='recompute the report instead of reusing a cached one')
+    parser.add_argument('--stream', action='store_true',
+                        help='parse one resource at a time with constant memory and print findings as they are found')
+    args = parser.parse_args()
+    if args.stream:
+        return 0 if detect_duplicates_streaming(args.file) else 1
+    # No rule set is involved: the report only depends on the definitions file and this script
+    return run_cached('detect_duplicates', 0, __file__,
+                      lambda: 0 if detect_duplicates(args.file) else 1,
+                      definitions_path=args.file, use_cache=not args.no_cache)
+
 if __name__ == "__main__":
-    success = detect_duplicates()
-    sys.exit(0 if success else 1)
+    sys.exit(main())
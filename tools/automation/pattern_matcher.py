@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick multi-pattern matcher used by the slug rule engine
+
+The automaton is built once from the pattern list and finds every pattern that
+occurs in a text in a single left-to-right scan, so matching cost depends on
+the length of the resource name and the number of hits, not on the number of
+patterns.
+"""
+
+from collections import deque
+
+
+class AhoCorasick:
+    """Finds every occurrence of a fixed set of strings in one scan"""
+
+    def __init__(self, patterns=()):
+        self.patterns = []
+        self._index = {}
+        # Trie transitions, failure links and the patterns ending at each state
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for pattern in patterns:
+            self._insert(pattern)
+        self._build()
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __contains__(self, pattern):
+        return pattern in self._index
+
+    def _insert(self, pattern):
+        if not pattern or pattern in self._index:
+            return
+        self._index[pattern] = len(self.patterns)
+        self.patterns.append(pattern)
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = (self._index[pattern],)
+
+    def _build(self):
+        # Breadth-first so the failure state of every node is finished before its children
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Patterns that are suffixes of this one end here too, longest first
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """Yield (start position, pattern) for every occurrence in text, by end position"""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in out[state]:
+                pattern = patterns[index]
+                yield position - len(pattern) + 1, pattern
+
+    def matches(self, text):
+        """Return a dict of matched pattern -> sorted start positions in text"""
+        found = {}
+        for start, pattern in self.iter_matches(text):
+            found.setdefault(pattern, []).append(start)
+        for starts in found.values():
+            starts.sort()
+        return found
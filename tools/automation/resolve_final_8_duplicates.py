@@ -5,40 +5,33 @@ Script para resolver los 8 duplicados restantes después de añadir recursos CAF
 
 import json
 import sys
-from collections import defaultdict
+
+from resource_registry import ResourceRegistry
 
 def load_resource_definitions():
     """Cargar definiciones de recursos desde resourceDefinition.json"""
     try:
-        with open('resourceDefinition.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data if isinstance(data, list) else data.get('azurerm', [])
+        return ResourceRegistry.load()
     except FileNotFoundError:
         print("❌ Error: No se encontró resourceDefinition.json")
-        return []
+        return ResourceRegistry()
     except json.JSONDecodeError:
         print("❌ Error: JSON inválido en resourceDefinition.json")
-        return []
+        return ResourceRegistry()
 
-def find_duplicates(resources):
-    """Encontrar recursos con slugs duplicados"""
-    slug_map = defaultdict(list)
-    for resource in resources:
-        slug = resource.get('slug', '')
-        if slug:
-            slug_map[slug].append(resource)
-    
-    duplicates = {slug: resources for slug, resources in slug_map.items() if len(resources) > 1}
-    return duplicates
+def find_duplicates(registry):
+    """Encontrar recursos con slugs duplicados usando el índice de slugs"""
+    return registry.duplicate_slugs()
 
-def resolve_remaining_duplicates(duplicates):
+def resolve_remaining_duplicates(duplicates, verbose=True):
     """Resolver los 8 duplicados específicos restantes"""
     fixes = []
     
     for slug, resources in duplicates.items():
-        print(f"\n🔧 Resolviendo duplicado para slug '{slug}':")
-        for i, resource in enumerate(resources):
-            print(f"   {i+1}. {resource['name']} (actual: '{resource['slug']}')")
+        if verbose:
+            print(f"\n🔧 Resolviendo duplicado para slug '{slug}':")
+            for i, resource in enumerate(resources):
+                print(f"   {i+1}. {resource['name']} (actual: '{resource['slug']}')")
         
         # Resolver duplicados específicos
         if slug == 'bot':
@@ -147,20 +140,28 @@ def resolve_remaining_duplicates(duplicates):
     
     return fixes
 
-def apply_fixes(resources, fixes):
-    """Aplicar las correcciones a los recursos"""
+def apply_fixes(registry, fixes, verbose=True):
+    """Aplicar las correcciones a los recursos y devolver la lista de correcciones"""
+    corrections = []
     for fix in fixes:
         resource = fix['resource']
-        resource['slug'] = fix['new_slug']
-        print(f"✅ {resource['name']}: '{fix['old_slug']}' → '{fix['new_slug']}' ({fix['reason']})")
+        registry.set_slug(resource['name'], fix['new_slug'])
+        correction = f"{resource['name']}: '{fix['old_slug']}' → '{fix['new_slug']}' ({fix['reason']})"
+        corrections.append(f"  • {correction}")
+        if verbose:
+            print(f"✅ {correction}")
     
-    return resources
+    return corrections
+
+def apply_final_8_resolution(registry, verbose=False):
+    """Resuelve en memoria los 8 duplicados restantes y devuelve las correcciones realizadas"""
+    fixes = resolve_remaining_duplicates(find_duplicates(registry), verbose)
+    return apply_fixes(registry, fixes, verbose)
 
-def save_resource_definitions(resources):
+def save_resource_definitions(registry):
     """Guardar definiciones de recursos actualizadas"""
     try:
-        with open('resourceDefinition.json', 'w', encoding='utf-8') as f:
-            json.dump(resources, f, indent=2, ensure_ascii=False)
+        registry.save()
         return True
     except Exception as e:
         print(f"❌ Error guardando archivo: {e}")
@@ -171,7 +172,8 @@ def main():
     print("=" * 80)
     
     # Cargar recursos
-    resources = load_resource_definitions()
+    registry = load_resource_definitions()
+    resources = registry.resources
     if not resources:
         print("❌ No se pudieron cargar los recursos")
         sys.exit(1)
@@ -179,7 +181,7 @@ def main():
     print(f"📦 Recursos cargados: {len(resources)}")
     
     # Encontrar duplicados
-    duplicates = find_duplicates(resources)
+    duplicates = find_duplicates(registry)
     if not duplicates:
         print("✅ No se encontraron duplicados")
         return
@@ -191,14 +193,15 @@ def main():
     print(f"\n🔧 Aplicando {len(fixes)} correcciones:")
     
     # Aplicar correcciones
-    updated_resources = apply_fixes(resources, fixes)
+    apply_fixes(registry, fixes)
+    updated_resources = resources
     
     # Guardar cambios
-    if save_resource_definitions(updated_resources):
+    if save_resource_definitions(registry):
         print(f"\n✅ Archivo actualizado correctamente")
         
         # Verificar resultado final
-        final_duplicates = find_duplicates(updated_resources)
+        final_duplicates = find_duplicates(registry)
         if final_duplicates:
             print(f"⚠️  Aún quedan {len(final_duplicates)} duplicados por resolver")
             for slug, dupes in final_duplicates.items():
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Shared loading and saving of resourceDefinition.json for the automation scripts
+
+Every writer goes through save_resource_definitions(), which emits one
+canonical layout: entries sorted by name, keys in CANONICAL_KEY_ORDER (unknown
+keys keep their order after the known ones), 2-space indentation, no ASCII
+escaping and a trailing newline. orjson is used when it is installed and the
+stdlib json module otherwise; both backends produce byte-identical output.
+"""
+
+import bisect
+import json
+import os
+import re
+import subprocess
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+RESOURCE_DEFINITION_FILE = 'resourceDefinition.json'
+
+CANONICAL_KEY_ORDER = (
+    'name', 'min_length', 'max_length', 'validation_regex', 'invalid-double-dash', 'scope',
+    'slug', 'legacy_slug', 'dashes', 'lowercase', 'regex', 'official', 'out_of_doc',
+)
+OFFICIAL_KEY_ORDER = ('slug', 'resource', 'resource_provider_namespace')
+
+JSON_BACKENDS = ('orjson', 'json') if orjson is not None else ('json',)
+DEFAULT_JSON_BACKEND = JSON_BACKENDS[0]
+
+
+# Key tuples already known to be in canonical order, per key order
+_canonical_orders = {}
+
+
+def _ordered(mapping, key_order):
+    keys = tuple(mapping)
+    known = _canonical_orders.setdefault(key_order, {})
+    if keys not in known:
+        ranked = [key for key in key_order if key in mapping]
+        known[keys] = list(keys[:len(ranked)]) == ranked
+    if known[keys]:
+        return mapping
+    ordered = {key: mapping[key] for key in key_order if key in mapping}
+    for key, value in mapping.items():
+        if key not in ordered:
+            ordered[key] = value
+    return ordered
+
+
+def canonical_resource(resource):
+    """Resource definition with its keys in canonical order.
+
+    Definitions already in canonical order are returned as is, others are copied.
+    """
+    official = resource.get('official')
+    if isinstance(official, dict):
+        canonical_official = _ordered(official, OFFICIAL_KEY_ORDER)
+        if canonical_official is not official:
+            resource = dict(resource, official=canonical_official)
+    return _ordered(resource, CANONICAL_KEY_ORDER)
+
+
+def canonical_resources(resources):
+    """Canonical copies of resource definitions, sorted by name"""
+    return sorted((canonical_resource(r) for r in resources), key=lambda r: r.get('name', ''))
+
+
+def _has_float(value):
+    for item in (value.values() if type(value) is dict else value):
+        kind = type(item)
+        if kind is float or ((kind is dict or kind is list) and _has_float(item)):
+            return True
+    return False
+
+
+def _encode(resource, backend):
+    # orjson writes float exponents differently (1e20 vs 1e+20); the schema has
+    # no floats, so records holding one simply go through json
+    if backend == 'orjson' and not _has_float(resource):
+        try:
+            return orjson.dumps(resource, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # orjson refuses integers wider than 64 bits; let json encode those
+            pass
+    return json.dumps(resource, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def iter_encoded_definitions(resources, backend=DEFAULT_JSON_BACKEND, presorted=False):
+    """Yield the canonical UTF-8 encoding of a definitions list record by record.
+
+    With presorted=True the resources are trusted to be sorted by name and are
+    encoded as they are iterated, so an iterator is never held in memory.
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"unsupported JSON backend {backend!r}, expected one of {', '.join(JSON_BACKENDS)}")
+    first = True
+    ordered = map(canonical_resource, resources) if presorted else canonical_resources(resources)
+    for resource in ordered:
+        # Nest the standalone record one level deeper; strings never hold a raw newline
+        record = b'  ' + _encode(resource, backend).replace(b'\n', b'\n  ')
+        yield (b'[\n' if first else b',\n') + record
+        first = False
+    yield b'[]\n' if first else b'\n]\n'
+
+
+def dumps_resource_definitions(resources, backend=DEFAULT_JSON_BACKEND):
+    """Canonical UTF-8 encoding of a definitions list"""
+    return b''.join(iter_encoded_definitions(resources, backend))
+
+
+def loads_resource_definitions(data, backend=DEFAULT_JSON_BACKEND):
+    """Parse the content of a definitions file"""
+    if backend == 'orjson':
+        data = orjson.loads(data)
+    else:
+        data = json.loads(data)
+    # The file is a plain array; older layouts nested it under 'azurerm'
+    return data if isinstance(data, list) else data.get('azurerm', [])
+
+
+def load_resource_definitions(path=RESOURCE_DEFINITION_FILE, backend=DEFAULT_JSON_BACKEND):
+    """Load the resource definitions list from a definitions file or shard directory"""
+    if os.path.isdir(path):
+        from definition_shards import load_sharded_definitions
+        return load_sharded_definitions(path, backend)
+    with open(path, 'rb') as f:
+        return loads_resource_definitions(f.read(), backend)
+
+
+def save_resource_definitions(resources, path=RESOURCE_DEFINITION_FILE, backend=DEFAULT_JSON_BACKEND, presorted=False):
+    """Write a resource definitions list to a definitions file in canonical layout"""
+    with open(path, 'wb') as f:
+        for chunk in iter_encoded_definitions(resources, backend, presorted):
+            f.write(chunk)
+
+
+def load_resource_definitions_at(revision, path=RESOURCE_DEFINITION_FILE, backend=DEFAULT_JSON_BACKEND):
+    """Load the definitions file as it was at a git revision.
+
+    Raises ValueError when git cannot provide the file at that revision.
+    """
+    if os.path.isdir(path):
+        raise ValueError(f"{path} is a shard directory; compare its joined definitions file instead")
+    directory, filename = os.path.split(os.path.abspath(path))
+    result = subprocess.run(['git', 'show', f'{revision}:./{filename}'], cwd=directory, capture_output=True)
+    if result.returncode != 0:
+        raise ValueError(result.stderr.decode('utf-8', 'replace').strip() or f'git show {revision} failed')
+    return loads_resource_definitions(result.stdout, backend)
+
+
+def diff_resource_definitions(old, new):
+    """Keyed diff of two definitions lists by name.
+
+    Returns (added, changed, removed) lists of definitions; added and changed
+    hold the new definitions, removed the old ones.
+    """
+    old_by_name = {r.get('name', ''): r for r in old}
+    added, changed = [], []
+    for resource in new:
+        previous = old_by_name.pop(resource.get('name', ''), None)
+        if previous is None:
+            added.append(resource)
+        elif previous != resource:
+            changed.append(resource)
+    return added, changed, list(old_by_name.values())
+
+
+# A record in canonical layout: a 2-space indented brace line followed by its name
+_RECORD_START = re.compile(rb'^  \{\n    "name": ("(?:[^"\\]|\\.)*")', re.M)
+_RECORD_BRACE = re.compile(rb'^  \{$', re.M)
+_DIFF_HUNK = re.compile(rb'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@', re.M)
+_DIFF_NAME = re.compile(rb'^([-+])    "name": ("(?:[^"\\]|\\.)*")', re.M)
+
+
+def _git(args, directory):
+    result = subprocess.run(['git', *args], cwd=directory, capture_output=True)
+    if result.returncode != 0:
+        raise ValueError(result.stderr.decode('utf-8', 'replace').strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+def diff_resource_definitions_since(revision, path=RESOURCE_DEFINITION_FILE):
+    """Names of the definitions added, changed and removed since a git revision.
+
+    Reads `git diff -U0` of the file instead of parsing it at the revision: in
+    canonical layout every record starts with a `  {` line followed by its
+    name, so the changed line ranges map straight to the records they touch.
+    Returns (added, changed, removed) lists of names, or None when the file is
+    not in canonical layout. Raises ValueError for a shard directory or when
+    git cannot diff the file.
+    """
+    if os.path.isdir(path):
+        raise ValueError(f"{path} is a shard directory; compare its joined definitions file instead")
+    directory, filename = os.path.split(os.path.abspath(path))
+    diff = _git(['diff', '--no-color', '--no-ext-diff', '-U0', revision, '--', filename], directory)
+    if not diff:
+        # An untracked file has no diff either; make sure git knows it
+        _git(['ls-files', '--error-unmatch', '--', filename], directory)
+        return [], [], []
+    with open(path, 'rb') as f:
+        data = f.read()
+    starts = list(_RECORD_START.finditer(data))
+    if len(starts) != len(_RECORD_BRACE.findall(data)) or (not starts and data.strip() != b'[]'):
+        return None
+    # First line and name of every record, in file order
+    first_lines, names = [], []
+    line, offset = 1, 0
+    for match in starts:
+        line += data.count(b'\n', offset, match.start())
+        offset = match.start()
+        first_lines.append(line)
+        names.append(json.loads(match.group(1)))
+    # The last record ends before the closing bracket line
+    position = {name: i for i, name in enumerate(names)}
+    last_lines = [next_first - 1 for next_first in first_lines[1:]] + [line + data.count(b'\n', offset) - 2]
+
+    hunks = list(_DIFF_HUNK.finditer(diff))
+    named = {b'-': set(), b'+': set()}
+    touched = set()
+    for n, hunk in enumerate(hunks):
+        body = diff[hunk.end():hunks[n + 1].start() if n + 1 < len(hunks) else len(diff)]
+        hunk_named = {b'-': set(), b'+': set()}
+        for sign, name in _DIFF_NAME.findall(body):
+            hunk_named[sign].add(json.loads(name))
+        named[b'-'] |= hunk_named[b'-']
+        named[b'+'] |= hunk_named[b'+']
+        removed_count, start, count = int(hunk.group(1) or 1), int(hunk.group(2)), int(hunk.group(3) or 1)
+        inserted = [position[name] for name in hunk_named[b'+'] if name in position]
+        if removed_count == 0 and count == sum(last_lines[i] - first_lines[i] + 1 for i in inserted):
+            # Only whole records inserted; their lines may be aligned across a similar neighbour
+            touched.update(inserted)
+            continue
+        if count == 0:
+            # Lines were only deleted, between lines start and start + 1
+            if hunk_named[b'-']:
+                continue  # whole records removed
+            first, last = start, start + 1
+        else:
+            first, last = start, start + count - 1
+        # The opening and closing brace lines of a record shift as neighbours are added or
+        # removed, so only a change strictly inside a record touches it
+        for i in range(max(bisect.bisect_right(first_lines, first) - 1, 0), bisect.bisect_right(first_lines, last)):
+            if first < last_lines[i] and last > first_lines[i]:
+                touched.add(i)
+    added, changed = [], []
+    for i in sorted(touched):
+        name = names[i]
+        (added if name in named[b'+'] and name not in named[b'-'] else changed).append(name)
+    removed = sorted(name for name in named[b'-'] - named[b'+'] if name not in position)
+    return added, changed, removed
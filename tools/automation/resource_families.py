@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Resource families and slug consistency
+
+Clusters every resource into a family with a token trie over the resource
+names (azurerm_api_management_api_policy → api / management / api / policy).
+A family root is a resource no other resource name is a token prefix of, and
+its family is every resource below it in the trie (azurerm_api_management
+roots azurerm_api_management_api, azurerm_api_management_api_policy, ...).
+
+The report lists the family members whose slug does not start with the slug
+of their family root, which is what the hand-curated families of the
+related_resources layer in slug_rules.json keep consistent. Members using
+their official CAF slug are flagged as such, since those are expected to
+differ. Building the trie and walking it are one pass over the name tokens.
+
+Usage:
+    python3 tools/automation/resource_families.py [--file PATH] [--json] [--strict]
+"""
+
+import argparse
+import json
+import sys
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from slug_solver import name_tokens
+from stream_definitions import iter_resource_definitions
+
+# Key of the resource ending at a trie node; trie edges are name tokens, never empty
+_RESOURCE = ''
+
+
+class FamilyTrie:
+    """Token trie of resource names"""
+
+    def __init__(self, resources=()):
+        self._root = {}
+        self.total = 0
+        for resource in resources:
+            official = resource.get('official')
+            official_slug = official.get('slug') if isinstance(official, dict) else None
+            self.add(resource.get('name', ''), resource.get('slug', ''), official_slug)
+
+    def add(self, name, slug, official_slug=None):
+        self.total += 1
+        node = self._root
+        for token in name_tokens(name) or [name]:
+            child = node.get(token)
+            if child is None:
+                child = node[token] = {}
+            node = child
+        node[_RESOURCE] = (name, slug or '', bool(slug) and slug == official_slug)
+
+    def families(self):
+        """List of (root, members) for every family with members, in name order.
+
+        root and members are (name, slug, uses official slug) tuples.
+        """
+        families = []
+        stack = [(self._root, None)]
+        while stack:
+            node, family = stack.pop()
+            resource = node.get(_RESOURCE)
+            if resource is not None:
+                if family is None:
+                    family = (resource, [])
+                    families.append(family)
+                else:
+                    family[1].append(resource)
+            # Reversed so the stack pops tokens in sorted order
+            for token in sorted((t for t in node if t != _RESOURCE), reverse=True):
+                stack.append((node[token], family))
+        return [(root, sorted(members)) for root, members in families if members]
+
+    def analyze(self):
+        """Families and the members whose slug does not start with their root's slug"""
+        families = self.families()
+        inconsistent = []
+        for (root, root_slug, _), members in families:
+            if not root_slug:
+                continue
+            for name, slug, official in members:
+                if not slug.startswith(root_slug):
+                    inconsistent.append({'name': name, 'slug': slug, 'official': official,
+                                         'root': root, 'root_slug': root_slug})
+        return {
+            'total_resources': self.total,
+            'families': len(families),
+            'family_members': sum(len(members) for _, members in families),
+            'inconsistent': inconsistent,
+            'roots': {root[0]: [member[0] for member in members] for root, members in families},
+        }
+
+
+def analyze_families(path=RESOURCE_DEFINITION_FILE):
+    """Family report of a definitions file"""
+    return FamilyTrie(iter_resource_definitions(path)).analyze()
+
+
+def print_report(report):
+    print("🌳 RESOURCE FAMILY REPORT:")
+    print("=" * 60)
+    print(f"📊 Total resources: {report['total_resources']}")
+    print(f"👪 Families: {report['families']} ({report['family_members']} members below a root)")
+    inconsistent = report['inconsistent']
+    if not inconsistent:
+        print("\n✅ Every family member's slug starts with its root's slug")
+        return
+    official = sum(1 for entry in inconsistent if entry['official'])
+    print(f"⚠️  Members whose slug does not start with the root's slug: {len(inconsistent)} ({official} official)")
+    root = None
+    for entry in inconsistent:
+        if entry['root'] != root:
+            root = entry['root']
+            print(f"\n{root} ('{entry['root_slug']}'):")
+        print(f"  - {entry['name']}: '{entry['slug']}'{' (official CAF slug)' if entry['official'] else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cluster resources into families and check slug consistency')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to analyze')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument('--strict', action='store_true', help='exit with 1 when a member without an official slug is inconsistent')
+    args = parser.parse_args()
+
+    try:
+        report = analyze_families(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if args.strict and any(not entry['official'] for entry in report['inconsistent']) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
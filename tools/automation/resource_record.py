@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Compact record type for resource definitions
+
+ResourceRecord stores the fields gen.go's ResourceStructure knows about in
+__slots__ instead of a per-resource dict. The original key order is kept as an
+interned tuple shared by every record with the same layout, and the strings
+that repeat across thousands of definitions (scope, regexes, official names)
+are interned, so large merged definition files take a fraction of the memory
+of the dict representation. to_dict() reproduces the source definition exactly,
+including key order and keys the record does not know about.
+"""
+
+import sys
+
+from resource_definitions import RESOURCE_DEFINITION_FILE, load_resource_definitions
+
+# JSON key -> attribute name of every field of ResourceStructure
+RECORD_FIELDS = {
+    'name': 'name',
+    'slug': 'slug',
+    'legacy_slug': 'legacy_slug',
+    'min_length': 'min_length',
+    'max_length': 'max_length',
+    'lowercase': 'lowercase',
+    'regex': 'regex',
+    'validation_regex': 'validation_regex',
+    'invalid-double-dash': 'invalid_double_dash',
+    'dashes': 'dashes',
+    'scope': 'scope',
+    'out_of_doc': 'out_of_doc',
+    'official': 'official',
+}
+OFFICIAL_FIELDS = {
+    'slug': 'slug',
+    'resource': 'resource',
+    'resource_provider_namespace': 'resource_provider_namespace',
+}
+# String fields whose values repeat across many definitions
+_INTERNED_FIELDS = frozenset(('scope', 'regex', 'validation_regex', 'resource', 'resource_provider_namespace'))
+
+_layouts = {}
+
+
+def _layout(keys):
+    """Shared tuple for a key order"""
+    return _layouts.setdefault(keys, keys)
+
+
+def _value(key, value):
+    if key in _INTERNED_FIELDS and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class _SlotRecord:
+    __slots__ = ('_keys', '_extra')
+    _fields = {}
+
+    def _load(self, data):
+        extra = None
+        for key, value in data.items():
+            attribute = self._fields.get(key)
+            if attribute is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            else:
+                setattr(self, attribute, self._convert(key, value))
+        self._keys = _layout(tuple(data))
+        self._extra = extra
+        for attribute in self._fields.values():
+            if not hasattr(self, attribute):
+                setattr(self, attribute, None)
+        return self
+
+    def _convert(self, key, value):
+        return _value(key, value)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def get(self, key, default=None):
+        """Value of a JSON key, as a definition dict would return it"""
+        if key not in self._keys:
+            return default
+        attribute = self._fields.get(key)
+        if attribute is None:
+            return self._extra[key]
+        value = getattr(self, attribute)
+        return value.to_dict() if isinstance(value, _SlotRecord) else value
+
+    def keys(self):
+        return self._keys
+
+    def to_dict(self):
+        """Source definition, with its original key order"""
+        return {key: self.get(key) for key in self._keys}
+
+    def __eq__(self, other):
+        if not isinstance(other, _SlotRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+class OfficialRecord(_SlotRecord):
+    """Official CAF documentation attributes of a resource"""
+
+    __slots__ = tuple(OFFICIAL_FIELDS.values())
+    _fields = OFFICIAL_FIELDS
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls()._load(data)
+
+
+class ResourceRecord(_SlotRecord):
+    """One resource definition"""
+
+    __slots__ = tuple(RECORD_FIELDS.values())
+    _fields = RECORD_FIELDS
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls()._load(data)
+
+    def _convert(self, key, value):
+        if key == 'official' and isinstance(value, dict):
+            return OfficialRecord.from_dict(value)
+        return _value(key, value)
+
+
+def records_from_definitions(resources):
+    """Convert definition dicts to records"""
+    return [ResourceRecord.from_dict(resource) for resource in resources]
+
+
+def records_to_definitions(records):
+    """Convert records back to definition dicts"""
+    return [record.to_dict() for record in records]
+
+
+def load_resource_records(path=RESOURCE_DEFINITION_FILE):
+    """Load a definitions file as a list of records"""
+    return records_from_definitions(load_resource_definitions(path))
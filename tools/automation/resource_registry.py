@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Indexed registry of resource definitions shared by the automation scripts
+
+The registry loads resourceDefinition.json once and keeps O(1) indexes by name,
+slug (multi-valued), scope and official resource provider namespace. Slug
+changes go through set_slug() so the indexes stay consistent without rebuilding
+them. remove() and replace() are O(1) as well: removed entries leave a
+tombstone in the position-ordered storage, compacted once tombstones make up
+half of it.
+
+load() keeps a pickled snapshot of the registry and its indexes next to the
+JSON file (.resourceDefinition.json.snapshot). The snapshot records the size,
+mtime and SHA-256 of the JSON it was built from; it is reused while the JSON
+is unchanged and rebuilt transparently when it is stale, corrupt or written by
+another snapshot format. Set AZURECAF_NO_SNAPSHOT=1 to always parse the JSON.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import time
+
+from resource_definitions import RESOURCE_DEFINITION_FILE, load_resource_definitions, save_resource_definitions
+
+# Bump when the pickled layout of ResourceRegistry changes
+SNAPSHOT_FORMAT = 2
+# A snapshot written this close to the JSON mtime cannot trust the mtime alone
+_RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+def _namespace(resource):
+    """Official resource provider namespace of a resource, or '' when unknown"""
+    official = resource.get('official')
+    if isinstance(official, dict):
+        return official.get('resource_provider_namespace', '')
+    return ''
+
+
+class ResourceRegistry:
+    """Resource definitions with incremental lookup indexes"""
+
+    def __init__(self, resources=()):
+        # Resources by position, None where one was removed
+        self._slots = []
+        self._removed = 0
+        self._by_name = {}
+        self._by_slug = {}
+        self._by_scope = {}
+        self._by_namespace = {}
+        self._duplicated_slugs = set()
+        # Slot of every resource, increasing in file order, used to report groups in file order
+        self._position = {}
+        for resource in resources:
+            self.add(resource)
+
+    @classmethod
+    def load(cls, path=RESOURCE_DEFINITION_FILE, snapshot=None):
+        """Build a registry from a definitions file, through its snapshot when enabled"""
+        if snapshot is None:
+            snapshot = not os.environ.get('AZURECAF_NO_SNAPSHOT')
+        if not snapshot or os.path.isdir(path):
+            # A shard directory has no single file for the snapshot to validate against
+            return cls(load_resource_definitions(path))
+        return _load_with_snapshot(cls, path)
+
+    def save(self, path=RESOURCE_DEFINITION_FILE):
+        """Write the registry back to a definitions file in canonical layout"""
+        save_resource_definitions(self.resources, path)
+
+    @property
+    def resources(self):
+        """The resource definitions in file order"""
+        if self._removed:
+            self._compact()
+        return self._slots
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __iter__(self):
+        return (resource for resource in self._slots if resource is not None)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def get(self, name, default=None):
+        """Resource definition by its resource type name"""
+        return self._by_name.get(name, default)
+
+    def with_slug(self, slug):
+        """Resources currently using a slug, in file order"""
+        return self._ordered(self._by_slug.get(slug, {}))
+
+    def with_scope(self, scope):
+        """Resources with a given naming scope, in file order"""
+        return self._ordered(self._by_scope.get(scope, {}))
+
+    def with_namespace(self, namespace):
+        """Resources with a given official resource provider namespace, in file order"""
+        return self._ordered(self._by_namespace.get(namespace, {}))
+
+    def slug_count(self, slug):
+        """Number of resources using a slug"""
+        return len(self._by_slug.get(slug, ()))
+
+    def slugs(self):
+        """Every non-empty slug in use"""
+        return [slug for slug in self._by_slug if slug]
+
+    def scopes(self):
+        """Every scope in use"""
+        return list(self._by_scope)
+
+    def namespaces(self):
+        """Every official resource provider namespace in use"""
+        return [namespace for namespace in self._by_namespace if namespace]
+
+    def duplicate_slugs(self):
+        """Non-empty slugs used by more than one resource.
+
+        Returns a dict of slug -> resources, ordered by the first resource using
+        each slug so reports match the order of the definitions file.
+        """
+        groups = {slug: self.with_slug(slug) for slug in self._duplicated_slugs}
+        return dict(sorted(groups.items(), key=lambda item: self._position[item[1][0]['name']]))
+
+    def add(self, resource):
+        """Register a new resource definition"""
+        name = resource.get('name', '')
+        if name in self._by_name:
+            raise ValueError(f"resource {name} is already registered")
+        self._position[name] = len(self._slots)
+        self._slots.append(resource)
+        self._by_name[name] = resource
+        self._index_slug(name, resource.get('slug', ''), resource)
+        self._by_scope.setdefault(resource.get('scope', ''), {})[name] = resource
+        self._by_namespace.setdefault(_namespace(resource), {})[name] = resource
+
+    def remove(self, name):
+        """Drop a resource definition and return it"""
+        resource = self._by_name.pop(name)
+        self._slots[self._position.pop(name)] = None
+        self._removed += 1
+        if self._removed * 2 > len(self._slots):
+            self._compact()
+        self._unindex_slug(name, resource.get('slug', ''))
+        self._discard(self._by_scope, resource.get('scope', ''), name)
+        self._discard(self._by_namespace, _namespace(resource), name)
+        return resource
+
+    def replace(self, resource):
+        """Swap in a new definition for an already registered name, keeping its position.
+
+        Returns the previous definition.
+        """
+        name = resource.get('name', '')
+        previous = self._by_name[name]
+        self._slots[self._position[name]] = resource
+        self._by_name[name] = resource
+        self._unindex_slug(name, previous.get('slug', ''))
+        self._index_slug(name, resource.get('slug', ''), resource)
+        self._discard(self._by_scope, previous.get('scope', ''), name)
+        self._by_scope.setdefault(resource.get('scope', ''), {})[name] = resource
+        self._discard(self._by_namespace, _namespace(previous), name)
+        self._by_namespace.setdefault(_namespace(resource), {})[name] = resource
+        return previous
+
+    def set_slug(self, name, slug):
+        """Change the slug of a resource, updating the slug index.
+
+        Returns the previous slug.
+        """
+        resource = self._by_name[name]
+        old_slug = resource.get('slug', '')
+        if old_slug != slug:
+            self._unindex_slug(name, old_slug)
+            resource['slug'] = slug
+            self._index_slug(name, slug, resource)
+        return old_slug
+
+    def _compact(self):
+        """Drop the tombstones of removed resources and renumber the positions"""
+        self._slots = [resource for resource in self._slots if resource is not None]
+        self._removed = 0
+        for slot, resource in enumerate(self._slots):
+            self._position[resource.get('name', '')] = slot
+
+    def _ordered(self, members):
+        return sorted(members.values(), key=lambda r: self._position[r['name']])
+
+    def _index_slug(self, name, slug, resource):
+        members = self._by_slug.setdefault(slug, {})
+        members[name] = resource
+        if slug and len(members) > 1:
+            self._duplicated_slugs.add(slug)
+
+    def _unindex_slug(self, name, slug):
+        self._discard(self._by_slug, slug, name)
+        if self.slug_count(slug) < 2:
+            self._duplicated_slugs.discard(slug)
+
+    @staticmethod
+    def _discard(index, key, name):
+        members = index.get(key)
+        if members is not None:
+            members.pop(name, None)
+            if not members:
+                del index[key]
+
+
+def snapshot_path(path):
+    """Snapshot file kept next to a definitions file"""
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f'.{filename}.snapshot')
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _snapshot_header(cls):
+    return {'format': SNAPSHOT_FORMAT, 'python': sys.version_info[:2], 'class': cls.__qualname__}
+
+
+def _read_snapshot(cls, path, stat):
+    """Registry from a valid snapshot, or None when it is missing, stale or corrupt"""
+    try:
+        with open(snapshot_path(path), 'rb') as f:
+            header = pickle.load(f)
+            if {key: header.get(key) for key in ('format', 'python', 'class')} != _snapshot_header(cls):
+                return None
+            if header['size'] != stat.st_size:
+                return None
+            # Trust an unchanged mtime only if the snapshot was written well after it
+            trusted = header['mtime_ns'] == stat.st_mtime_ns and \
+                header['written_ns'] - stat.st_mtime_ns > _RACY_WINDOW_NS
+            if not trusted and header['sha256'] != _file_digest(path):
+                return None
+            # Unpickling allocates every definition at once; collector passes only slow it down
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                registry = pickle.load(f)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+    except Exception:
+        return None
+    if type(registry) is not cls:
+        return None
+    if not trusted and time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+        # The digest matched and the mtime is now old enough to be trusted; record it so
+        # later loads skip hashing the JSON (a snapshot written right after the JSON never would)
+        _write_snapshot(registry, path, stat, header['sha256'])
+    return registry
+
+
+def _write_snapshot(registry, path, stat, digest):
+    header = dict(_snapshot_header(type(registry)), size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                  sha256=digest, written_ns=time.time_ns())
+    target = snapshot_path(path)
+    tmp = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(registry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        # Snapshots are an optimization; a read-only checkout just parses every time
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _load_with_snapshot(cls, path):
+    stat = os.stat(path)
+    registry = _read_snapshot(cls, path, stat)
+    if registry is None:
+        digest = _file_digest(path)
+        registry = cls(load_resource_definitions(path))
+        _write_snapshot(registry, path, stat, digest)
+    return registry
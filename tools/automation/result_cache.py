@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache of the reports printed by the validation scripts
+
+A report is stored under a key made of the SHA-256 of the definitions file,
+the version of the rules the script checks against and the SHA-256 of the
+script together with the modules and rule files next to it, which it may
+import. While none of them change, the stored report and exit code are
+replayed instead of recomputing them. Entries live in .azurecaf_cache/ (or
+$AZURECAF_CACHE_DIR); unreadable entries are ignored and rebuilt.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+
+CACHE_DIR = os.environ.get('AZURECAF_CACHE_DIR', '.azurecaf_cache')
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file, or of the names and contents of a directory's files"""
+    digest = hashlib.sha256()
+    if os.path.isdir(path):
+        for entry in sorted(os.listdir(path)):
+            digest.update(f'{entry}\0{file_digest(os.path.join(path, entry))}\0'.encode('utf-8'))
+        return digest.hexdigest()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def rules_version(rules):
+    """Stable version string for a rule mapping defined in code"""
+    encoded = json.dumps(rules, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def tooling_digest(script_path):
+    """SHA-256 of a script and of the Python modules and JSON rule files in its directory.
+
+    Every sibling counts, not only the modules imported so far, as scripts
+    import some of them lazily while the report runs.
+    """
+    directory = os.path.dirname(os.path.abspath(script_path))
+    paths = {os.path.abspath(script_path)}
+    for entry in os.listdir(directory):
+        if entry.endswith(('.py', '.json')):
+            paths.add(os.path.join(directory, entry))
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(f'{os.path.basename(path)}\0{file_digest(path)}\0'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Reports and exit codes stored by content key"""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    def key(self, tool, definitions_path, version, script_path):
+        """Cache key of one script run over one definitions file"""
+        parts = [tool, str(version), tooling_digest(script_path), file_digest(definitions_path)]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        """Return (exit code, report) for a key, or None when missing or unreadable"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return int(entry['exit_code']), entry['report']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key, exit_code, report):
+        """Store a report atomically; failures to write only skip caching"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f'{self._path(key)}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'exit_code': exit_code, 'report': report}, f, ensure_ascii=False)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            pass
+
+
+def run_cached(tool, version, script_path, run, definitions_path=RESOURCE_DEFINITION_FILE,
+               use_cache=True, cache=None):
+    """Run a report function through the cache.
+
+    run() prints its report and returns the exit code. On a hit the stored
+    report is printed and its exit code returned without calling run().
+    """
+    if use_cache:
+        cache = cache or ResultCache()
+        try:
+            key = cache.key(tool, definitions_path, version, script_path)
+        except OSError:
+            # Missing input: let the script report it the usual way
+            use_cache = False
+    if not use_cache:
+        return run()
+
+    hit = cache.get(key)
+    if hit is not None:
+        exit_code, report = hit
+        sys.stdout.write(report)
+        return exit_code
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        exit_code = run()
+    report = output.getvalue()
+    sys.stdout.write(report)
+    cache.put(key, exit_code, report)
+    return exit_code
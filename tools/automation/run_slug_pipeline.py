@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Single-load slug pipeline
+
+Loads resourceDefinition.json once into a shared ResourceRegistry, runs every
+slug fixer as an in-memory stage over it and writes the file at most once at
+the end. Each stage reports how many corrections it made and how long it took.
+
+Usage:
+    python3 tools/automation/run_slug_pipeline.py [--file PATH] [--dry-run] [--verbose]
+"""
+
+import argparse
+import sys
+import time
+
+from fix_new_caf_duplicates import apply_new_caf_resolution
+from resolve_final_8_duplicates import apply_final_8_resolution
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from resource_registry import ResourceRegistry
+from slug_rules import apply_slug_rules
+from slug_solver import apply_slug_solver
+
+# Stages run in the same order the sync job used to call the individual scripts.
+# The declarative rule layers of slug_rules.json replace the official, related,
+# final and last-10 fixers and are evaluated in a single pass. The solver then
+# gives every collision left a unique slug, keeping official slugs unchanged.
+PIPELINE_STAGES = [
+    ('slug_rules', apply_slug_rules),
+    ('final_8_duplicates', apply_final_8_resolution),
+    ('new_caf_duplicates', apply_new_caf_resolution),
+    ('unique_slugs', apply_slug_solver),
+]
+
+
+def run_pipeline(registry, stages=PIPELINE_STAGES):
+    """Run every stage over the registry in place.
+
+    Returns a list of (stage name, corrections, elapsed seconds) tuples.
+    """
+    results = []
+    for name, stage in stages:
+        start = time.perf_counter()
+        corrections = stage(registry)
+        results.append((name, corrections, time.perf_counter() - start))
+    return results
+
+
+def changed_resources(before, registry):
+    """Names whose slug differs from the snapshot taken before the pipeline ran"""
+    return sorted(
+        r.get('name', '') for r in registry
+        if before.get(r.get('name', '')) != r.get('slug', '')
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all slug fixers over resourceDefinition.json in one pass')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to process')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing the file')
+    parser.add_argument('--verbose', action='store_true', help='print every correction made by each stage')
+    args = parser.parse_args()
+
+    try:
+        start = time.perf_counter()
+        registry = ResourceRegistry.load(args.file)
+        load_elapsed = time.perf_counter() - start
+    except FileNotFoundError:
+        print(f"❌ Error: {args.file} not found")
+        return 1
+    except ValueError as e:
+        print(f"❌ Error: invalid JSON in {args.file}: {e}")
+        return 1
+
+    before = {r.get('name', ''): r.get('slug', '') for r in registry}
+    results = run_pipeline(registry)
+    changed = changed_resources(before, registry)
+
+    print("🔧 SLUG PIPELINE REPORT:")
+    print("=" * 60)
+    print(f"📦 Loaded {len(registry)} resources in {load_elapsed * 1000:.1f} ms")
+    print(f"{'Stage':<32}{'Changes':>10}{'Time (ms)':>14}")
+    print("-" * 60)
+    for name, corrections, elapsed in results:
+        print(f"{name:<32}{len(corrections):>10}{elapsed * 1000:>14.2f}")
+        if args.verbose:
+            for correction in corrections:
+                print(correction)
+    print("-" * 60)
+    print(f"🏷️  Resources with a different final slug: {len(changed)}")
+
+    if not changed:
+        print("ℹ️  No changes, file left untouched")
+    elif args.dry_run:
+        print("ℹ️  Dry run, file left untouched")
+    else:
+        start = time.perf_counter()
+        registry.save(args.file)
+        print(f"💾 Saved {args.file} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Slug proposals for new resource types
+
+Proposes a slug for each new azurerm_* type from its name tokens. The new type
+joins the family of existing resources sharing the longest token prefix of its
+name: the family base is the slug of the resource named by that prefix
+(azurerm_key_vault for azurerm_key_vault_new_thing), or otherwise the prefix
+the slugs of its members have in common (mysql for azurerm_mysql_*). The
+suffix comes from the remaining tokens, and the shortest candidate that no
+resource uses yet is returned. Types without a family get a slug from their
+own tokens.
+
+Candidates are checked against a live slug index: the registry's slugs plus
+every slug proposed earlier in the same batch, so a provider release can be
+proposed in one call without collisions between the new types. Batches are
+proposed parents first, letting children reuse a slug proposed for their new
+parent.
+
+Usage:
+    python3 tools/automation/slug_generator.py [--file PATH] [--json] NAME...
+    python3 tools/automation/slug_generator.py [--file PATH] [--json] --from-file LIST
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from resource_registry import ResourceRegistry
+from slug_solver import NAME_PREFIX, name_tokens, suffix_candidates
+
+# Family bases shorter than this are too generic to share
+MIN_BASE_LENGTH = 2
+MIN_SLUG_LENGTH = 2
+
+
+def _common_prefix(slugs):
+    return os.path.commonprefix(slugs) if slugs else ''
+
+
+class SlugGenerator:
+    """Proposes unique slugs for new resource types against a registry"""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._taken = {slug.lower() for slug in registry.slugs()}
+        # Token prefix -> slugs of the resources below it, and name -> slug of every resource
+        self._families = {}
+        self._slugs = {}
+        for resource in registry:
+            self._index(resource.get('name', ''), resource.get('slug', ''))
+
+    def _index(self, name, slug):
+        if not slug:
+            return
+        self._slugs[name] = slug
+        tokens = name_tokens(name)
+        for end in range(1, len(tokens) + 1):
+            self._families.setdefault(tuple(tokens[:end]), []).append(slug)
+
+    def family(self, name):
+        """(family base slug, remaining tokens) for a name, or ('', all tokens) without a family"""
+        tokens = name_tokens(name)
+        for end in range(len(tokens) - 1, 0, -1):
+            prefix = tokens[:end]
+            root_slug = self._slugs.get(NAME_PREFIX + '_'.join(prefix))
+            if root_slug:
+                return root_slug, tokens[end:]
+            base = _common_prefix(self._families.get(tuple(prefix), []))
+            if len(base) >= MIN_BASE_LENGTH:
+                return base, tokens[end:]
+        return '', tokens
+
+    def propose(self, name):
+        """Propose and reserve a slug for a new type; returns (slug, family base)"""
+        existing = self.registry.get(name)
+        if existing is not None and existing.get('slug'):
+            return existing['slug'], None
+        base, extra = self.family(name)
+        candidates = [base + suffix for suffix in suffix_candidates(extra)]
+        slug = next((c for c in candidates if len(c) >= MIN_SLUG_LENGTH and c not in self._taken), None)
+        if slug is None:
+            stem = candidates[-1] if candidates else base or 'res'
+            number = 2
+            while f'{stem}{number}' in self._taken:
+                number += 1
+            slug = f'{stem}{number}'
+        self._taken.add(slug)
+        self._index(name, slug)
+        return slug, base or None
+
+    def propose_all(self, names):
+        """Propose slugs for a batch of new types; returns {name: (slug, family base)} in input order"""
+        # Parents before children so a new family's members build on the slug proposed for its root
+        order = sorted(dict.fromkeys(names), key=lambda n: (len(name_tokens(n)), n))
+        proposals = {name: self.propose(name) for name in order}
+        return {name: proposals[name] for name in dict.fromkeys(names)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Propose slugs for new azurerm resource types')
+    parser.add_argument('names', nargs='*', metavar='NAME', help='resource types to propose slugs for')
+    parser.add_argument('--from-file', metavar='LIST', help='file with one resource type per line')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file with the existing slugs')
+    parser.add_argument('--json', action='store_true', help='print {name: slug} as JSON')
+    parser.add_argument('--slug-only', action='store_true', help='print only the proposed slugs, one per line')
+    args = parser.parse_args()
+
+    names = list(args.names)
+    if args.from_file:
+        with open(args.from_file, 'r', encoding='utf-8') as f:
+            names.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    if not names:
+        parser.error('no resource types given')
+
+    try:
+        registry = ResourceRegistry.load(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading {args.file}: {e}", file=sys.stderr)
+        return 1
+
+    proposals = SlugGenerator(registry).propose_all(names)
+    if args.json:
+        print(json.dumps({name: slug for name, (slug, _) in proposals.items()}, indent=2))
+    elif args.slug_only:
+        for slug, _ in proposals.values():
+            print(slug)
+    else:
+        for name, (slug, base) in proposals.items():
+            if base is None and name in registry:
+                print(f"ℹ️  {name}: '{slug}' (already defined)")
+            elif base:
+                print(f"✅ {name}: '{slug}' (family base '{base}')")
+            else:
+                print(f"✅ {name}: '{slug}' (from name tokens)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Declarative slug rule engine
+
+Slug rules live in slug_rules.json as layers of exact-name rules and
+substring/prefix pattern rules. Every layer has a priority: layers are applied
+from the lowest to the highest priority, so a higher priority rule overrides a
+lower one for the same resource. Rules are compiled once into a name dispatch
+table plus an Aho-Corasick pattern automaton and evaluated in a single pass over the
+registry. Rules that disagree at the same priority are rejected at compile
+time, before any definition is rewritten.
+
+When several pattern rules of a layer match the same name, the candidates are
+tried by descending pattern priority, then longest matched text, then
+declaration order, so the result never depends on how the rules are scanned.
+
+Usage:
+    python3 tools/automation/slug_rules.py [--rules PATH] [--file PATH] [--apply]
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+from collections import namedtuple
+
+from pattern_matcher import AhoCorasick
+from resource_definitions import RESOURCE_DEFINITION_FILE
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slug_rules.json')
+
+# One slug change made by a rule layer
+SlugChange = namedtuple('SlugChange', 'name old_slug new_slug layer reason')
+
+_ExactRule = namedtuple('_ExactRule', 'layer slug only_if_slug reason')
+_PatternRule = namedtuple('_PatternRule', 'layer text prefix slug variants skip_if_slug_prefix reason priority order')
+_Layer = namedtuple('_Layer', 'name priority order')
+
+
+class RuleConflictError(ValueError):
+    """Raised when rules at the same priority disagree"""
+
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        super().__init__('conflicting slug rules:\n' + '\n'.join(f'  • {c}' for c in conflicts))
+
+
+class _DuplicateKeys(dict):
+    """Mapping that remembers keys repeated in the JSON source"""
+
+    def __init__(self, pairs):
+        super().__init__()
+        self.repeated = []
+        for key, value in pairs:
+            if key in self and self[key] != value:
+                self.repeated.append((key, self[key], value))
+            self[key] = value
+
+
+class SlugRuleSet:
+    """Compiled slug rules"""
+
+    def __init__(self, data):
+        self.version = data.get('version', 0)
+        self.layers = []
+        self.conflicts = []
+        self.overrides = []
+        self.collisions = {}
+        # name -> exact rules, ordered by the priority of their layer
+        self._dispatch = {}
+        # pattern text -> pattern rules using it, in resolution order
+        self._patterns = {}
+        self._compile(data)
+        if self.conflicts:
+            raise RuleConflictError(self.conflicts)
+
+    def _compile(self, data):
+        layers = data.get('layers', [])
+        for order, layer in enumerate(layers):
+            self.layers.append(_Layer(layer['name'], layer.get('priority', 0), order))
+        self.layers.sort(key=lambda l: (l.priority, l.order))
+        by_name = {l.name: l for l in self.layers}
+        if len(by_name) != len(self.layers):
+            self.conflicts.append('layer names must be unique')
+
+        seen_patterns = {}
+        for layer in layers:
+            name = layer['name']
+            priority = layer.get('priority', 0)
+            reason = layer.get('reason', name)
+            exact = layer.get('exact', {})
+            for key, first, second in getattr(exact, 'repeated', []):
+                self.conflicts.append(f"{key}: '{first}' and '{second}' in layer {name}")
+            for resource_name, rule in exact.items():
+                if isinstance(rule, str):
+                    rule = {'slug': rule}
+                self._dispatch.setdefault(resource_name, []).append(
+                    _ExactRule(name, rule['slug'], rule.get('only_if_slug'), rule.get('reason', reason)))
+
+            for order, pattern in enumerate(layer.get('patterns', [])):
+                text = pattern.get('prefix', pattern.get('contains'))
+                if not text:
+                    self.conflicts.append(f"pattern without 'contains' or 'prefix' in layer {name}")
+                    continue
+                rule = _PatternRule(
+                    name, text, 'prefix' in pattern, pattern['slug'],
+                    tuple(pattern.get('variants', ())), pattern.get('skip_if_slug_prefix'),
+                    pattern.get('reason', reason), pattern.get('priority', 0), order)
+                key = (priority, text, rule.prefix)
+                if key in seen_patterns and seen_patterns[key] != (rule.slug, rule.variants):
+                    self.conflicts.append(f"pattern '{text}' defined twice at priority {priority}")
+                seen_patterns[key] = (rule.slug, rule.variants)
+                self._patterns.setdefault(text, []).append(rule)
+        for rules in self._patterns.values():
+            rules.sort(key=self._pattern_key)
+        self._matcher = AhoCorasick(self._patterns)
+
+        effective = {}
+        for resource_name, rules in self._dispatch.items():
+            rules.sort(key=lambda r: (by_name[r.layer].priority, by_name[r.layer].order))
+            for lower, higher in zip(rules, rules[1:]):
+                if lower.slug == higher.slug or lower.only_if_slug is not None or higher.only_if_slug is not None:
+                    continue
+                if by_name[lower.layer].priority == by_name[higher.layer].priority:
+                    self.conflicts.append(
+                        f"{resource_name}: '{lower.slug}' ({lower.layer}) and '{higher.slug}' ({higher.layer})"
+                        f" at priority {by_name[lower.layer].priority}")
+                else:
+                    self.overrides.append((resource_name, lower.layer, lower.slug, higher.layer, higher.slug))
+            if rules[-1].only_if_slug is None:
+                effective.setdefault(rules[-1].slug, []).append(resource_name)
+        self.collisions = {slug: names for slug, names in effective.items() if len(names) > 1}
+
+    @staticmethod
+    def _pattern_key(rule):
+        """Resolution order of pattern candidates within a layer"""
+        return -rule.priority, -len(rule.text), rule.order
+
+    def _layer_steps(self, name, layers):
+        """Exact and pattern candidates for a name, grouped by layer in priority order"""
+        exact = {rule.layer: rule for rule in self._dispatch.get(name, ())}
+        candidates = {}
+        for text, starts in self._matcher.matches(name).items():
+            for rule in self._patterns[text]:
+                if not rule.prefix or starts[0] == 0:
+                    candidates.setdefault(rule.layer, []).append(rule)
+        steps = []
+        for layer in self.layers:
+            if layers is not None and layer.name not in layers:
+                continue
+            if layer.name in exact:
+                steps.append((layer.name, exact[layer.name], ()))
+            elif layer.name in candidates:
+                steps.append((layer.name, None, sorted(candidates[layer.name], key=self._pattern_key)))
+        return steps
+
+    @staticmethod
+    def _pattern_slug(pattern, name):
+        for variant in pattern.variants:
+            if all(t in name for t in variant.get('contains', ())) and \
+                    not any(t in name for t in variant.get('excludes', ())):
+                return variant['slug']
+        return pattern.slug
+
+    def resolve(self, name, slug, layers=None):
+        """Apply every matching rule to one resource.
+
+        Returns (final slug, list of SlugChange) without touching any registry.
+        """
+        changes = []
+        for layer_name, exact, patterns in self._layer_steps(name, layers):
+            new_slug, reason = None, None
+            if exact is not None:
+                if exact.only_if_slug is None or exact.only_if_slug == slug:
+                    new_slug, reason = exact.slug, exact.reason
+            else:
+                for pattern in patterns:
+                    if pattern.skip_if_slug_prefix and slug.startswith(pattern.skip_if_slug_prefix):
+                        continue
+                    new_slug, reason = self._pattern_slug(pattern, name), pattern.reason
+                    break
+            if new_slug is not None and new_slug != slug:
+                changes.append(SlugChange(name, slug, new_slug, layer_name, reason))
+                slug = new_slug
+        return slug, changes
+
+    def evaluate(self, registry, layers=None, apply=True):
+        """Evaluate the rules over every resource of a registry in one pass.
+
+        layers optionally restricts evaluation to the named layers. Returns the
+        list of SlugChange made, in registry order.
+        """
+        changes = []
+        for resource in list(registry):
+            name = resource.get('name', '')
+            slug, resource_changes = self.resolve(name, resource.get('slug', ''), layers)
+            if resource_changes:
+                changes.extend(resource_changes)
+                if apply:
+                    registry.set_slug(name, slug)
+        return changes
+
+
+def format_corrections(changes):
+    """Render SlugChange entries the way the fixer scripts report corrections"""
+    return [f"  • {c.name}: '{c.old_slug}' → '{c.new_slug}' ({c.reason})" for c in changes]
+
+
+@functools.lru_cache(maxsize=None)
+def load_rules(path=DEFAULT_RULES_FILE):
+    """Load and compile a rules file once per process"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f, object_pairs_hook=_DuplicateKeys)
+    return SlugRuleSet(data)
+
+
+def apply_slug_rules(registry):
+    """Pipeline stage applying every rule layer"""
+    return format_corrections(load_rules().evaluate(registry))
+
+
+def main():
+    from resource_registry import ResourceRegistry
+
+    parser = argparse.ArgumentParser(description='Compile slug_rules.json and evaluate it over the resource definitions')
+    parser.add_argument('--rules', default=DEFAULT_RULES_FILE, help='rules file to compile')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to evaluate')
+    parser.add_argument('--apply', action='store_true', help='write the resulting slugs back to the file')
+    args = parser.parse_args()
+
+    try:
+        rules = load_rules(args.rules)
+    except RuleConflictError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("📐 SLUG RULES REPORT:")
+    print("=" * 60)
+    print(f"📦 Rule set version {rules.version}: {len(rules.layers)} layers")
+    if rules.overrides:
+        print(f"\n↪️  Rules overridden by a higher priority layer ({len(rules.overrides)}):")
+        for name, lower_layer, lower_slug, higher_layer, higher_slug in rules.overrides:
+            print(f"  • {name}: '{lower_slug}' ({lower_layer}) → '{higher_slug}' ({higher_layer})")
+    if rules.collisions:
+        print(f"\n⚠️  Slugs assigned to several resources by exact rules ({len(rules.collisions)}):")
+        for slug, names in rules.collisions.items():
+            print(f"  • '{slug}': {', '.join(names)}")
+
+    registry = ResourceRegistry.load(args.file)
+    changes = rules.evaluate(registry)
+    print(f"\n🏷️  {len(changes)} slug changes over {len(registry)} resources")
+    for line in format_corrections(changes):
+        print(line)
+    if changes and args.apply:
+        registry.save(args.file)
+        print(f"💾 Saved {args.file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unique slug solver
+
+Assigns a unique slug to every resource sharing its slug with another one, in
+a single deterministic run instead of rounds of hand-written fixes.
+
+Resources whose slug is their official CAF abbreviation (the slug of their
+`official` attributes or of the official_caf_abbreviations layer of
+slug_rules.json) are protected and never change. In every other group of
+resources sharing a slug, the resource closest to the family root (fewest name
+tokens, then name) keeps the slug. The others get the shortest free candidate
+built from their family base, the slug of the longest resource name their own
+name extends (azurerm_frontdoor for azurerm_frontdoor_profile), followed by a
+suffix derived from the name tokens that are not part of that family name.
+A numbered suffix is only used when every candidate is taken. Every slug
+respects the resource's max_length; a resource no free slug fits is reported
+as unsolvable and keeps its slug.
+
+Usage:
+    python3 tools/automation/slug_solver.py [--file PATH] [--dry-run]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from resource_registry import ResourceRegistry
+from slug_rules import DEFAULT_RULES_FILE
+
+OFFICIAL_RULE_LAYER = 'official_caf_abbreviations'
+NAME_PREFIX = 'azurerm_'
+
+_SLUG = re.compile(r'[a-z0-9]+')
+
+
+def name_tokens(name):
+    """Tokens of a resource name without the provider prefix"""
+    if name.startswith(NAME_PREFIX):
+        name = name[len(NAME_PREFIX):]
+    return [token for token in name.split('_') if token]
+
+
+def protected_slugs(registry, rules_path=DEFAULT_RULES_FILE):
+    """name -> slug of every resource currently using its official CAF abbreviation"""
+    official = {}
+    try:
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            for layer in json.load(f).get('layers', []):
+                if layer.get('name') == OFFICIAL_RULE_LAYER:
+                    for name, rule in layer.get('exact', {}).items():
+                        official[name] = rule if isinstance(rule, str) else rule.get('slug')
+    except FileNotFoundError:
+        pass
+    protected = {}
+    for resource in registry:
+        name, slug = resource.get('name', ''), resource.get('slug', '')
+        attributes = resource.get('official')
+        official_slug = attributes.get('slug') if isinstance(attributes, dict) else None
+        if slug and slug in (official_slug, official.get(name)):
+            protected[name] = slug
+    return protected
+
+
+def suffix_candidates(tokens):
+    """Suffixes derived from name tokens, shortest first, in a fixed order"""
+    if not tokens:
+        return []
+    initials = ''.join(token[0] for token in tokens)
+    head, last = initials[:-1], tokens[-1]
+    candidates = [initials]
+    candidates.extend(head + last[:n] for n in range(2, len(last) + 1))
+    candidates.append(''.join(token[:3] for token in tokens))
+    candidates.append(''.join(tokens))
+    unique = [c for c in dict.fromkeys(candidates) if _SLUG.fullmatch(c)]
+    return sorted(unique, key=len)
+
+
+class SlugSolver:
+    """Computes unique slugs for the colliding resources of a registry"""
+
+    def __init__(self, registry, protected=None):
+        self.registry = registry
+        self.protected = protected_slugs(registry) if protected is None else protected
+        self._names = {resource.get('name', '') for resource in registry}
+        # Slugs shared only by protected resources cannot be resolved without breaking an official slug
+        self.protected_conflicts = {}
+        # name -> shared slug of the resources no free slug fits within max_length
+        self.unsolvable = {}
+
+    def family_root(self, name):
+        """Longest other resource name that name extends token by token, or None"""
+        parts = name.split('_')
+        for end in range(len(parts) - 1, 1, -1):
+            candidate = '_'.join(parts[:end])
+            if candidate in self._names:
+                return candidate
+        return None
+
+    def _candidates(self, resource, slug, kept):
+        name = resource.get('name', '')
+        tokens = name_tokens(name)
+        root = self.family_root(name)
+        root_slug = self.registry.get(root, {}).get('slug') if root else None
+        if root_slug and _SLUG.fullmatch(root_slug):
+            base, extra = root_slug, tokens[len(name_tokens(root)):]
+        else:
+            # No family to follow: keep the shared slug and add what tells this resource apart
+            base, extra = slug, [token for token in tokens if token not in kept] or tokens
+        return base, [base + suffix for suffix in suffix_candidates(extra)]
+
+    def solve(self):
+        """List of (name, old slug, new slug, reason) assignments; the registry is not changed"""
+        taken = set(self.registry.slugs())
+        # Next number to try per base; lower ones are taken, as taken only grows
+        next_number = {}
+        assignments = []
+        for slug, members in sorted(self.registry.duplicate_slugs().items()):
+            protected = [r for r in members if self.protected.get(r.get('name', '')) == slug]
+            if protected:
+                keepers = protected
+                if len(protected) > 1:
+                    self.protected_conflicts[slug] = [r.get('name', '') for r in protected]
+            else:
+                keepers = [min(members, key=lambda r: (len(name_tokens(r.get('name', ''))), r.get('name', '')))]
+            # Tokens of the resources keeping the slug, which do not tell the others apart
+            kept = {token for keeper in keepers for token in name_tokens(keeper.get('name', ''))}
+            keeper_ids = {id(keeper) for keeper in keepers}
+            for resource in sorted(members, key=lambda r: r.get('name', '')):
+                if id(resource) in keeper_ids:
+                    continue
+                max_length = resource.get('max_length') or 0
+
+                def fits(candidate):
+                    return not max_length or len(candidate) <= max_length
+
+                base, candidates = self._candidates(resource, slug, kept)
+                new_slug = next((c for c in candidates if c not in taken and fits(c)), None)
+                reason = 'family base + name tokens'
+                if new_slug is None:
+                    number = next_number.get(base, 2)
+                    while f'{base}{number}' in taken:
+                        number += 1
+                    next_number[base] = number
+                    # Later numbers are never shorter, so the first free one is the last chance
+                    if not fits(f'{base}{number}'):
+                        self.unsolvable[resource.get('name', '')] = slug
+                        continue
+                    new_slug, reason = f'{base}{number}', 'family base + number'
+                taken.add(new_slug)
+                assignments.append((resource.get('name', ''), slug, new_slug, reason))
+        return assignments
+
+
+def apply_slug_solver(registry, verbose=False):
+    """Give every colliding resource a unique slug in memory and return the corrections made"""
+    corrections = []
+    solver = SlugSolver(registry)
+    for name, old_slug, new_slug, reason in solver.solve():
+        registry.set_slug(name, new_slug)
+        correction = f"{name}: '{old_slug}' → '{new_slug}' ({reason})"
+        corrections.append(f"  • {correction}")
+        if verbose:
+            print(f"✅ {correction}")
+    if verbose:
+        for name, slug in solver.unsolvable.items():
+            print(f"⚠️  {name}: no free slug fits max_length, '{slug}' left unchanged")
+    return corrections
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Assign unique slugs to every resource sharing its slug')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to process')
+    parser.add_argument('--dry-run', action='store_true', help='report assignments without writing the file')
+    args = parser.parse_args()
+
+    try:
+        registry = ResourceRegistry.load(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading {args.file}: {e}")
+        return 1
+
+    start = time.perf_counter()
+    solver = SlugSolver(registry)
+    assignments = solver.solve()
+    elapsed = time.perf_counter() - start
+
+    print("🧩 UNIQUE SLUG SOLVER:")
+    print("=" * 60)
+    print(f"📦 {len(registry)} resources, {len(solver.protected)} protected official slugs")
+    for name, old_slug, new_slug, reason in assignments:
+        print(f"  • {name}: '{old_slug}' → '{new_slug}' ({reason})")
+    for slug, names in solver.protected_conflicts.items():
+        print(f"⚠️  Official slug '{slug}' shared by {', '.join(names)}, left unchanged")
+    for name, slug in solver.unsolvable.items():
+        print(f"⚠️  {name}: no free slug fits max_length, '{slug}' left unchanged")
+    print(f"✅ {len(assignments)} slugs assigned in {elapsed * 1000:.1f} ms")
+
+    if assignments and not args.dry_run:
+        for name, _, new_slug, _ in assignments:
+            registry.set_slug(name, new_slug)
+        registry.save(args.file)
+        print(f"💾 Saved {args.file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
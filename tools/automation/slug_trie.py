@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Slug prefix-collision index
+
+getResource() also resolves resource types through the ResourceMaps slug
+table, so slugs that are prefixes of one another (st / stblob / stt) or that
+only differ by case make generated names ambiguous to read back. SlugTrie
+indexes every slug by its lowercased characters and reports, in one walk of
+the trie, O(total slug length):
+
+- exact_duplicates: the same slug used by several resources
+- case_collisions: different slugs that are identical once lowercased
+- prefix_chains: maximal chains of slugs each a prefix of the next
+  (compared lowercased), from the shortest to the longest, with the
+  resources of every slug in a chain listed once in chain_resources
+
+Usage:
+    python3 tools/automation/slug_trie.py [--file PATH] [--indent N]
+"""
+
+import argparse
+import json
+import sys
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+from stream_definitions import iter_resource_definitions
+
+# Key of the slugs ending at a trie node; trie edges are single characters
+_END = ''
+
+
+class SlugTrie:
+    """Trie of lowercased slugs; each node maps characters to child nodes"""
+
+    def __init__(self, resources=()):
+        self._root = {}
+        self.total = 0
+        self.without_slug = 0
+        for resource in resources:
+            self.add(resource.get('name', ''), resource.get('slug', ''))
+
+    def add(self, name, slug):
+        self.total += 1
+        if not slug:
+            self.without_slug += 1
+            return
+        node = self._root
+        for char in slug.lower():
+            child = node.get(char)
+            if child is None:
+                child = node[char] = {}
+            node = child
+        spellings = node.get(_END)
+        if spellings is None:
+            spellings = node[_END] = {}
+        spellings.setdefault(slug, []).append(name)
+
+    def analyze(self):
+        """Exact duplicates, case collisions and prefix chains as a JSON-serializable dict"""
+        report = {
+            'total_resources': self.total,
+            'resources_without_slug': self.without_slug,
+            'distinct_slugs': 0,
+            'exact_duplicates': [],
+            'case_collisions': [],
+            'prefix_chains': [],
+            'chain_resources': {},
+        }
+        self._walk(self._root, [], [], report)
+        return report
+
+    def _walk(self, node, path, ancestors, report):
+        """Visit a subtree; returns whether it holds a slug"""
+        spellings = node.get(_END)
+        if spellings is not None:
+            key = ''.join(path)
+            report['distinct_slugs'] += len(spellings)
+            for slug, names in sorted(spellings.items()):
+                if len(names) > 1:
+                    report['exact_duplicates'].append({'slug': slug, 'resources': names})
+            if len(spellings) > 1:
+                report['case_collisions'].append({'key': key, 'slugs': dict(sorted(spellings.items()))})
+            ancestors.append((key, spellings))
+        below = False
+        for char in sorted(node):
+            if char != _END:
+                path.append(char)
+                below = self._walk(node[char], path, ancestors, report) or below
+                path.pop()
+        if spellings is not None:
+            # A chain ends at a slug with no longer slug below it
+            if not below and len(ancestors) > 1:
+                report['prefix_chains'].append([key for key, _ in ancestors])
+            if below or len(ancestors) > 1:
+                report['chain_resources'][key] = sorted(name for names in spellings.values() for name in names)
+            ancestors.pop()
+        return below or spellings is not None
+
+
+def slug_collisions(path=RESOURCE_DEFINITION_FILE):
+    """Collision report of a definitions file, streamed one resource at a time"""
+    return SlugTrie(iter_resource_definitions(path)).analyze()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report exact, case-insensitive and prefix slug collisions as JSON')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to check')
+    parser.add_argument('--indent', type=int, default=2, help='JSON indentation (0 for one line)')
+    args = parser.parse_args()
+    try:
+        report = slug_collisions(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, indent=args.indent or None, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
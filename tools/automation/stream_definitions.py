@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Streaming access to resource definition files
+
+iter_resource_definitions() parses the top-level array of a definitions file
+one resource at a time from a fixed-size read buffer, so only the current
+definition is held in memory. SlugStreamIndex keeps the only state the
+streaming validator and duplicate detector need: how many resources use each
+slug and the first resource that used it. Memory therefore depends on the
+number of distinct slugs, not on the size or number of definitions.
+"""
+
+import json
+import os
+
+from resource_definitions import RESOURCE_DEFINITION_FILE
+
+CHUNK_SIZE = 1 << 16
+# A single definition larger than this is treated as malformed input instead of buffered further
+MAX_VALUE_SIZE = 1 << 24
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Buffer:
+    """Text read from a file in chunks with a moving read position"""
+
+    def __init__(self, f, chunk_size):
+        self._file = f
+        self._chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read one more chunk, dropping what was already consumed; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip_whitespace(self):
+        """Advance to the next significant character; returns it, or '' at end of file"""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ''
+
+
+def iter_resource_definitions(path=RESOURCE_DEFINITION_FILE, chunk_size=CHUNK_SIZE):
+    """Yield the definitions of a file's top-level array one at a time.
+
+    Raises ValueError when the file is not a JSON array of values. A shard
+    directory is streamed one definition per shard at a time, in name order.
+    """
+    if os.path.isdir(path):
+        from definition_shards import iter_sharded_definitions
+        yield from iter_sharded_definitions(path)
+        return
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = _Buffer(f, chunk_size)
+        if buffer.skip_whitespace() != '[':
+            raise ValueError(f"{path}: streaming needs a top-level JSON array")
+        buffer.pos += 1
+        if buffer.skip_whitespace() == ']':
+            buffer.pos += 1
+        else:
+            while True:
+                # raw_decode does not skip leading whitespace
+                buffer.skip_whitespace()
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer.text, buffer.pos)
+                    except json.JSONDecodeError:
+                        # The value may continue in the next chunk
+                        if len(buffer.text) - buffer.pos < MAX_VALUE_SIZE and buffer.fill():
+                            continue
+                        raise
+                    # A number not followed by a delimiter may continue in the next chunk
+                    if type(value) in (int, float) and buffer.text[end:end + 1] in ('', '.', 'e', 'E', '-', '+') \
+                            and buffer.fill():
+                        continue
+                    break
+                buffer.pos = end
+                yield value
+                separator = buffer.skip_whitespace()
+                buffer.pos += 1
+                if separator == ']':
+                    break
+                if separator != ',':
+                    raise ValueError(f"{path}: expected ',' or ']' in the top-level array, found {separator!r}")
+        if buffer.skip_whitespace():
+            raise ValueError(f"{path}: unexpected data after the top-level array")
+
+
+class SlugStreamIndex:
+    """slug -> (count, first resource) index fed one resource at a time"""
+
+    def __init__(self):
+        self._slugs = {}
+        self.total = 0
+        self.duplicate_count = 0
+
+    def add(self, name, slug):
+        """Record a resource.
+
+        Returns None, or (first resource name, count) when the slug was
+        already used, count being the number of resources now using it.
+        """
+        self.total += 1
+        if not slug:
+            return None
+        entry = self._slugs.get(slug)
+        if entry is None:
+            self._slugs[slug] = [1, name]
+            return None
+        entry[0] += 1
+        if entry[0] == 2:
+            self.duplicate_count += 1
+        return entry[1], entry[0]
+
+    def unique_slugs(self):
+        """Number of distinct non-empty slugs seen"""
+        return len(self._slugs)
+
+
+def report_duplicate(slug, name, duplicate):
+    """Print a duplicate finding as soon as it is found"""
+    first, count = duplicate
+    if count == 2:
+        print(f"❌ Slug '{slug}' used by {first} and {name}")
+    else:
+        print(f"❌ Slug '{slug}' also used by {name} ({count} resources)")
@@ -4,9 +4,15 @@ Microsoft CAF compliance validation script
 Validates resource slugs against official CAF abbreviations
 """
 
-import json
+import argparse
 import sys
-from collections import Counter
+
+from resource_definitions import (
+    RESOURCE_DEFINITION_FILE, diff_resource_definitions, diff_resource_definitions_since, load_resource_definitions_at,
+)
+from resource_registry import ResourceRegistry
+from result_cache import rules_version, run_cached
+from stream_definitions import SlugStreamIndex, iter_resource_definitions, report_duplicate
 
 # Official Microsoft CAF abbreviations
 OFFICIAL_CAF_MAPPING = {
@@ -45,31 +51,21 @@ OFFICIAL_CAF_MAPPING = {
     # Add more as needed...
 }
 
-def validate_compliance():
+def validate_compliance(path=RESOURCE_DEFINITION_FILE):
     try:
-        with open('resourceDefinition.json', 'r') as f:
-            resources = json.load(f)
+        registry = ResourceRegistry.load(path)
         
         compliant = 0
         non_compliant = []
-        duplicates = []
         
-        # Check compliance
-        for resource in resources:
-            name = resource.get('name', '')
-            slug = resource.get('slug', '')
-            
-            if name in OFFICIAL_CAF_MAPPING:
-                expected = OFFICIAL_CAF_MAPPING[name]
-                if slug == expected:
-                    compliant += 1
-                else:
-                    non_compliant.append(f"{name}: '{slug}' should be '{expected}'")
+        # Check compliance through the name index
+        for name in OFFICIAL_CAF_MAPPING:
+            resource = registry.get(name)
+            if resource is not None and check_slug(resource, non_compliant):
+                compliant += 1
         
         # Check for duplicates
-        slugs = [r.get('slug', '') for r in resources if r.get('slug')]
-        slug_counts = Counter(slugs)
-        duplicate_slugs = {slug: count for slug, count in slug_counts.items() if count > 1}
+        duplicate_slugs = {slug: len(group) for slug, group in registry.duplicate_slugs().items()}
         
         # Report results
         print(f"🏷️ CAF COMPLIANCE REPORT:")
@@ -77,8 +73,8 @@ def validate_compliance():
         print(f"✅ Compliant resources: {compliant}")
         print(f"⚠️ Non-compliant resources: {len(non_compliant)}")
         print(f"❌ Duplicate slugs: {len(duplicate_slugs)}")
-        print(f"📊 Total unique slugs: {len(set(slugs))}")
-        print(f"📊 Total resources: {len(resources)}")
+        print(f"📊 Total unique slugs: {len(registry.slugs())}")
+        print(f"📊 Total resources: {len(registry)}")
         
         if non_compliant:
             print("\n⚠️ NON-COMPLIANT RESOURCES:")
@@ -104,6 +100,132 @@ def validate_compliance():
         print(f"❌ Validation error: {e}")
         return False
 
+def check_slug(resource, non_compliant):
+    """Check one resource against the official mapping; returns True when it is compliant"""
+    name = resource.get('name', '')
+    expected = OFFICIAL_CAF_MAPPING.get(name)
+    if expected is None:
+        return False
+    slug = resource.get('slug', '')
+    if slug == expected:
+        return True
+    non_compliant.append(f"{name}: '{slug}' should be '{expected}'")
+    return False
+
+def validate_since(revision, path=RESOURCE_DEFINITION_FILE):
+    """Validate only the resources added or changed since a git revision.
+
+    The registry comes from its snapshot and the changed records from `git
+    diff`, so neither version of the file is parsed in full; slug uniqueness
+    is answered from the registry's slug index. A file not in canonical layout
+    falls back to a keyed diff against the file at the revision.
+    """
+    try:
+        names = diff_resource_definitions_since(revision, path)
+        registry = ResourceRegistry.load(path)
+        if names is None:
+            added, changed, removed = diff_resource_definitions(load_resource_definitions_at(revision, path), registry)
+        else:
+            added_names, changed_names, removed = names
+            added = [registry.get(name) for name in added_names]
+            changed = [registry.get(name) for name in changed_names]
+        
+        touched = added + changed
+        compliant = 0
+        non_compliant = []
+        duplicate_slugs = {}
+        for resource in touched:
+            if check_slug(resource, non_compliant):
+                compliant += 1
+            slug = resource.get('slug', '')
+            if slug and registry.slug_count(slug) > 1:
+                duplicate_slugs[slug] = [r['name'] for r in registry.with_slug(slug)]
+        
+        print(f"🏷️ CAF COMPLIANCE REPORT (changes since {revision}):")
+        print("=" * 50)
+        print(f"➕ Added resources: {len(added)}")
+        print(f"✏️ Changed resources: {len(changed)}")
+        print(f"➖ Removed resources: {len(removed)}")
+        print(f"✅ Compliant resources: {compliant}")
+        print(f"⚠️ Non-compliant resources: {len(non_compliant)}")
+        print(f"❌ Duplicate slugs: {len(duplicate_slugs)}")
+        print(f"📊 Duplicate slugs in the whole file: {len(registry.duplicate_slugs())}")
+        print(f"📊 Total unique slugs: {len(registry.slugs())}")
+        print(f"📊 Total resources: {len(registry)}")
+        
+        if non_compliant:
+            print("\n⚠️ NON-COMPLIANT RESOURCES:")
+            for item in non_compliant:
+                print(f"  • {item}")
+        
+        if duplicate_slugs:
+            print("\n❌ DUPLICATE SLUGS:")
+            for slug, names in duplicate_slugs.items():
+                print(f"  • '{slug}' used by {', '.join(names)}")
+        
+        if not non_compliant and not duplicate_slugs:
+            print("\n🎉 No CAF issues in the changed resources.")
+            return True
+        
+        return False
+        
+    except Exception as e:
+        print(f"❌ Validation error: {e}")
+        return False
+
+def validate_streaming(path=RESOURCE_DEFINITION_FILE):
+    """Validate while parsing the file one resource at a time, printing findings as they are found"""
+    try:
+        index = SlugStreamIndex()
+        compliant = 0
+        non_compliant = 0
+        
+        print(f"🏷️ CAF COMPLIANCE REPORT (streaming):")
+        print("=" * 50)
+        for resource in iter_resource_definitions(path):
+            findings = []
+            if check_slug(resource, findings):
+                compliant += 1
+            for item in findings:
+                non_compliant += 1
+                print(f"⚠️ {item}")
+            name, slug = resource.get('name', ''), resource.get('slug', '')
+            duplicate = index.add(name, slug)
+            if duplicate:
+                report_duplicate(slug, name, duplicate)
+        
+        print(f"✅ Compliant resources: {compliant}")
+        print(f"⚠️ Non-compliant resources: {non_compliant}")
+        print(f"❌ Duplicate slugs: {index.duplicate_count}")
+        print(f"📊 Total unique slugs: {index.unique_slugs()}")
+        print(f"📊 Total resources: {index.total}")
+        
+        if not non_compliant and not index.duplicate_count:
+            print("\n🎉 PERFECT COMPLIANCE! All resources follow CAF standards.")
+            return True
+        
+        return False
+        
+    except Exception as e:
+        print(f"❌ Validation error: {e}")
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate resource slugs against the official CAF abbreviations')
+    parser.add_argument('--file', default=RESOURCE_DEFINITION_FILE, help='resource definition file to validate')
+    parser.add_argument('--no-cache', action='store_true', help='recompute the report instead of reusing a cached one')
+    parser.add_argument('--since', metavar='REV', help='only validate resources added or changed since a git revision')
+    parser.add_argument('--stream', action='store_true',
+                        help='parse one resource at a time with constant memory and print findings as they are found')
+    args = parser.parse_args()
+    if args.since:
+        return 0 if validate_since(args.since, args.file) else 1
+    if args.stream:
+        return 0 if validate_streaming(args.file) else 1
+    # The report depends on the definitions file, this script and its CAF mapping
+    return run_cached('validate_caf_compliance', rules_version(OFFICIAL_CAF_MAPPING), __file__,
+                      lambda: 0 if validate_compliance(args.file) else 1,
+                      definitions_path=args.file, use_cache=not args.no_cache)
+
 if __name__ == "__main__":
-    success = validate_compliance()
-    sys.exit(0 if success else 1)
+    sys.exit(main())
@@ -792,6 +792,13 @@ EOF
         echo '```' >> "$report_file"
     fi
 
+    if [ -f "$SCRIPT_DIR/automation/resource_families.py" ]; then
+        echo "### Slug Family Consistency" >> "$report_file"
+        echo '```' >> "$report_file"
+        python3 "$SCRIPT_DIR/automation/resource_families.py" --file "$RESDEF" >> "$report_file" 2>&1 || true
+        echo '```' >> "$report_file"
+    fi
+
     cat >> "$report_file" << EOF
 
 ## 📋 Missing Resources